@@ -189,6 +189,7 @@ export interface ChunkSearchSettings {
   indexMeasure?: IndexMeasure;
   probes?: number;
   efSearch?: number;
+  oversamplingFactor?: number;
   enabled?: boolean;
 }
 
@@ -213,6 +214,7 @@ export interface HybridSearchSettings {
   semanticWeight?: number;
   fullTextLimit?: number;
   rrfK?: number;
+  fusionMode?: "parallel" | "sql";
 }
 
 export interface GraphSearchSettings {
@@ -238,6 +240,7 @@ export interface SearchSettings {
   hybridSettings?: HybridSearchSettings;
   chunkSettings?: ChunkSearchSettings;
   graphSettings?: GraphSearchSettings;
+  subQueryConcurrency?: number;
 }
 
 export interface VectorSearchResult {
@@ -276,6 +279,8 @@ export interface ServerStats {
   uptimeSeconds: number;
   cpuUsage: number;
   memoryUsage: number;
+  databasePools?: Record<string, Record<string, number>>;
+  cryptoHashing?: Record<string, number>;
 }
 
 export interface SettingsResponse {
@@ -433,6 +438,9 @@ export type WrappedRelationshipsResponse = PaginatedResultsWrapper<
 // Retrieval Responses
 export type WrappedVectorSearchResponse = ResultsWrapper<VectorSearchResult[]>;
 export type WrappedSearchResponse = ResultsWrapper<CombinedSearchResponse>;
+export type WrappedSearchManyResponse = ResultsWrapper<
+  CombinedSearchResponse[]
+>;
 
 // System Responses
 export type WrappedSettingsResponse = ResultsWrapper<SettingsResponse>;
@@ -4,6 +4,7 @@ import {
   GenerationConfig,
   Message,
   SearchSettings,
+  WrappedSearchManyResponse,
   WrappedSearchResponse,
 } from "../../types";
 import { ensureSnakeCase } from "../../utils";
@@ -61,6 +62,39 @@ export class RetrievalClient {
     });
   }
 
+  /**
+   * Perform several independent search queries in a single request.
+   *
+   * Each query behaves as it would through `search`, but all queries are
+   * embedded together and searched concurrently on the server. Results are
+   * returned in the same order as `queries`.
+   * @param queries Search queries to run
+   * @param searchMode Pre-configured search mode applied to every query
+   * @param searchSettings Optional settings, one entry per query
+   * @returns
+   */
+  async searchMany(options: {
+    queries: string[];
+    searchMode?: "advanced" | "basic" | "custom";
+    searchSettings?: (SearchSettings | Record<string, any> | null)[];
+  }): Promise<WrappedSearchManyResponse> {
+    const data = {
+      queries: options.queries,
+      ...(options.searchSettings && {
+        search_settings: options.searchSettings.map((settings) =>
+          settings ? ensureSnakeCase(settings) : null,
+        ),
+      }),
+      ...(options.searchMode && {
+        search_mode: options.searchMode,
+      }),
+    };
+
+    return await this.client.makeRequest("POST", "retrieval/search_many", {
+      data: data,
+    });
+  }
+
   /**
    * Execute a RAG (Retrieval-Augmented Generation) query.
    *
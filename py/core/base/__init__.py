@@ -81,12 +81,18 @@ __all__ = [
     ## PARSERS
     # Base parser
     "AsyncParser",
+    "ParserExecutionEngine",
+    "iter_csv_rows",
+    "iter_file_chunks",
+    "iter_lines",
+    "iter_text",
     ## PROVIDERS
     # Base provider classes
     "AppConfig",
     "Provider",
     "ProviderConfig",
     # Auth provider
+    "ApiKeyCacheSettings",
     "AuthConfig",
     "AuthProvider",
     # Crypto provider
@@ -97,24 +103,37 @@ __all__ = [
     "EmailProvider",
     # Database providers
     "LimitSettings",
+    "RateLimiterSettings",
+    "TokenBlacklistCacheSettings",
+    "BulkLoadSettings",
+    "UserCacheSettings",
     "DatabaseConfig",
     "DatabaseProvider",
     "Handler",
     "PostgresConfigurationSettings",
+    "QuantizedSearchSettings",
     # Embedding provider
+    "EmbeddingCacheBackend",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
     "EmbeddingProvider",
+    "RerankSettings",
     # Ingestion provider
     "IngestionMode",
     "IngestionConfig",
     "IngestionProvider",
     "ChunkingStrategy",
+    "IngestionPipelineSettings",
+    "ParserExecutionSettings",
+    "VLMParsingSettings",
     # LLM provider
     "CompletionConfig",
     "CompletionProvider",
     ## UTILS
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
+    "TokenBudgetTextSplitter",
+    "get_token_encoding",
     "format_search_results_for_llm",
     "validate_uuid",
     # ID generation
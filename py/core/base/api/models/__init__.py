@@ -79,6 +79,7 @@ from shared.api.models.retrieval.responses import (
     MessageData,
     MessageDelta,
     MessageEvent,
+    QuantizedSearchEvaluation,
     RAGEvent,
     RAGResponse,
     SearchResultsData,
@@ -96,7 +97,9 @@ from shared.api.models.retrieval.responses import (
     WrappedDocumentSearchResponse,
     WrappedEmbeddingResponse,
     WrappedLLMChatCompletion,
+    WrappedQuantizedSearchEvaluationResponse,
     WrappedRAGResponse,
+    WrappedSearchManyResponse,
     WrappedSearchResponse,
     WrappedVectorSearchResponse,
 )
@@ -199,10 +202,13 @@ __all__ = [
     "AgentResponse",
     "WrappedDocumentSearchResponse",
     "WrappedSearchResponse",
+    "WrappedSearchManyResponse",
     "WrappedVectorSearchResponse",
     "WrappedCompletionResponse",
     "WrappedRAGResponse",
     "WrappedAgentResponse",
     "WrappedLLMChatCompletion",
     "WrappedEmbeddingResponse",
+    "QuantizedSearchEvaluation",
+    "WrappedQuantizedSearchEvaluationResponse",
 ]
@@ -1,5 +1,17 @@
 from .base_parser import AsyncParser
+from .execution import ParserExecutionEngine
+from .streaming import (
+    iter_csv_rows,
+    iter_file_chunks,
+    iter_lines,
+    iter_text,
+)
 
 __all__ = [
     "AsyncParser",
+    "ParserExecutionEngine",
+    "iter_csv_rows",
+    "iter_file_chunks",
+    "iter_lines",
+    "iter_text",
 ]
@@ -1,12 +1,38 @@
 """Abstract base class for parsers."""
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Generic, TypeVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    Optional,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
 
 class AsyncParser(ABC, Generic[T]):
+    # Parsers that set this also accept the file as an async iterable of
+    # byte chunks, see `core.base.parsers.streaming`
+    supports_streaming: ClassVar[bool] = False
+    # CPU-bound parsers implement this as a static method returning the text
+    # segments of the file, so it can run in a worker process through
+    # `core.base.parsers.execution.ParserExecutionEngine`
+    extract: ClassVar[Optional[Callable[..., Iterable[str]]]] = None
+    # Paged formats also implement this, and accept `start` and `end` page
+    # indexes in `extract`, so large files can be split across workers
+    count_pages: ClassVar[Optional[Callable[..., int]]] = None
+
+    def extract_options(self, **overrides: Any) -> dict[str, Any]:
+        """Keyword arguments for `extract` and `count_pages` for a document
+        ingested with the ingestion config `overrides`. They are sent to the
+        worker processes and must be picklable."""
+        return {}
+
     @abstractmethod
     async def ingest(self, data: T, **kwargs) -> AsyncGenerator[str, None]:
         pass
@@ -0,0 +1,433 @@
+"""Runs CPU-bound parsers in a pool of worker processes.
+
+Parsers that implement `AsyncParser.extract` do their work in a plain
+function, which the engine runs in a worker process. Segments are
+sent back through a bounded queue as soon as the worker produces them, so
+pages of a large PDF can be chunked and embedded while the rest of the
+document is still being parsed, and the event loop keeps serving requests
+in the meantime. Large documents of paged formats are split into page
+ranges that several workers extract in parallel, reading the document
+from a temporary file rather than each being sent a copy of it.
+
+Timeouts bound the time spent extracting. Time a worker spends waiting
+for a slow consumer, e.g. one embedding every chunk before asking for the
+next segment, does not count, but a consumer that takes no segment for a
+whole timeout fails the extraction. A worker whose task timed out, was
+abandoned by its consumer or crashed is killed and replaced, so a page
+that hangs a native parsing library cannot hold on to a process.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
+
+from ..providers.ingestion import ParserExecutionSettings
+from .base_parser import AsyncParser
+
+logger = logging.getLogger()
+
+# How long either side waits on the segment queue before checking whether
+# the other side has finished, been cancelled or run out of time
+POLL_INTERVAL = 0.1
+
+
+def _run_extractor(
+    extract: Callable[..., Iterable[Any]],
+    data: bytes,
+    options: dict[str, Any],
+    segments: queue.Queue,
+    started,
+    cancelled,
+    timeout: float,
+) -> int:
+    """Runs in a worker process and puts each extracted segment on
+    `segments` as soon as it is produced.
+
+    Stops early once the consumer has gone away, and raises
+    `TimeoutError` once extraction has taken longer than `timeout`,
+    checking between segments, or once the consumer has not taken a
+    segment for `timeout` seconds. The engine kills the worker when
+    extraction hangs within a segment.
+    """
+    deadline = time.monotonic() + timeout
+    started.set()
+    count = 0
+    for segment in extract(data, **options):
+        if segment is None:
+            continue
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Parsing timed out after {timeout} seconds")
+        waiting_since = time.monotonic()
+        while True:
+            if cancelled.is_set():
+                return count
+            try:
+                segments.put(segment, timeout=POLL_INTERVAL)
+                break
+            except queue.Full:
+                if time.monotonic() - waiting_since > timeout:
+                    raise TimeoutError(
+                        f"Parsed segments were not consumed for {timeout} "
+                        "seconds"
+                    ) from None
+        deadline += time.monotonic() - waiting_since
+        count += 1
+    return count
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _count_pages(
+    count_pages: Callable[..., Optional[int]],
+    path: str,
+    options: dict[str, Any],
+) -> Optional[int]:
+    """Runs in a worker process and counts the pages of the document
+    stored at `path`."""
+    return count_pages(_read(path), **options)
+
+
+def _extract_range(
+    extract: Callable[..., Iterable[Any]],
+    path: str,
+    options: dict[str, Any],
+    start: int,
+    end: int,
+) -> list[str]:
+    """Runs in a worker process and extracts pages `start` to `end` of
+    the document stored at `path`."""
+    return [
+        segment
+        for segment in extract(_read(path), start=start, end=end, **options)
+        if segment is not None
+    ]
+
+
+def _write_temporary(data: bytes) -> str:
+    fd, path = tempfile.mkstemp(prefix="r2r-parse-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
+
+class _Worker:
+    """A single worker process, which can be killed without affecting the
+    tasks of other workers."""
+
+    def __init__(self, context):
+        self._executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+        self._future: Optional[asyncio.Future] = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+        self._future = asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+        return self._future
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the last task finished, without killing the process."""
+        future = self._future
+        return future is None or (
+            future.done()
+            and not future.cancelled()
+            and not isinstance(future.exception(), BrokenProcessPool)
+        )
+
+    def kill(self) -> None:
+        if self._future is not None:
+            # Its result no longer matters, nor does the error killing the
+            # process sets on it
+            self._future.cancel()
+        # ProcessPoolExecutor has no public handle on its processes
+        processes = list((self._executor._processes or {}).values())
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.kill()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ParserExecutionEngine:
+    """Runs parser extraction in worker processes with per document type
+    concurrency limits and timeouts.
+
+    Up to `max_workers` processes are started as they are needed, with the
+    `spawn` start method so workers do not inherit the state of the
+    running event loop. Each task checks out a worker of its own, which is
+    returned once the task has finished and killed otherwise.
+    """
+
+    def __init__(self, settings: ParserExecutionSettings):
+        self.settings = settings
+        self._context = multiprocessing.get_context("spawn")
+        self._manager = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def max_workers(self) -> int:
+        return self.settings.max_workers or os.cpu_count() or 1
+
+    def can_run(self, parser: AsyncParser) -> bool:
+        return self.settings.enabled and parser.extract is not None
+
+    def _start(self) -> None:
+        if self._manager is None:
+            self._manager = self._context.Manager()
+            logger.info(
+                f"Started parser workers, up to {self.max_workers} processes"
+            )
+
+    @asynccontextmanager
+    async def _worker(self) -> AsyncIterator[_Worker]:
+        """Checks out a worker, killing it on the way back unless its task
+        finished."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        async with self._slots:
+            worker = self._idle.pop() if self._idle else _Worker(self._context)
+            self._busy.add(worker)
+            try:
+                yield worker
+            finally:
+                self._busy.discard(worker)
+                if worker.reusable:
+                    self._idle.append(worker)
+                else:
+                    worker.kill()
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        async with self._worker() as worker:
+            return await worker.submit(fn, *args)
+
+    def _semaphore(self, document_type: str) -> asyncio.Semaphore:
+        if document_type not in self._semaphores:
+            self._semaphores[document_type] = asyncio.Semaphore(
+                self.settings.max_concurrency.get(
+                    document_type, self.max_workers
+                )
+            )
+        return self._semaphores[document_type]
+
+    def _timeout(self, document_type: str) -> float:
+        return self.settings.timeouts.get(
+            document_type, self.settings.timeout_seconds
+        )
+
+    async def run(
+        self,
+        parser: AsyncParser,
+        data: bytes,
+        document_type: str,
+        ingestion_config_override: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Extracts the text segments of a document in worker processes,
+        yielding them as they are produced.
+
+        Raises `TimeoutError` when the document takes longer than the
+        timeout for its type, and re-raises any error from the parser.
+        """
+        options = parser.extract_options(**(ingestion_config_override or {}))
+        timeout = self._timeout(document_type)
+        async with self._semaphore(document_type):
+            self._start()
+            path = None
+            try:
+                pages = None
+                if (
+                    parser.count_pages is not None
+                    and self.settings.parallel_min_pages is not None
+                ):
+                    # Workers counting and extracting pages all read the
+                    # document from one file
+                    path = await asyncio.to_thread(_write_temporary, data)
+                    pages = await self._within(
+                        timeout,
+                        self._call(
+                            _count_pages, parser.count_pages, path, options
+                        ),
+                    )
+                if pages is not None and (
+                    pages >= self.settings.parallel_min_pages
+                ):
+                    segments = self._extract_pages(
+                        parser, path, options, pages, timeout
+                    )
+                else:
+                    segments = self._extract(
+                        parser.extract,
+                        data,
+                        options,
+                        timeout,
+                        self.settings.max_buffered_segments,
+                    )
+                async for segment in segments:
+                    yield segment
+            finally:
+                if path is not None:
+                    os.unlink(path)
+
+    async def stream(
+        self,
+        extract: Callable[..., Iterable[Any]],
+        data: bytes,
+        document_type: str,
+        options: Optional[dict[str, Any]] = None,
+        max_buffered: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """Runs `extract(data, **options)` in a worker process, yielding
+        what it produces as soon as it is produced.
+
+        `extract` must be picklable, e.g. a module level function or a
+        static method, and at most `max_buffered` of its results are held
+        before the worker waits for them to be consumed. Concurrency and
+        timeouts are those of `document_type`.
+        """
+        timeout = self._timeout(document_type)
+        async with self._semaphore(document_type):
+            self._start()
+            async for segment in self._extract(
+                extract,
+                data,
+                options or {},
+                timeout,
+                max_buffered or self.settings.max_buffered_segments,
+            ):
+                yield segment
+
+    @staticmethod
+    async def _within(timeout: float, awaitable) -> Any:
+        try:
+            return await asyncio.wait_for(awaitable, max(timeout, 0))
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Parsing timed out after {timeout} seconds"
+            ) from None
+
+    async def _extract(
+        self,
+        extract: Callable[..., Iterable[Any]],
+        data: bytes,
+        options: dict[str, Any],
+        timeout: float,
+        max_buffered: int,
+    ) -> AsyncIterator[Any]:
+        segments = self._manager.Queue(maxsize=max_buffered)
+        started = self._manager.Event()
+        cancelled = self._manager.Event()
+        async with self._worker() as worker:
+            future = worker.submit(
+                _run_extractor,
+                extract,
+                data,
+                options,
+                segments,
+                started,
+                cancelled,
+                timeout,
+            )
+            # Only time spent waiting on a started worker counts towards
+            # the timeout, not waiting for our own consumer
+            waited = 0.0
+            try:
+                while True:
+                    waiting_since = time.monotonic()
+                    try:
+                        segment = await asyncio.to_thread(
+                            segments.get, True, POLL_INTERVAL
+                        )
+                    except queue.Empty:
+                        if future.done():
+                            break
+                        if started.is_set():
+                            waited += time.monotonic() - waiting_since
+                            if waited > timeout:
+                                raise TimeoutError(
+                                    f"Parsing timed out after {timeout} "
+                                    "seconds"
+                                ) from None
+                        continue
+                    waited += time.monotonic() - waiting_since
+                    yield segment
+
+                # The worker has returned, so whatever it produced is
+                # already on the queue
+                while True:
+                    try:
+                        segment = segments.get_nowait()
+                    except queue.Empty:
+                        break
+                    yield segment
+                await future
+            finally:
+                cancelled.set()
+                if not future.done():
+                    # A worker between segments notices within a poll
+                    # interval and can be reused; one stuck inside the
+                    # parser is killed
+                    await asyncio.wait({future}, timeout=2 * POLL_INTERVAL)
+
+    async def _extract_pages(
+        self,
+        parser: AsyncParser,
+        path: str,
+        options: dict[str, Any],
+        pages: int,
+        timeout: float,
+    ) -> AsyncIterator[str]:
+        """Extracts ranges of pages of the document stored at `path` in
+        parallel, yielding each range in order as soon as it and the
+        ranges before it are done."""
+        step = self.settings.pages_per_task
+        tasks = [
+            asyncio.ensure_future(
+                self._call(
+                    _extract_range,
+                    parser.extract,
+                    path,
+                    options,
+                    start,
+                    min(start + step, pages),
+                )
+            )
+            for start in range(0, pages, step)
+        ]
+        waited = 0.0
+        try:
+            for task in tasks:
+                waiting_since = time.monotonic()
+                segments = await self._within(timeout - waited, task)
+                waited += time.monotonic() - waiting_since
+                for segment in segments:
+                    yield segment
+        finally:
+            # Cancelling a range kills its worker if it has started
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self) -> None:
+        for worker in self._idle:
+            worker.shutdown()
+        for worker in self._busy:
+            worker.kill()
+        self._idle = []
+        self._busy = set()
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
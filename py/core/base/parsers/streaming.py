@@ -0,0 +1,76 @@
+"""Helpers for parsers that consume a file as a stream of byte chunks.
+
+Parsers that set `supports_streaming` receive an async iterable of byte
+chunks instead of the whole file, and use these helpers to turn it into
+text, lines or CSV rows without holding the full document in memory.
+"""
+
+import codecs
+import csv
+from typing import IO, AsyncIterable, AsyncIterator
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+async def iter_file_chunks(
+    file: IO[bytes], chunk_size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yields the remaining content of a binary file in chunks."""
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+async def iter_text(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8",
+    errors: str = "strict",
+) -> AsyncIterator[str]:
+    """Decodes a stream of byte chunks, handling multi-byte characters
+    that are split across chunk boundaries."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    async for chunk in chunks:
+        if text := decoder.decode(chunk):
+            yield text
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes], encoding: str = "utf-8"
+) -> AsyncIterator[str]:
+    """Yields lines, including their trailing newline, split on "\\n" only
+    like iterating over a `StringIO`."""
+    pending = ""
+    async for text in iter_text(chunks, encoding):
+        pending += text
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
+async def iter_csv_rows(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8",
+    **fmtparams,
+) -> AsyncIterator[list[str]]:
+    """Yields CSV rows from a stream of byte chunks.
+
+    Lines are buffered until the quote characters seen so far are
+    balanced, so quoted fields that span several lines are passed to the
+    CSV reader as a whole, exactly as with a fully loaded file.
+    """
+    quotechar = fmtparams.get("quotechar", '"')
+    record: list[str] = []
+    quotes = 0
+    async for line in iter_lines(chunks, encoding):
+        record.append(line)
+        quotes += line.count(quotechar)
+        if quotes % 2 == 0:
+            for row in csv.reader(record, **fmtparams):
+                yield row
+            record, quotes = [], 0
+    if record:
+        for row in csv.reader(record, **fmtparams):
+            yield row
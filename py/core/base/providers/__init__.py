@@ -1,27 +1,42 @@
-from .auth import AuthConfig, AuthProvider
+from .auth import ApiKeyCacheSettings, AuthConfig, AuthProvider
 from .base import AppConfig, Provider, ProviderConfig
 from .crypto import CryptoConfig, CryptoProvider
 from .database import (
+    BulkLoadSettings,
     DatabaseConfig,
     DatabaseConnectionManager,
     DatabaseProvider,
     Handler,
     LimitSettings,
     PostgresConfigurationSettings,
+    QuantizedSearchSettings,
+    RateLimiterSettings,
+    TokenBlacklistCacheSettings,
+    UserCacheSettings,
 )
 from .email import EmailConfig, EmailProvider
-from .embedding import EmbeddingConfig, EmbeddingProvider
+from .embedding import (
+    EmbeddingCacheBackend,
+    EmbeddingCacheSettings,
+    EmbeddingConfig,
+    EmbeddingProvider,
+    RerankSettings,
+)
 from .ingestion import (
     ChunkingStrategy,
     IngestionConfig,
     IngestionMode,
+    IngestionPipelineSettings,
     IngestionProvider,
+    ParserExecutionSettings,
+    VLMParsingSettings,
 )
 from .llm import CompletionConfig, CompletionProvider
 from .orchestration import OrchestrationConfig, OrchestrationProvider, Workflow
 
 __all__ = [
     # Auth provider
+    "ApiKeyCacheSettings",
     "AuthConfig",
     "AuthProvider",
     # Base provider classes
@@ -33,6 +48,9 @@ __all__ = [
     "IngestionConfig",
     "IngestionProvider",
     "ChunkingStrategy",
+    "IngestionPipelineSettings",
+    "ParserExecutionSettings",
+    "VLMParsingSettings",
     # Crypto provider
     "CryptoConfig",
     "CryptoProvider",
@@ -43,12 +61,20 @@ __all__ = [
     "DatabaseConnectionManager",
     "DatabaseConfig",
     "LimitSettings",
+    "RateLimiterSettings",
+    "TokenBlacklistCacheSettings",
+    "BulkLoadSettings",
+    "UserCacheSettings",
     "PostgresConfigurationSettings",
+    "QuantizedSearchSettings",
     "DatabaseProvider",
     "Handler",
     # Embedding provider
+    "EmbeddingCacheBackend",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
     "EmbeddingProvider",
+    "RerankSettings",
     # LLM provider
     "CompletionConfig",
     "CompletionProvider",
@@ -1,7 +1,15 @@
+import asyncio
+import hashlib
+import hmac
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
 from fastapi import Security
 from fastapi.security import (
@@ -9,6 +17,7 @@ from fastapi.security import (
     HTTPAuthorizationCredentials,
     HTTPBearer,
 )
+from pydantic import BaseModel, Field
 
 from ..abstractions import R2RException, Token, TokenData
 from ..api.models import User
@@ -24,6 +33,89 @@ if TYPE_CHECKING:
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+class ApiKeyCacheSettings(BaseModel):
+    """In-process cache of API keys that have passed hash verification."""
+
+    enabled: bool = True
+    max_entries: int = Field(default=10000, ge=0)
+    ttl_seconds: float = Field(default=300.0, gt=0)
+
+
+class VerifiedApiKeyCache:
+    """Bounded LRU cache with per-entry TTL of verified API keys.
+
+    Entries are keyed by an HMAC-SHA256 of the full `key_id.raw_key`
+    string under a per-process random secret, so neither the raw key nor
+    anything usable offline to recover it is kept in memory. Each entry
+    holds the row id of the key whose hash the raw key matched. An entry
+    only saves the hash check: the row is still looked up on every
+    request, so a key deleted through another worker stops working at
+    once.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._secret = os.urandom(32)
+        # digest -> (expires_at, key row id)
+        self._entries: OrderedDict[bytes, tuple[float, UUID]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, api_key: str) -> bytes:
+        return hmac.new(
+            self._secret, api_key.encode("utf-8"), hashlib.sha256
+        ).digest()
+
+    def get(self, api_key: str) -> Optional[UUID]:
+        """Returns the row id of the key `api_key` was recently verified
+        against."""
+        digest = self._digest(api_key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, api_key: str, key_id: UUID) -> None:
+        if self.max_entries == 0:
+            return
+        digest = self._digest(api_key)
+        with self._lock:
+            self._entries[digest] = (
+                time.monotonic() + self.ttl_seconds,
+                UUID(str(key_id)),
+            )
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key_id: UUID) -> None:
+        """Drops every entry for the API key with row id `key_id`."""
+        key_id = UUID(str(key_id))
+        with self._lock:
+            for digest in [
+                digest
+                for digest, entry in self._entries.items()
+                if entry[1] == key_id
+            ]:
+                del self._entries[digest]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class AuthConfig(ProviderConfig):
     secret_key: Optional[str] = None
     require_authentication: bool = False
@@ -32,6 +124,9 @@ class AuthConfig(ProviderConfig):
     default_admin_password: str = "change_me_immediately"
     access_token_lifetime_in_minutes: Optional[int] = None
     refresh_token_lifetime_in_days: Optional[int] = None
+    api_key_cache_settings: ApiKeyCacheSettings = Field(
+        default_factory=ApiKeyCacheSettings
+    )
 
     @property
     def supported_providers(self) -> list[str]:
@@ -68,6 +163,66 @@ class AuthProvider(Provider, ABC):
         self.config: AuthConfig = config
         self.database_provider: "PostgresDatabaseProvider" = database_provider
 
+        cache_settings = config.api_key_cache_settings
+        self.api_key_cache: Optional[VerifiedApiKeyCache] = (
+            VerifiedApiKeyCache(
+                max_entries=cache_settings.max_entries,
+                ttl_seconds=cache_settings.ttl_seconds,
+            )
+            if cache_settings.enabled
+            else None
+        )
+        self._api_key_verifications: dict[str, asyncio.Future] = {}
+
+    async def _verify_api_key(self, api_key: str) -> Optional[UUID]:
+        """Verifies an API key of the form "key_id.raw_key".
+
+        Returns the id of the owning user, or None if the key is unknown or
+        does not match. Successful verifications are cached so the hash is
+        only checked once per key per TTL, and concurrent requests with the
+        same key share a single check.
+        """
+        if "." not in api_key:
+            return None
+
+        verification = self._api_key_verifications.get(api_key)
+        if verification is None:
+            verification = asyncio.ensure_future(self._check_api_key(api_key))
+            self._api_key_verifications[api_key] = verification
+            verification.add_done_callback(
+                lambda _: self._api_key_verifications.pop(api_key, None)
+            )
+        return await asyncio.shield(verification)
+
+    async def _check_api_key(self, api_key: str) -> Optional[UUID]:
+        key_id, raw_api_key = api_key.split(".", 1)
+        key_record = (
+            await self.database_provider.users_handler.get_api_key_record(
+                key_id
+            )
+        )
+        if key_record is None:
+            return None
+        # The row is looked up even for cached keys so that deleting a key
+        # through any worker revokes it everywhere
+        if (
+            self.api_key_cache is not None
+            and self.api_key_cache.get(api_key) == key_record["id"]
+        ):
+            return key_record["user_id"]
+        if not await self.crypto_provider.async_verify_api_key(
+            raw_api_key, key_record["hashed_key"]
+        ):
+            return None
+
+        if self.api_key_cache is not None:
+            self.api_key_cache.put(api_key, key_record["id"])
+        return key_record["user_id"]
+
+    def invalidate_api_key(self, key_id: UUID) -> None:
+        if self.api_key_cache is not None:
+            self.api_key_cache.invalidate(key_id)
+
     async def _get_default_admin_user(self) -> User:
         return await self.database_provider.users_handler.get_user_by_email(
             self.admin_email
@@ -165,38 +320,23 @@ class AuthProvider(Provider, ABC):
 
                 # 2. If JWT failed, try API key from Bearer token
                 # Expected format: key_id.raw_api_key
-                if "." in credentials:
-                    key_id, raw_api_key = credentials.split(".", 1)
-                    api_key_record = await self.database_provider.users_handler.get_api_key_record(
-                        key_id
+                user_id = await self._verify_api_key(credentials)
+                if user_id is not None:
+                    user = await self.database_provider.users_handler.get_user_by_id(
+                        user_id
                     )
-                    if api_key_record is not None:
-                        hashed_key = api_key_record["hashed_key"]
-                        if self.crypto_provider.verify_api_key(
-                            raw_api_key, hashed_key
-                        ):
-                            user = await self.database_provider.users_handler.get_user_by_id(
-                                api_key_record["user_id"]
-                            )
-                            if user is not None and user.is_active:
-                                return user
+                    if user is not None and user.is_active:
+                        return user
 
             # 3. If no Bearer token worked, try the X-API-Key header
-            if api_key is not None and "." in api_key:
-                key_id, raw_api_key = api_key.split(".", 1)
-                api_key_record = await self.database_provider.users_handler.get_api_key_record(
-                    key_id
-                )
-                if api_key_record is not None:
-                    hashed_key = api_key_record["hashed_key"]
-                    if self.crypto_provider.verify_api_key(
-                        raw_api_key, hashed_key
-                    ):
-                        user = await self.database_provider.users_handler.get_user_by_id(
-                            api_key_record["user_id"]
-                        )
-                        if user is not None and user.is_active:
-                            return user
+            if api_key is not None:
+                user_id = await self._verify_api_key(api_key)
+                if user_id is not None:
+                    user = await self.database_provider.users_handler.get_user_by_id(
+                        user_id
+                    )
+                    if user is not None and user.is_active:
+                        return user
 
             # If we reach here, both JWT and API key auth failed
             raise R2RException(
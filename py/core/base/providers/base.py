@@ -133,3 +133,7 @@ class Provider(ABC):
         if config:
             config.validate_config()
         self.config = config
+
+    async def close(self) -> None:
+        """Releases pools, sessions and workers held by the provider."""
+        return None
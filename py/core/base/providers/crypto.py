@@ -1,12 +1,99 @@
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
+
+from pydantic import Field
 
 from .base import Provider, ProviderConfig
 
 
+class HashingExecutor:
+    """Bounded thread pool for CPU-heavy password and API key hashing.
+
+    Keeps slow KDF calls off the event loop without letting a burst of
+    logins take over every worker thread, and records how deep the queue
+    of pending hashes gets.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.queued = 0
+        self.running = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="r2r-crypto",
+                )
+            return self._executor
+
+    def _on_done(self, future: Future) -> None:
+        # A job cancelled while still queued never runs `call`
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+        def call() -> Any:
+            wait = time.perf_counter() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.queue_wait_total += wait
+                self.queue_wait_max = max(self.queue_wait_max, wait)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        future = self._get_executor().submit(call)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            started = self.completed + self.running
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queue_depth,
+                "running": self.running,
+                "completed": self.completed,
+                "queue_wait_avg_ms": (
+                    self.queue_wait_total / started * 1000 if started else 0.0
+                ),
+                "queue_wait_max_ms": self.queue_wait_max * 1000,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
 class CryptoConfig(ProviderConfig):
     provider: Optional[str] = None
+    # Threads used for password and API key hashing
+    hashing_max_workers: int = Field(default=4, ge=1)
 
     @property
     def supported_providers(self) -> list[str]:
@@ -24,6 +111,32 @@ class CryptoProvider(Provider, ABC):
                 "CryptoProvider must be initialized with a CryptoConfig"
             )
         super().__init__(config)
+        self.hashing_executor = HashingExecutor(config.hashing_max_workers)
+
+    async def async_get_password_hash(self, password: str) -> str:
+        return await self.hashing_executor.run(
+            self.get_password_hash, password
+        )
+
+    async def async_verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await self.hashing_executor.run(
+            self.verify_password, plain_password, hashed_password
+        )
+
+    async def async_hash_api_key(self, raw_api_key: str) -> str:
+        return await self.hashing_executor.run(self.hash_api_key, raw_api_key)
+
+    async def async_verify_api_key(
+        self, raw_api_key: str, hashed_key: str
+    ) -> bool:
+        return await self.hashing_executor.run(
+            self.verify_api_key, raw_api_key, hashed_key
+        )
+
+    def hashing_metrics(self) -> dict[str, float]:
+        return self.hashing_executor.snapshot()
 
     @abstractmethod
     def get_password_hash(self, password: str) -> str:
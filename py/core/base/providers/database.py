@@ -2,10 +2,10 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Sequence, cast
+from typing import Any, AsyncGenerator, Optional, Sequence, cast
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from core.base.abstractions import (
     GraphCreationSettings,
@@ -37,6 +37,7 @@ class DatabaseConnectionManager(ABC):
         self,
         query: str,
         params: Optional[dict[str, Any] | Sequence[Any]] = None,
+        read_only: bool = False,
     ):
         pass
 
@@ -45,11 +46,22 @@ class DatabaseConnectionManager(ABC):
         self,
         query: str,
         params: Optional[dict[str, Any] | Sequence[Any]] = None,
+        read_only: bool = False,
     ):
         pass
 
     @abstractmethod
-    async def initialize(self, pool: Any):
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[dict[str, Any] | Sequence[Any]] = None,
+        prefetch: int = 500,
+        read_only: bool = False,
+    ) -> AsyncGenerator[Any, None]:
+        pass
+
+    @abstractmethod
+    async def initialize(self, pool: Any, read_pool: Optional[Any] = None):
         pass
 
 
@@ -114,6 +126,74 @@ class LimitSettings(BaseModel):
         )
 
 
+class RateLimiterSettings(BaseModel):
+    """Tuning for the rate limiter and request log writer."""
+
+    # Where per-minute counters live: "memory" keeps them per process,
+    # "postgres" shares them across workers through an unlogged table
+    counter_backend: str = "memory"
+    # Buffered request log rows are written at least this often
+    flush_interval_seconds: float = Field(default=1.0, gt=0)
+    # ...or as soon as this many rows are pending
+    flush_batch_size: int = Field(default=500, ge=1)
+    # Rows kept in memory while the database is unreachable
+    max_pending_logs: int = Field(default=100_000, ge=1)
+    # How often monthly usage is re-read from the request log
+    monthly_refresh_seconds: float = Field(default=60.0, gt=0)
+    # Rows older than this are pruned; None keeps the full history. Monthly
+    # limits count the rows of the current month, so at least a month of
+    # rows is kept.
+    request_log_retention_days: Optional[int] = Field(default=None, ge=31)
+
+
+class UserCacheSettings(BaseModel):
+    """Caching of user lookups. Users are always cached for the duration of
+    a request; `process_ttl_seconds > 0` also keeps them across requests."""
+
+    process_ttl_seconds: float = Field(default=0.0, ge=0)
+    max_entries: int = Field(default=10000, ge=0)
+
+
+class TokenBlacklistCacheSettings(BaseModel):
+    """In-memory negative cache for JWT blacklist lookups."""
+
+    enabled: bool = True
+    # New blacklist entries from other workers are picked up this often
+    refresh_interval_seconds: float = Field(default=5.0, gt=0)
+    # The bloom filter is rebuilt from scratch this often, dropping pruned
+    # tokens
+    rebuild_interval_seconds: float = Field(default=3600.0, gt=0)
+    false_positive_rate: float = Field(default=0.001, gt=0, lt=1)
+    min_capacity: int = Field(default=10000, ge=1)
+
+
+class BulkLoadSettings(BaseModel):
+    """COPY based bulk loading of chunks, used for large ingestion and
+    re-embedding batches."""
+
+    # Batches of at least this many entries are loaded with COPY into a
+    # staging table and merged with one statement instead of executemany
+    min_batch_size: int = Field(default=5000, ge=1)
+    # Loads of at least this many entries drop the HNSW/IVFFlat indexes on
+    # the chunks table and rebuild them afterwards; None never does
+    defer_index_min_rows: Optional[int] = Field(default=None, ge=1)
+
+
+class QuantizedSearchSettings(BaseModel):
+    """Settings for the two-stage search used with binary (INT1) quantized
+    vectors.
+
+    Candidates are first selected by hamming distance over the binary
+    column, optionally narrowed down with a halfvec rescoring pass, and then
+    re-ranked with the full precision vectors.
+    """
+
+    oversampling_factor: int = 20
+    collection_oversampling_factors: dict[UUID, int] = {}
+    halfvec_rescoring: bool = False
+    halfvec_oversampling_factor: int = 4
+
+
 class DatabaseConfig(ProviderConfig):
     """A base database configuration class."""
 
@@ -127,6 +207,8 @@ class DatabaseConfig(ProviderConfig):
     postgres_configuration_settings: Optional[
         PostgresConfigurationSettings
     ] = None
+    read_replica_dsn: Optional[str] = None
+    read_replica_max_connections: Optional[int] = None
     default_collection_name: str = "Default"
     default_collection_description: str = "Your default collection."
     collection_summary_system_prompt: str = "system"
@@ -142,12 +224,23 @@ class DatabaseConfig(ProviderConfig):
     graph_creation_settings: GraphCreationSettings = GraphCreationSettings()
     graph_search_settings: GraphSearchSettings = GraphSearchSettings()
 
+    # Binary quantized search settings
+    quantized_search_settings: QuantizedSearchSettings = (
+        QuantizedSearchSettings()
+    )
+
     # Rate limits
     limits: LimitSettings = LimitSettings(
         global_per_min=60, route_per_min=20, monthly_limit=10000
     )
     route_limits: dict[str, LimitSettings] = {}
     user_limits: dict[UUID, LimitSettings] = {}
+    rate_limiter_settings: RateLimiterSettings = RateLimiterSettings()
+    user_cache_settings: UserCacheSettings = UserCacheSettings()
+    token_blacklist_cache_settings: TokenBlacklistCacheSettings = (
+        TokenBlacklistCacheSettings()
+    )
+    bulk_load_settings: BulkLoadSettings = BulkLoadSettings()
 
     def validate_config(self) -> None:
         if self.provider not in self.supported_providers:
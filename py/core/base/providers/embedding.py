@@ -1,12 +1,17 @@
 import asyncio
+import hashlib
 import logging
 import random
+import threading
 import time
-from abc import abstractmethod
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
 from litellm import AuthenticationError
+from pydantic import BaseModel, Field
 
 from core.base.abstractions import VectorQuantizationSettings
 
@@ -20,6 +25,102 @@ from .base import Provider, ProviderConfig
 logger = logging.getLogger()
 
 
+class EmbeddingCacheSettings(BaseModel):
+    """In-process cache for repeated embedding requests."""
+
+    enabled: bool = True
+    max_entries: int = Field(default=2048, ge=0)
+    ttl_seconds: float = Field(default=3600.0, gt=0)
+    # Names of the `EmbeddingPurpose` values whose requests are cached.
+    # Indexing rarely repeats a text, so only queries are cached by default.
+    purposes: list[str] = ["query"]
+
+
+class RerankSettings(BaseModel):
+    """Tuning for the reranker backing `rerank_model`."""
+
+    max_batch_size: int = Field(default=32, ge=1)
+    batch_window_ms: float = Field(default=2.0, ge=0)
+    max_connections: int = Field(default=32, ge=1)
+    timeout: float = Field(default=30.0, gt=0)
+    cache_enabled: bool = True
+    cache_max_entries: int = Field(default=10000, ge=0)
+    cache_ttl_seconds: float = Field(default=600.0, gt=0)
+    device: str = "cpu"
+
+
+class EmbeddingCacheBackend(ABC):
+    """Optional shared store consulted after the in-process cache misses.
+
+    Values are raw float32 buffers so that backends such as Redis or
+    memcached can store them without any serialization of their own.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: dict[str, bytes], ttl: float) -> None:
+        pass
+
+
+class EmbeddingCache:
+    """Bounded LRU cache with per-entry TTL for embedding vectors."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, np.ndarray]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, embedding: Any) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self.max_entries == 0:
+            return vector
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
 class EmbeddingConfig(ProviderConfig):
     provider: str
     base_model: str
@@ -36,6 +137,8 @@ class EmbeddingConfig(ProviderConfig):
     quantization_settings: VectorQuantizationSettings = (
         VectorQuantizationSettings()
     )
+    cache_settings: EmbeddingCacheSettings = EmbeddingCacheSettings()
+    rerank_settings: RerankSettings = RerankSettings()
 
     ## deprecated
     rerank_dimension: Optional[int] = None
@@ -66,8 +169,143 @@ class EmbeddingProvider(Provider):
         self.config: EmbeddingConfig = config
         self.semaphore = asyncio.Semaphore(config.concurrent_request_limit)
         self.current_requests = 0
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        self.cache_backend: Optional[EmbeddingCacheBackend] = None
+        self.cached_purposes = {
+            EmbeddingPurpose[name.upper()]
+            for name in config.cache_settings.purposes
+        }
+        if config.cache_settings.enabled and self.cached_purposes:
+            self.embedding_cache = EmbeddingCache(
+                max_entries=config.cache_settings.max_entries,
+                ttl_seconds=config.cache_settings.ttl_seconds,
+            )
+
+    def set_cache_backend(
+        self, backend: Optional[EmbeddingCacheBackend]
+    ) -> None:
+        """Shares cached embeddings across workers through `backend`."""
+        self.cache_backend = backend
+
+    def cache_stats(self) -> dict[str, int]:
+        if self.embedding_cache is None:
+            return {}
+        return self.embedding_cache.stats()
+
+    def _cache_key(self, text: str, purpose: EmbeddingPurpose) -> str:
+        prefix = getattr(self, "prefixes", {}).get(purpose, "")
+        raw = "\x1f".join(
+            (
+                self.config.base_model,
+                str(self.config.base_dimension),
+                purpose.value,
+                prefix,
+                text,
+            )
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _is_cacheable(self, task: dict[str, Any]) -> bool:
+        # Extra kwargs can change the request sent upstream, so only plain
+        # base-stage requests for a list of texts go through the cache.
+        return (
+            self.embedding_cache is not None
+            and task.get("stage", self.Step.BASE) == self.Step.BASE
+            and task.get("purpose", EmbeddingPurpose.INDEX)
+            in self.cached_purposes
+            and isinstance(task.get("texts"), list)
+            and not task.get("kwargs")
+        )
+
+    def _lookup_cached(
+        self, task: dict[str, Any]
+    ) -> tuple[list[str], list[Optional[np.ndarray]]]:
+        purpose = task.get("purpose", EmbeddingPurpose.INDEX)
+        keys = [self._cache_key(text, purpose) for text in task["texts"]]
+        return keys, [self.embedding_cache.get(key) for key in keys]  # type: ignore
+
+    @staticmethod
+    def _check_embedding_count(embeddings: list[Any], expected: int) -> None:
+        if len(embeddings) != expected:
+            raise ValueError(
+                f"Expected {expected} embeddings, received {len(embeddings)}."
+            )
 
     async def _execute_with_backoff_async(self, task: dict[str, Any]):
+        if not self._is_cacheable(task):
+            return await self._execute_with_retries_async(task)
+
+        keys, cached = self._lookup_cached(task)
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+
+        if missing and self.cache_backend is not None:
+            try:
+                shared = await self.cache_backend.get_many(
+                    [keys[i] for i in missing]
+                )
+            except Exception as e:
+                logger.warning(f"Embedding cache backend lookup failed: {e}")
+                shared = [None] * len(missing)
+            for i, data in zip(missing, shared, strict=True):
+                if data is not None:
+                    cached[i] = self.embedding_cache.put(  # type: ignore
+                        keys[i], np.frombuffer(data, dtype=np.float32)
+                    )
+            missing = [i for i in missing if cached[i] is None]
+
+        if not missing:
+            return [vector.tolist() for vector in cached]  # type: ignore
+
+        texts = task["texts"]
+        embeddings = await self._execute_with_retries_async(
+            {**task, "texts": [texts[i] for i in missing]}
+        )
+        self._check_embedding_count(embeddings, len(missing))
+        results: list[Any] = [
+            vector.tolist() if vector is not None else None
+            for vector in cached
+        ]
+        fresh: dict[str, bytes] = {}
+        # Misses return the stored float32 vector too, so a text embeds to
+        # the same values whether or not it was cached.
+        for i, embedding in zip(missing, embeddings, strict=True):
+            vector = self.embedding_cache.put(keys[i], embedding)  # type: ignore
+            fresh[keys[i]] = vector.tobytes()
+            results[i] = vector.tolist()
+
+        if self.cache_backend is not None:
+            try:
+                await self.cache_backend.set_many(
+                    fresh, self.config.cache_settings.ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Embedding cache backend update failed: {e}")
+        return results
+
+    def _execute_with_backoff_sync(self, task: dict[str, Any]):
+        if not self._is_cacheable(task):
+            return self._execute_with_retries_sync(task)
+
+        keys, cached = self._lookup_cached(task)
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if not missing:
+            return [vector.tolist() for vector in cached]  # type: ignore
+
+        texts = task["texts"]
+        embeddings = self._execute_with_retries_sync(
+            {**task, "texts": [texts[i] for i in missing]}
+        )
+        self._check_embedding_count(embeddings, len(missing))
+        results: list[Any] = [
+            vector.tolist() if vector is not None else None
+            for vector in cached
+        ]
+        for i, embedding in zip(missing, embeddings, strict=True):
+            vector = self.embedding_cache.put(keys[i], embedding)  # type: ignore
+            results[i] = vector.tolist()
+        return results
+
+    async def _execute_with_retries_async(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
@@ -86,7 +324,7 @@ class EmbeddingProvider(Provider):
                 await asyncio.sleep(random.uniform(0, backoff))
                 backoff = min(backoff * 2, self.config.max_backoff)
 
-    def _execute_with_backoff_sync(self, task: dict[str, Any]):
+    def _execute_with_retries_sync(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
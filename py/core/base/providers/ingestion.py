@@ -3,7 +3,7 @@ from abc import ABC
 from enum import Enum
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from core.base.abstractions import ChunkEnrichmentSettings
 
@@ -21,6 +21,7 @@ class ChunkingStrategy(str, Enum):
     CHARACTER = "character"
     BASIC = "basic"
     BY_TITLE = "by_title"
+    TOKEN = "token"
 
 
 class IngestionMode(str, Enum):
@@ -29,6 +30,61 @@ class IngestionMode(str, Enum):
     custom = "custom"
 
 
+class ParserExecutionSettings(BaseModel):
+    """Settings for running CPU-bound parsers in worker processes, so that
+    parsing a large document does not block the event loop serving API
+    requests."""
+
+    enabled: bool = True
+    # Size of the worker process pool, defaults to the number of CPUs
+    max_workers: Optional[int] = Field(default=None, ge=1)
+    # Concurrent parses allowed per document type, e.g. {"pdf": 2}; types
+    # that are not listed may use every worker
+    max_concurrency: dict[str, int] = {}
+    timeout_seconds: float = Field(default=600, gt=0)
+    # Per document type overrides of `timeout_seconds`
+    timeouts: dict[str, float] = {}
+    # Parsed segments buffered per document before the worker waits for
+    # them to be consumed
+    max_buffered_segments: int = Field(default=64, ge=1)
+    # Documents with at least this many pages are split into ranges of
+    # `pages_per_task` pages extracted by several workers in parallel;
+    # None always uses a single worker
+    parallel_min_pages: Optional[int] = Field(default=128, ge=1)
+    pages_per_task: int = Field(default=32, ge=1)
+
+
+class IngestionPipelineSettings(BaseModel):
+    """Bounds on the work each ingested document keeps in flight between
+    parsing, embedding and storing its chunks."""
+
+    # Concurrent embedding requests per document
+    embed_workers: int = Field(default=4, ge=1)
+    # Chunk batches buffered between two stages of the pipeline
+    queue_depth: int = Field(default=4, ge=1)
+
+
+class VLMParsingSettings(BaseModel):
+    """Settings for parsing PDFs page by page with a vision model.
+
+    Pages are rendered in a thread while earlier pages are with
+    the model, and at most `max_concurrent_requests +
+    max_buffered_pages` rendered pages are held at a time.
+    """
+
+    max_concurrent_requests: int = Field(default=8, ge=1)
+    # Rendered pages waiting for a request or for an earlier page to finish
+    max_buffered_pages: int = Field(default=8, ge=1)
+    render_dpi: int = Field(default=150, ge=1)
+    # Use the text layer of pages that have a good one instead of sending
+    # them to the model; pages with embedded images always go to the model
+    skip_pages_with_text: bool = False
+    # A text layer is good when it has this many characters after
+    # cleanup, and cleanup kept at least `min_text_ratio` of them
+    min_text_characters: int = Field(default=200, ge=0)
+    min_text_ratio: float = Field(default=0.9, ge=0, le=1)
+
+
 class IngestionConfig(ProviderConfig):
     _defaults: ClassVar[dict] = {
         "app": AppConfig(),
@@ -50,6 +106,11 @@ class IngestionConfig(ProviderConfig):
         "parser_overrides": {},
         "extra_fields": {},
         "automatic_extraction": False,
+        "parser_execution_settings": ParserExecutionSettings(),
+        "pipeline_settings": IngestionPipelineSettings(),
+        "pdf_text_extractor": "pypdf",
+        "tokenizer_model": "gpt-4o",
+        "vlm_parsing_settings": VLMParsingSettings(),
     }
 
     provider: str = Field(
@@ -125,6 +186,33 @@ class IngestionConfig(ProviderConfig):
             "document_summary_max_length"
         ]
     )
+    # Defaults loaded from a config file are stored as dicts, so nested
+    # settings validate their defaults
+    parser_execution_settings: ParserExecutionSettings = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "parser_execution_settings"
+        ],
+        validate_default=True,
+    )
+    pipeline_settings: IngestionPipelineSettings = Field(
+        default_factory=lambda: IngestionConfig._defaults["pipeline_settings"],
+        validate_default=True,
+    )
+    vlm_parsing_settings: VLMParsingSettings = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "vlm_parsing_settings"
+        ],
+        validate_default=True,
+    )
+    # Library used by the default PDF parser, "pypdf" or "pymupdf"
+    pdf_text_extractor: str = Field(
+        default_factory=lambda: IngestionConfig._defaults["pdf_text_extractor"]
+    )
+    # Model whose tokenizer measures chunks for the "token" chunking
+    # strategy and counts the tokens of ingested chunks
+    tokenizer_model: str = Field(
+        default_factory=lambda: IngestionConfig._defaults["tokenizer_model"]
+    )
 
     @classmethod
     def set_default(cls, **kwargs):
@@ -143,6 +231,10 @@ class IngestionConfig(ProviderConfig):
     def validate_config(self) -> None:
         if self.provider not in self.supported_providers:
             raise ValueError(f"Provider {self.provider} is not supported.")
+        if self.pdf_text_extractor not in ("pypdf", "pymupdf"):
+            raise ValueError(
+                f"PDF text extractor {self.pdf_text_extractor} is not supported."
+            )
 
     @classmethod
     def get_default(cls, mode: str, app) -> "IngestionConfig":
@@ -1,6 +1,7 @@
 from shared.utils import (
     RecursiveCharacterTextSplitter,
     TextSplitter,
+    TokenBudgetTextSplitter,
     _decorate_vector_type,
     _get_vector_column_str,
     decrement_version,
@@ -15,6 +16,7 @@ from shared.utils import (
     generate_extraction_id,
     generate_id,
     generate_user_id,
+    get_token_encoding,
     increment_version,
     validate_uuid,
     yield_sse_event,
@@ -33,6 +35,8 @@ __all__ = [
     "generate_default_prompt_id",
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
+    "TokenBudgetTextSplitter",
+    "get_token_encoding",
     "validate_uuid",
     "deep_update",
     "_decorate_vector_type",
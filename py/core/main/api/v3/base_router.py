@@ -1,12 +1,13 @@
 import functools
+import json
 import logging
 from abc import abstractmethod
-from typing import Callable
+from typing import Any, AsyncGenerator, Callable, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import FileResponse, StreamingResponse
 
-from core.base import R2RException
+from core.base import R2RException, R2RSerializable
 
 from ...abstractions import R2RProviders, R2RServices
 from ...config import R2RConfig
@@ -77,6 +78,37 @@ class BaseRouterV3:
         wrapper._is_base_endpoint = True  # type: ignore
         return wrapper
 
+    @staticmethod
+    def stream_results(
+        results: AsyncGenerator[Any, None],
+        stream_format: Literal["ndjson", "sse"] = "ndjson",
+    ) -> StreamingResponse:
+        """Streams items from `results` as they are produced, either as
+        newline-delimited JSON or as server-sent `result` events followed by
+        a final `done` event."""
+
+        def serialize(item: Any) -> str:
+            if isinstance(item, R2RSerializable):
+                return item.to_json()
+            return json.dumps(item, default=str)
+
+        async def ndjson_generator():
+            async for item in results:
+                yield serialize(item) + "\n"
+
+        async def sse_generator():
+            async for item in results:
+                yield f"event: result\ndata: {serialize(item)}\n\n"
+            yield "event: done\ndata: {}\n\n"
+
+        if stream_format == "sse":
+            return StreamingResponse(
+                sse_generator(), media_type="text/event-stream"
+            )
+        return StreamingResponse(
+            ndjson_generator(), media_type="application/x-ndjson"
+        )
+
     @classmethod
     def build_router(cls, engine):
         """Class method for building a router instance (if you have a standard
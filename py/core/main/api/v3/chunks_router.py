@@ -1,10 +1,11 @@
 import json
 import logging
 import textwrap
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
+from fastapi.responses import StreamingResponse
 
 from core.base import (
     ChunkResponse,
@@ -19,6 +20,7 @@ from core.base.api.models import (
     WrappedBooleanResponse,
     WrappedChunkResponse,
     WrappedChunksResponse,
+    WrappedQuantizedSearchEvaluationResponse,
     WrappedVectorSearchResponse,
 )
 
@@ -91,6 +93,154 @@ class ChunksRouter(BaseRouterV3):
             )
             return results.chunk_search_results  # type: ignore
 
+        @self.router.post(
+            "/chunks/search/stream",
+            summary="Stream Chunk Search Results",
+            dependencies=[Depends(self.rate_limit_dependency)],
+            response_class=StreamingResponse,
+        )
+        @self.base_endpoint
+        async def stream_search_chunks(
+            query: str = Body(...),
+            search_settings: SearchSettings = Body(
+                default_factory=SearchSettings,
+            ),
+            limit: Optional[int] = Body(
+                None,
+                ge=1,
+                le=MAX_CHUNKS_PER_REQUEST,
+                description=f"Overrides `search_settings.limit`, allowing up to {MAX_CHUNKS_PER_REQUEST} streamed results.",
+            ),
+            stream_format: Literal["ndjson", "sse"] = Body(
+                "ndjson",
+                description="Emit results as newline-delimited JSON or as server-sent events.",
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper()),
+        ) -> StreamingResponse:
+            """Perform a chunk search and stream results as they are read.
+
+            Intended for export-style searches with large limits: semantic
+            and full-text results are read through a database cursor, so the
+            server does not hold the full result set in memory. Results are
+            returned in rank order and are not re-ranked.
+            """
+            search_settings.filters = select_search_filters(
+                auth_user, search_settings
+            )
+            if limit is not None:
+                search_settings = search_settings.model_copy(
+                    update={"limit": limit}
+                )
+
+            try:
+                results = await self.services.retrieval.stream_search(
+                    query=query,
+                    search_settings=search_settings,
+                )
+            except ValueError as e:
+                raise R2RException(str(e), 400) from e
+            return self.stream_results(results, stream_format)
+
+        @self.router.post(
+            "/chunks/search/evaluate",
+            summary="Evaluate Quantized Chunk Search",
+            dependencies=[Depends(self.rate_limit_dependency)],
+        )
+        @self.base_endpoint
+        async def evaluate_quantized_search(
+            queries: list[str] = Body(
+                ...,
+                min_length=1,
+                max_length=100,
+                description="Sample queries to evaluate.",
+            ),
+            oversampling_factors: list[int] = Body(
+                [5, 10, 20, 40],
+                min_length=1,
+                description="INT1 oversampling factors to compare.",
+            ),
+            search_settings: SearchSettings = Body(
+                default_factory=SearchSettings,
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper()),
+        ) -> WrappedQuantizedSearchEvaluationResponse:
+            """Measure recall and latency of INT1 quantized search.
+
+            Each query is answered with an exact scan over the full
+            precision vectors and with the two-stage binary search at every
+            oversampling factor. Returns the mean recall@limit and the mean
+            and p95 latencies per factor, for tuning
+            `quantized_search_settings` on your own data. Only available to
+            superusers, on deployments using INT1 quantization.
+            """
+            if not auth_user.is_superuser:
+                raise R2RException(
+                    "Only a superuser can evaluate quantized search.", 403
+                )
+            if any(factor < 1 for factor in oversampling_factors):
+                raise R2RException(
+                    "Oversampling factors must be at least 1.", 422
+                )
+            search_settings.filters = select_search_filters(
+                auth_user, search_settings
+            )
+            try:
+                return await self.services.retrieval.evaluate_quantized_search(
+                    queries=queries,
+                    search_settings=search_settings,
+                    oversampling_factors=oversampling_factors,
+                )
+            except ValueError as e:
+                raise R2RException(str(e), 400) from e
+
+        @self.router.get(
+            "/chunks/stream",
+            dependencies=[Depends(self.rate_limit_dependency)],
+            summary="Stream Chunks",
+            response_class=StreamingResponse,
+        )
+        @self.base_endpoint
+        async def stream_chunks(
+            include_vectors: bool = Query(
+                False, description="Include vector data in response"
+            ),
+            offset: int = Query(
+                0,
+                ge=0,
+                description="Specifies the number of objects to skip. Defaults to 0.",
+            ),
+            limit: int = Query(
+                MAX_CHUNKS_PER_REQUEST,
+                ge=1,
+                le=MAX_CHUNKS_PER_REQUEST,
+                description=f"Specifies a limit on the number of objects to return, ranging between 1 and {MAX_CHUNKS_PER_REQUEST}.",
+            ),
+            stream_format: Literal["ndjson", "sse"] = Query(
+                "ndjson",
+                description="Emit chunks as newline-delimited JSON or as server-sent events.",
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper()),
+        ) -> StreamingResponse:
+            """Stream the chunks the user has access to.
+
+            Chunks are read through a database cursor and written to the
+            response as they arrive, so memory use does not grow with
+            `limit`. No total count is returned.
+            """
+            filters = {}
+            if not auth_user.is_superuser:
+                filters["owner_id"] = {"$eq": str(auth_user.id)}
+
+            return self.stream_results(
+                self.services.ingestion.stream_chunks(
+                    filters=filters,
+                    include_vectors=include_vectors,
+                    offset=offset,
+                    limit=limit,
+                ),
+                stream_format,
+            )
+
         @self.router.get(
             "/chunks/{id}",
             summary="Retrieve Chunk",
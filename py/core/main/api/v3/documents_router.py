@@ -1,10 +1,8 @@
-import base64
 import logging
 import mimetypes
 import textwrap
 from datetime import datetime
-from io import BytesIO
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from urllib.parse import quote
 from uuid import UUID
 
@@ -47,6 +45,8 @@ from .base_router import BaseRouterV3
 
 logger = logging.getLogger()
 MAX_CHUNKS_PER_REQUEST = 1024 * 100
+# Uploads are read and written to storage in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def merge_search_settings(
@@ -452,8 +452,6 @@ class DocumentsRouter(BaseRouterV3):
 
             else:
                 if file:
-                    file_data = await self._process_file(file)
-
                     if not file.filename:
                         raise R2RException(
                             status_code=422,
@@ -467,28 +465,25 @@ class DocumentsRouter(BaseRouterV3):
                         user_id=auth_user.id, file_type_or_ext=file_ext
                     )
 
-                    content_length = file_data["content_length"]
-
-                    if content_length > max_allowed_size:
-                        raise R2RException(
-                            status_code=413,  # HTTP 413: Payload Too Large
-                            message=(
-                                f"File size exceeds maximum of {max_allowed_size} bytes "
-                                f"for extension '{file_ext}'."
-                            ),
+                    # The size is checked again while streaming, as it is
+                    # not always known up front
+                    if file.size is not None and file.size > max_allowed_size:
+                        raise self._upload_too_large(
+                            max_allowed_size, file_ext
                         )
 
-                    file_content = BytesIO(
-                        base64.b64decode(file_data["content"])
+                    file_content = self._read_upload(
+                        file, max_allowed_size, file_ext
                     )
-
-                    file_data.pop("content", None)
+                    file_data = {
+                        "filename": file.filename,
+                        "content_type": file.content_type,
+                    }
                     document_id = id or generate_document_id(
                         file_data["filename"], auth_user.id
                     )
                 elif raw_text:
-                    content_length = len(raw_text)
-                    file_content = BytesIO(raw_text.encode("utf-8"))
+                    file_content = self._iter_bytes(raw_text.encode("utf-8"))
                     document_id = id or generate_document_id(
                         raw_text, auth_user.id
                     )
@@ -504,6 +499,18 @@ class DocumentsRouter(BaseRouterV3):
                         message="Either a file or content must be provided.",
                     )
 
+            # Streamed straight into a large object; workers only receive
+            # the document id and read the file back from the database
+            file_name = file_data["filename"]
+            content_length = (
+                await self.providers.database.files_handler.store_file_stream(
+                    document_id,
+                    file_name,
+                    file_content,
+                    file_data["content_type"],
+                )
+            )
+
             workflow_input = {
                 "file_data": file_data,
                 "document_id": str(document_id),
@@ -521,14 +528,6 @@ class DocumentsRouter(BaseRouterV3):
                 "version": "v0",
             }
 
-            file_name = file_data["filename"]
-            await self.providers.database.files_handler.store_file(
-                document_id,
-                file_name,
-                file_content,
-                file_data["content_type"],
-            )
-
             await self.services.ingestion.ingest_file_ingress(
                 file_data=workflow_input["file_data"],
                 user=auth_user,
@@ -2329,14 +2328,28 @@ class DocumentsRouter(BaseRouterV3):
             return results  # type: ignore
 
     @staticmethod
-    async def _process_file(file):
-        import base64
+    def _upload_too_large(max_allowed_size: int, file_ext: str):
+        return R2RException(
+            status_code=413,  # HTTP 413: Payload Too Large
+            message=(
+                f"File size exceeds maximum of {max_allowed_size} bytes "
+                f"for extension '{file_ext}'."
+            ),
+        )
 
-        content = await file.read()
+    @classmethod
+    async def _read_upload(
+        cls, file: UploadFile, max_allowed_size: int, file_ext: str
+    ) -> AsyncIterator[bytes]:
+        """Yields the uploaded file in chunks, enforcing the size limit as
+        the bytes come in."""
+        size = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_allowed_size:
+                raise cls._upload_too_large(max_allowed_size, file_ext)
+            yield chunk
 
-        return {
-            "filename": file.filename,
-            "content": base64.b64encode(content).decode("utf-8"),
-            "content_type": file.content_type,
-            "content_length": len(content),
-        }
+    @staticmethod
+    async def _iter_bytes(content: bytes) -> AsyncIterator[bytes]:
+        yield content
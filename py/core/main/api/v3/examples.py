@@ -858,6 +858,61 @@ embedding_examples = {
     ]
 }
 
+search_many_examples = {
+    "x-codeSamples": [
+        {
+            "lang": "Python",
+            "source": textwrap.dedent(
+                """
+                from r2r import R2RClient
+
+                client = R2RClient()
+                # when using auth, do client.login(...)
+
+                response = client.retrieval.search_many(
+                    queries=["What is DeepSeek R1?", "Who trained it?"],
+                    search_mode="basic",
+                )
+                """
+            ),
+        },
+        {
+            "lang": "JavaScript",
+            "source": textwrap.dedent(
+                """
+                const { r2rClient } = require("r2r-js");
+
+                const client = new r2rClient();
+                // when using auth, do client.login(...)
+
+                async function main() {
+                    const response = await client.retrieval.searchMany({
+                        queries: ["What is DeepSeek R1?", "Who trained it?"],
+                        searchMode: "basic",
+                    });
+                }
+
+                main();
+                """
+            ),
+        },
+        {
+            "lang": "Shell",
+            "source": textwrap.dedent(
+                """
+                curl -X POST "https://api.sciphi.ai/v3/retrieval/search_many" \\
+                    -H "Content-Type: application/json" \\
+                    -H "Authorization: Bearer YOUR_API_KEY" \\
+                    -d '{
+                    "queries": ["What is DeepSeek R1?", "Who trained it?"],
+                    "search_mode": "basic"
+                    }'
+                """
+            ),
+        },
+    ]
+}
+
 # Updated rag_app docstring
 rag_app_docstring = """
 Execute a RAG (Retrieval-Augmented Generation) query.
@@ -1058,6 +1113,7 @@ router = update_retrieval_router(router)
 
 EXAMPLES = {
     "search": search_app_examples,
+    "search_many": search_many_examples,
     "rag": rag_app_examples,
     "agent": agent_app_examples,
     "completion": completion_examples,
@@ -19,6 +19,7 @@ from core.base.api.models import (
     WrappedEmbeddingResponse,
     WrappedLLMChatCompletion,
     WrappedRAGResponse,
+    WrappedSearchManyResponse,
     WrappedSearchResponse,
 )
 
@@ -29,6 +30,9 @@ from .examples import EXAMPLES
 
 logger = logging.getLogger(__name__)
 
+MAX_SEARCH_MANY_QUERIES = 100
+MAX_STREAMED_SEARCH_RESULTS = 1024 * 100
+
 
 def merge_search_settings(
     base: SearchSettings, overrides: SearchSettings
@@ -190,6 +194,126 @@ class RetrievalRouter(BaseRouterV3):
             )
             return results  # type: ignore
 
+        @self.router.post(
+            "/retrieval/search/stream",
+            dependencies=[Depends(self.rate_limit_dependency)],
+            summary="Stream search results",
+            response_class=StreamingResponse,
+        )
+        @self.base_endpoint
+        async def stream_search_app(
+            query: str = Body(
+                ...,
+                description="Search query to find relevant documents",
+            ),
+            search_mode: SearchMode = Body(
+                default=SearchMode.custom,
+                description="Pre-configured search mode. See `/retrieval/search`.",
+            ),
+            search_settings: Optional[SearchSettings] = Body(
+                None,
+                description="The search configuration object. See `/retrieval/search`.",
+            ),
+            limit: Optional[int] = Body(
+                None,
+                ge=1,
+                le=MAX_STREAMED_SEARCH_RESULTS,
+                description=f"Overrides `search_settings.limit`, allowing up to {MAX_STREAMED_SEARCH_RESULTS} streamed results.",
+            ),
+            stream_format: Literal["ndjson", "sse"] = Body(
+                "ndjson",
+                description="Emit results as newline-delimited JSON or as server-sent events.",
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper()),
+        ) -> StreamingResponse:
+            """Search chunks and stream results as they are read.
+
+            Use this instead of `/retrieval/search` when asking for
+            thousands of chunks. Semantic and full-text results are read
+            through a database cursor and written out incrementally, so
+            memory stays flat regardless of `limit`. Only chunk results are
+            returned, in rank order and without re-ranking.
+            """
+            if query == "":
+                raise R2RException("Query cannot be empty", 400)
+            effective_settings = self._prepare_search_settings(
+                auth_user, search_mode, search_settings
+            )
+            if limit is not None:
+                effective_settings = effective_settings.model_copy(
+                    update={"limit": limit}
+                )
+            try:
+                results = await self.services.retrieval.stream_search(
+                    query=query,
+                    search_settings=effective_settings,
+                )
+            except ValueError as e:
+                raise R2RException(str(e), 400) from e
+            return self.stream_results(results, stream_format)
+
+        @self.router.post(
+            "/retrieval/search_many",
+            dependencies=[Depends(self.rate_limit_dependency)],
+            summary="Search R2R with multiple queries",
+            openapi_extra=EXAMPLES["search_many"],
+        )
+        @self.base_endpoint
+        async def search_many_app(
+            queries: list[str] = Body(
+                ...,
+                description=f"Search queries to run, at most {MAX_SEARCH_MANY_QUERIES} per request",
+            ),
+            search_mode: SearchMode = Body(
+                default=SearchMode.custom,
+                description="Pre-configured search mode applied to every query. See `/retrieval/search`.",
+            ),
+            search_settings: Optional[list[Optional[SearchSettings]]] = Body(
+                None,
+                description=(
+                    "Per-query search configuration. When provided it must contain one entry per query; "
+                    "`null` entries fall back to the `search_mode` defaults."
+                ),
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper()),
+        ) -> WrappedSearchManyResponse:
+            """Perform several independent search queries in one request.
+
+            Each query behaves exactly as it would through `/retrieval/search`,
+            but all queries are embedded with a single provider call and their
+            database searches run concurrently. Results are returned in the
+            same order as `queries`.
+            """
+            if not queries:
+                raise R2RException("At least one query is required", 400)
+            if len(queries) > MAX_SEARCH_MANY_QUERIES:
+                raise R2RException(
+                    f"At most {MAX_SEARCH_MANY_QUERIES} queries can be searched per request",
+                    400,
+                )
+            if any(query == "" for query in queries):
+                raise R2RException("Query cannot be empty", 400)
+            if search_settings is not None and len(search_settings) != len(
+                queries
+            ):
+                raise R2RException(
+                    "search_settings must contain one entry per query", 400
+                )
+
+            effective_settings = [
+                self._prepare_search_settings(
+                    auth_user,
+                    search_mode,
+                    search_settings[i] if search_settings else None,
+                )
+                for i in range(len(queries))
+            ]
+            results = await self.services.retrieval.search_many(
+                queries=queries,
+                search_settings=effective_settings,
+            )
+            return results  # type: ignore
+
         @self.router.post(
             "/retrieval/rag",
             dependencies=[Depends(self.rate_limit_dependency)],
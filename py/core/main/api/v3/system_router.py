@@ -176,6 +176,12 @@ class SystemRouter(BaseRouterV3):
                     "Only an authorized user can call the `system/status` endpoint.",
                     403,
                 )
+            embedding_cache = {
+                "embedding": self.providers.embedding.cache_stats(),
+                "completion_embedding": (
+                    self.providers.completion_embedding.cache_stats()
+                ),
+            }
             return {  # type: ignore
                 "start_time": self.start_time.isoformat(),
                 "uptime_seconds": (
@@ -183,4 +189,11 @@ class SystemRouter(BaseRouterV3):
                 ).total_seconds(),
                 "cpu_usage": psutil.cpu_percent(),
                 "memory_usage": psutil.virtual_memory().percent,
+                "database_pools": self.providers.database.connection_manager.pool_metrics(),
+                "crypto_hashing": self.providers.auth.crypto_provider.hashing_metrics(),
+                "embedding_cache": {
+                    name: stats
+                    for name, stats in embedding_cache.items()
+                    if stats
+                },
             }
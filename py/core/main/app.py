@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
@@ -8,9 +10,10 @@ from core.providers import (
     HatchetOrchestrationProvider,
     SimpleOrchestrationProvider,
 )
+from core.providers.database import UserCacheMiddleware
 from core.utils.sentry import init_sentry
 
-from .abstractions import R2RServices
+from .abstractions import R2RProviders, R2RServices
 from .api.v3.chunks_router import ChunksRouter
 from .api.v3.collections_router import CollectionsRouter
 from .api.v3.conversations_router import ConversationsRouter
@@ -23,6 +26,8 @@ from .api.v3.system_router import SystemRouter
 from .api.v3.users_router import UsersRouter
 from .config import R2RConfig
 
+logger = logging.getLogger()
+
 
 class R2RApp:
     def __init__(
@@ -32,6 +37,7 @@ class R2RApp:
             HatchetOrchestrationProvider | SimpleOrchestrationProvider
         ),
         services: R2RServices,
+        providers: R2RProviders,
         chunks_router: ChunksRouter,
         collections_router: CollectionsRouter,
         conversations_router: ConversationsRouter,
@@ -47,6 +53,7 @@ class R2RApp:
 
         self.config = config
         self.services = services
+        self.providers = providers
         self.chunks_router = chunks_router
         self.collections_router = collections_router
         self.conversations_router = conversations_router
@@ -72,6 +79,7 @@ class R2RApp:
             )
 
         self._setup_routes()
+        self.app.add_middleware(UserCacheMiddleware)
         self._apply_cors()
 
     def _setup_routes(self):
@@ -118,4 +126,21 @@ class R2RApp:
             log_config=None,
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        """Closes the pools, sessions and workers held by the providers."""
+        closed: set[int] = set()
+        for name, provider in self.providers:
+            # The same instance can back several roles, e.g. `embedding`
+            # and `completion_embedding`.
+            if id(provider) in closed:
+                continue
+            closed.add(id(provider))
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.error(f"Error closing the {name} provider: {e}")
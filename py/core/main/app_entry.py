@@ -44,6 +44,7 @@ async def lifespan(app: FastAPI):
 
     # # Shutdown
     scheduler.shutdown()
+    await r2r_app.shutdown()
 
 
 async def create_r2r_app(
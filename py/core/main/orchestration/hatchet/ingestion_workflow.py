@@ -5,7 +5,6 @@ import uuid
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-import tiktoken
 from fastapi import HTTPException
 from hatchet_sdk import ConcurrencyLimitStrategy, Context
 from litellm import AuthenticationError
@@ -24,6 +23,7 @@ from core.utils import (
 )
 
 from ...services import IngestionService, IngestionServiceAdapter
+from ...services.ingestion_service import count_tokens
 
 if TYPE_CHECKING:
     from hatchet_sdk import Hatchet
@@ -31,17 +31,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger()
 
 
-# FIXME: No need to duplicate this function between the workflows, consolidate it into a shared module
-def count_tokens_for_text(text: str, model: str = "gpt-4o") -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # Fallback to a known encoding if model not recognized
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(encoding.encode(text, disallowed_special=()))
-
-
 def hatchet_ingestion_factory(
     orchestration_provider: OrchestrationProvider, service: IngestionService
 ) -> dict[str, "Hatchet.Workflow"]:
@@ -101,59 +90,16 @@ def hatchet_ingestion_factory(
                 )
 
                 ingestion_config = parsed_data["ingestion_config"] or {}
-                extractions_generator = self.ingestion_service.parse_file(
-                    document_info, ingestion_config
-                )
-
-                extractions = []
-                async for extraction in extractions_generator:
-                    extractions.append(extraction)
-
-                # 2) Sum tokens
-                total_tokens = 0
-                for chunk in extractions:
-                    text_data = chunk.data
-                    if not isinstance(text_data, str):
-                        text_data = text_data.decode("utf-8", errors="ignore")
-                    total_tokens += count_tokens_for_text(text_data)
-                document_info.total_tokens = total_tokens
-
-                if not ingestion_config.get("skip_document_summary", False):
-                    await service.update_document_status(
-                        document_info, status=IngestionStatus.AUGMENTING
-                    )
-                    await service.augment_document_info(
-                        document_info,
-                        [extraction.to_dict() for extraction in extractions],
-                    )
-
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.EMBEDDING,
-                )
-
-                # extractions = context.step_output("parse")["extractions"]
-
-                embedding_generator = self.ingestion_service.embed_document(
-                    [extraction.to_dict() for extraction in extractions]
-                )
-
-                embeddings = []
-                async for embedding in embedding_generator:
-                    embeddings.append(embedding)
-
-                await self.ingestion_service.update_document_status(
+                await self.ingestion_service.ingest_chunk_stream(
                     document_info,
-                    status=IngestionStatus.STORING,
-                )
-
-                storage_generator = self.ingestion_service.store_embeddings(  # type: ignore
-                    embeddings
+                    self.ingestion_service.parse_file(
+                        document_info, ingestion_config
+                    ),
+                    summarize=not ingestion_config.get(
+                        "skip_document_summary", False
+                    ),
                 )
 
-                async for _ in storage_generator:
-                    pass
-
                 await self.ingestion_service.finalize_ingestion(document_info)
 
                 await self.ingestion_service.update_document_status(
@@ -388,7 +334,10 @@ def hatchet_ingestion_factory(
                 text_data = chunk["data"]
                 if not isinstance(text_data, str):
                     text_data = text_data.decode("utf-8", errors="ignore")
-                total_tokens += count_tokens_for_text(text_data)
+                total_tokens += count_tokens(
+                    text_data,
+                    self.ingestion_service.config.ingestion.tokenizer_model,
+                )
             document_info.total_tokens = total_tokens
 
             return {
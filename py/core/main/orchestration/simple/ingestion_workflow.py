@@ -2,7 +2,6 @@ import asyncio
 import logging
 from uuid import UUID
 
-import tiktoken
 from fastapi import HTTPException
 from litellm import AuthenticationError
 
@@ -23,17 +22,6 @@ from ...services import IngestionService
 logger = logging.getLogger()
 
 
-# FIXME: No need to duplicate this function between the workflows, consolidate it into a shared module
-def count_tokens_for_text(text: str, model: str = "gpt-4o") -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # Fallback to a known encoding if model not recognized
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(encoding.encode(text, disallowed_special=()))
-
-
 def simple_ingestion_factory(service: IngestionService):
     async def ingest_files(input_data):
         document_info = None
@@ -59,46 +47,16 @@ def simple_ingestion_factory(service: IngestionService):
             )
 
             ingestion_config = parsed_data["ingestion_config"]
-            extractions_generator = service.parse_file(
-                document_info=document_info,
-                ingestion_config=ingestion_config,
-            )
-            extractions = [
-                extraction.model_dump()
-                async for extraction in extractions_generator
-            ]
-
-            # 2) Sum tokens
-            total_tokens = 0
-            for chunk_dict in extractions:
-                text_data = chunk_dict["data"]
-                if not isinstance(text_data, str):
-                    text_data = text_data.decode("utf-8", errors="ignore")
-                total_tokens += count_tokens_for_text(text_data)
-            document_info.total_tokens = total_tokens
-
-            if not ingestion_config.get("skip_document_summary", False):
-                await service.update_document_status(
+            await service.ingest_chunk_stream(
+                document_info,
+                service.parse_file(
                     document_info=document_info,
-                    status=IngestionStatus.AUGMENTING,
-                )
-                await service.augment_document_info(document_info, extractions)
-
-            await service.update_document_status(
-                document_info, status=IngestionStatus.EMBEDDING
+                    ingestion_config=ingestion_config,
+                ),
+                summarize=not ingestion_config.get(
+                    "skip_document_summary", False
+                ),
             )
-            embedding_generator = service.embed_document(extractions)
-            embeddings = [
-                embedding.model_dump()
-                async for embedding in embedding_generator
-            ]
-
-            await service.update_document_status(
-                document_info, status=IngestionStatus.STORING
-            )
-            storage_generator = service.store_embeddings(embeddings)
-            async for _ in storage_generator:
-                pass
 
             await service.finalize_ingestion(document_info)
 
@@ -347,40 +305,26 @@ def simple_ingestion_factory(service: IngestionService):
             )
 
             document_info = await service.ingest_chunks_ingress(**parsed_data)
-
-            await service.update_document_status(
-                document_info, status=IngestionStatus.EMBEDDING
-            )
             document_id = document_info.id
 
-            extractions = [
-                DocumentChunk(
-                    id=(
-                        generate_extraction_id(document_id, i)
-                        if chunk.id is None
-                        else chunk.id
-                    ),
-                    document_id=document_id,
-                    collection_ids=[],
-                    owner_id=document_info.owner_id,
-                    data=chunk.text,
-                    metadata=parsed_data["metadata"],
-                ).model_dump()
-                for i, chunk in enumerate(parsed_data["chunks"])
-            ]
-
-            embedding_generator = service.embed_document(extractions)
-            embeddings = [
-                embedding.model_dump()
-                async for embedding in embedding_generator
-            ]
+            async def chunk_stream():
+                for i, chunk in enumerate(parsed_data["chunks"]):
+                    yield DocumentChunk(
+                        id=(
+                            generate_extraction_id(document_id, i)
+                            if chunk.id is None
+                            else chunk.id
+                        ),
+                        document_id=document_id,
+                        collection_ids=[],
+                        owner_id=document_info.owner_id,
+                        data=chunk.text,
+                        metadata=parsed_data["metadata"],
+                    )
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.STORING
+            await service.ingest_chunk_stream(
+                document_info, chunk_stream(), summarize=False
             )
-            storage_generator = service.store_embeddings(embeddings)
-            async for _ in storage_generator:
-                pass
 
             await service.finalize_ingestion(document_info)
 
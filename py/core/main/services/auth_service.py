@@ -172,7 +172,7 @@ class AuthService(Service):
             or (
                 user.hashed_password is not None
                 and password is not None
-                and self.providers.auth.crypto_provider.verify_password(
+                and await self.providers.auth.crypto_provider.async_verify_password(
                     plain_password=password,
                     hashed_password=user.hashed_password,
                 )
@@ -63,7 +63,7 @@ class GraphService(Service):
         category: Optional[str] = None,
         metadata: Optional[dict] = None,
     ) -> Entity:
-        description_embedding = str(
+        description_embedding = (
             await self.providers.embedding.async_get_embedding(description)
         )
 
@@ -87,7 +87,7 @@ class GraphService(Service):
     ) -> Entity:
         description_embedding = None
         if description is not None:
-            description_embedding = str(
+            description_embedding = (
                 await self.providers.embedding.async_get_embedding(description)
             )
 
@@ -144,7 +144,7 @@ class GraphService(Service):
     ) -> Relationship:
         description_embedding = None
         if description:
-            description_embedding = str(
+            description_embedding = (
                 await self.providers.embedding.async_get_embedding(description)
             )
 
@@ -191,7 +191,7 @@ class GraphService(Service):
     ) -> Relationship:
         description_embedding = None
         if description is not None:
-            description_embedding = str(
+            description_embedding = (
                 await self.providers.embedding.async_get_embedding(description)
             )
 
@@ -237,7 +237,7 @@ class GraphService(Service):
         rating: Optional[float],
         rating_explanation: Optional[str],
     ) -> Community:
-        description_embedding = str(
+        description_embedding = (
             await self.providers.embedding.async_get_embedding(summary)
         )
         return await self.providers.database.graphs_handler.communities.create(
@@ -262,7 +262,7 @@ class GraphService(Service):
     ) -> Community:
         summary_embedding = None
         if summary is not None:
-            summary_embedding = str(
+            summary_embedding = (
                 await self.providers.embedding.async_get_embedding(summary)
             )
 
@@ -1352,7 +1352,7 @@ class GraphService(Service):
                     entity_id=merged_entity.id,
                     store_type=StoreType.DOCUMENTS,
                     description=new_description,
-                    description_embedding=str(new_embedding),
+                    description_embedding=new_embedding,
                 )
             else:
                 logger.warning("Skipping update for entity with None id")
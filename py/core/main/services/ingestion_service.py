@@ -1,8 +1,10 @@
 import asyncio
 import json
 import logging
+import math
+import time
 from datetime import datetime
-from typing import Any, AsyncGenerator, Optional, Sequence
+from typing import Any, AsyncGenerator, AsyncIterable, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -21,6 +23,7 @@ from core.base import (
     VectorEntry,
     VectorType,
     generate_id,
+    get_token_encoding,
 )
 from core.base.abstractions import (
     ChunkEnrichmentSettings,
@@ -39,6 +42,23 @@ logger = logging.getLogger()
 STARTING_VERSION = "v0"
 
 
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    return len(get_token_encoding(model).encode(text, disallowed_special=()))
+
+
+class _ChunkQuota:
+    """Each owner's remaining chunk allowance for one ingestion.
+
+    An owner's quota is looked up the first time the owner is seen and then
+    counted down locally, so storing many batches resolves it only once.
+    """
+
+    def __init__(self):
+        self.max_chunks: dict[UUID, Optional[int]] = {}
+        self.remaining: dict[UUID, float] = {}
+        self.reported: set[UUID] = set()
+
+
 class IngestionService:
     """A refactored IngestionService that inlines all pipe logic for parsing,
     embedding, and vector storage directly in its methods."""
@@ -240,10 +260,6 @@ class IngestionService:
 
             file_name, file_wrapper, file_size = retrieved
 
-            # Read the content
-            with file_wrapper as file_content_stream:
-                file_content = file_content_stream.read()
-
             # Build a barebones Document object
             doc = Document(
                 id=document_info.id,
@@ -256,17 +272,20 @@ class IngestionService:
                 document_type=document_info.document_type,
             )
 
-            # Delegate to the ingestion provider to parse
-            async for extraction in self.providers.ingestion.parse(
-                file_content,  # raw bytes
-                doc,
-                ingestion_config_override,
-            ):
-                # Adjust chunk ID to incorporate version
-                # or any other needed transformations
-                extraction.id = generate_id(f"{extraction.id}_{version}")
-                extraction.metadata["version"] = version
-                yield extraction
+            # Delegate to the ingestion provider to parse. The file is
+            # passed as a file object; parsers that support streaming read
+            # it in chunks, the others receive its bytes.
+            with file_wrapper as file_content:
+                async for extraction in self.providers.ingestion.parse(
+                    file_content,
+                    doc,
+                    ingestion_config_override,
+                ):
+                    # Adjust chunk ID to incorporate version
+                    # or any other needed transformations
+                    extraction.id = generate_id(f"{extraction.id}_{version}")
+                    extraction.metadata["version"] = version
+                    yield extraction
 
         except (PopplerNotFoundError, PDFParsingError) as e:
             raise R2RDocumentProcessingError(
@@ -340,49 +359,13 @@ class IngestionService:
             return
 
         concurrency_limit = (
-            self.providers.embedding.config.concurrent_request_limit or 5
+            self.config.ingestion.pipeline_settings.embed_workers
         )
         extraction_batch: list[DocumentChunk] = []
         tasks: set[asyncio.Task] = set()
 
-        async def process_batch(
-            batch: list[DocumentChunk],
-        ) -> list[VectorEntry]:
-            # All text from the batch
-            texts = [
-                (
-                    ex.data.decode("utf-8")
-                    if isinstance(ex.data, bytes)
-                    else ex.data
-                )
-                for ex in batch
-            ]
-            # Retrieve embeddings in bulk
-            vectors = await self.providers.embedding.async_get_embeddings(
-                texts,  # list of strings
-            )
-            # Zip them back together
-            results = []
-            for raw_vector, extraction in zip(vectors, batch, strict=False):
-                results.append(
-                    VectorEntry(
-                        id=extraction.id,
-                        document_id=extraction.document_id,
-                        owner_id=extraction.owner_id,
-                        collection_ids=extraction.collection_ids,
-                        vector=Vector(data=raw_vector, type=VectorType.FIXED),
-                        text=(
-                            extraction.data.decode("utf-8")
-                            if isinstance(extraction.data, bytes)
-                            else str(extraction.data)
-                        ),
-                        metadata={**extraction.metadata},
-                    )
-                )
-            return results
-
         async def run_process_batch(batch: list[DocumentChunk]):
-            return await process_batch(batch)
+            return await self._embed_chunks(batch)
 
         # Convert each chunk dict to a DocumentChunk
         for chunk_dict in chunked_documents:
@@ -414,15 +397,57 @@ class IngestionService:
             for vector_entry in await future_task:
                 yield vector_entry
 
+    async def _embed_chunks(
+        self, batch: list[DocumentChunk]
+    ) -> list[VectorEntry]:
+        # All text from the batch
+        texts = [
+            (
+                ex.data.decode("utf-8")
+                if isinstance(ex.data, bytes)
+                else ex.data
+            )
+            for ex in batch
+        ]
+        # Retrieve embeddings in bulk
+        vectors = await self.providers.embedding.async_get_embeddings(
+            texts,  # list of strings
+        )
+        # Zip them back together
+        results = []
+        for raw_vector, extraction in zip(vectors, batch, strict=False):
+            results.append(
+                VectorEntry(
+                    id=extraction.id,
+                    document_id=extraction.document_id,
+                    owner_id=extraction.owner_id,
+                    collection_ids=extraction.collection_ids,
+                    vector=Vector(data=raw_vector, type=VectorType.FIXED),
+                    text=(
+                        extraction.data.decode("utf-8")
+                        if isinstance(extraction.data, bytes)
+                        else str(extraction.data)
+                    ),
+                    metadata={**extraction.metadata},
+                )
+            )
+        return results
+
     async def store_embeddings(
         self,
         embeddings: Sequence[dict | VectorEntry],
         storage_batch_size: int = 128,
+        max_concurrent_batches: int = 4,
+        chunk_quota: Optional[_ChunkQuota] = None,
     ) -> AsyncGenerator[str, None]:
         """Inline replacement for the old vector_storage_pipe.run(...).
 
-        Batches up the vector entries, enforces usage limits, stores them, and
-        yields a success/error string (or you could yield a StorageResult).
+        Enforces each owner's chunk quota, stores the entries in batches of
+        `storage_batch_size` with up to `max_concurrent_batches` upserts in
+        flight, and yields a success/error string per document. Loads of at
+        least `bulk_load_settings.min_batch_size` entries go through a
+        single COPY based bulk upsert instead. Callers storing one ingestion
+        in several calls pass the same `chunk_quota` to each of them.
         """
         if not embeddings:
             return
@@ -434,78 +459,63 @@ class IngestionService:
             else:
                 vector_entries.append(VectorEntry.from_dict(item))
 
-        vector_batch: list[VectorEntry] = []
-        document_counts: dict[UUID, int] = {}
-
-        # We'll track usage from the first user we see; if your scenario allows
-        # multiple user owners in a single ingestion, you'd need to refine usage checks.
-        current_usage = None
-        user_id_for_usage_check: UUID | None = None
-
-        count = 0
+        quota = chunk_quota if chunk_quota is not None else _ChunkQuota()
+        await self._resolve_chunk_quota(
+            quota, [entry.owner_id for entry in vector_entries]
+        )
 
+        accepted: list[VectorEntry] = []
         for msg in vector_entries:
-            # If we haven't set usage yet, do so on the first chunk
-            if current_usage is None:
-                user_id_for_usage_check = msg.owner_id
-                usage_data = (
-                    await self.providers.database.chunks_handler.list_chunks(
-                        limit=1,
-                        offset=0,
-                        filters={"owner_id": msg.owner_id},
-                    )
-                )
-                current_usage = usage_data["total_entries"]
+            owner_id = msg.owner_id
+            if quota.remaining[owner_id] <= 0:
+                # Reported once per owner, however far over the quota it is
+                if owner_id not in quota.reported:
+                    quota.reported.add(owner_id)
+                    error_message = f"User {owner_id} has exceeded the maximum number of allowed chunks: {quota.max_chunks[owner_id]}"
+                    logger.error(error_message)
+                    yield error_message
+                continue
+            quota.remaining[owner_id] -= 1
+            accepted.append(msg)
 
-            # Figure out the user's limit
-            user = await self.providers.database.users_handler.get_user_by_id(
-                msg.owner_id
-            )
-            max_chunks = (
-                self.providers.database.config.app.default_max_chunks_per_user
-            )
-            if user.limits_overrides and "max_chunks" in user.limits_overrides:
-                max_chunks = user.limits_overrides["max_chunks"]
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
 
-            # Add to our local batch
-            vector_batch.append(msg)
-            document_counts[msg.document_id] = (
-                document_counts.get(msg.document_id, 0) + 1
-            )
-            count += 1
-
-            # Check usage
-            if (
-                current_usage is not None
-                and (current_usage + len(vector_batch) + count) > max_chunks
-            ):
-                error_message = f"User {msg.owner_id} has exceeded the maximum number of allowed chunks: {max_chunks}"
-                logger.error(error_message)
-                yield error_message
-                continue
+        async def store_batch(batch: list[VectorEntry]) -> None:
+            async with semaphore:
+                await self._upsert_vector_entries(batch)
 
-            # Once we hit our batch size, store them
-            if len(vector_batch) >= storage_batch_size:
-                try:
-                    await (
-                        self.providers.database.chunks_handler.upsert_entries(
-                            vector_batch
-                        )
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to store vector batch: {e}")
-                    yield f"Error: {e}"
-                vector_batch.clear()
+        if self._use_bulk_load(accepted):
+            batches = [accepted]
+        else:
+            batches = [
+                accepted[i : i + storage_batch_size]
+                for i in range(0, len(accepted), storage_batch_size)
+            ]
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(store_batch(batch) for batch in batches),
+            return_exceptions=True,
+        )
+        elapsed = time.monotonic() - start
 
-        # Store any leftover items
-        if vector_batch:
-            try:
-                await self.providers.database.chunks_handler.upsert_entries(
-                    vector_batch
+        document_counts: dict[UUID, int] = {}
+        stored = 0
+        for batch, result in zip(batches, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to store vector batch: {result}")
+                yield f"Error: {result}"
+                continue
+            stored += len(batch)
+            for entry in batch:
+                document_counts[entry.document_id] = (
+                    document_counts.get(entry.document_id, 0) + 1
                 )
-            except Exception as e:
-                logger.error(f"Failed to store final vector batch: {e}")
-                yield f"Error: {e}"
+
+        if stored:
+            logger.info(
+                f"Stored {stored} vectors in {len(batches)} batches in "
+                f"{elapsed:.2f}s ({stored / max(elapsed, 1e-6):.0f} rows/sec)"
+            )
 
         # Summaries
         for doc_id, cnt in document_counts.items():
@@ -513,6 +523,182 @@ class IngestionService:
             logger.info(info_msg)
             yield info_msg
 
+    def _use_bulk_load(self, entries: Sequence[VectorEntry]) -> bool:
+        bulk_load_settings = self.providers.database.config.bulk_load_settings
+        return len(entries) >= bulk_load_settings.min_batch_size
+
+    async def _upsert_vector_entries(self, entries: list[VectorEntry]) -> None:
+        chunks_handler = self.providers.database.chunks_handler
+        if self._use_bulk_load(entries):
+            await chunks_handler.bulk_upsert_entries(entries)
+        else:
+            await chunks_handler.upsert_entries(entries)
+
+    async def _resolve_chunk_quota(
+        self, quota: _ChunkQuota, owner_ids: list[UUID]
+    ) -> None:
+        new_owner_ids = [
+            owner_id
+            for owner_id in dict.fromkeys(owner_ids)
+            if owner_id not in quota.remaining
+        ]
+        if not new_owner_ids:
+            return
+        usage = await self.providers.database.chunks_handler.get_chunk_counts(
+            new_owner_ids
+        )
+        for owner_id in new_owner_ids:
+            max_chunks = await self._get_max_chunks(owner_id)
+            quota.max_chunks[owner_id] = max_chunks
+            quota.remaining[owner_id] = (
+                math.inf
+                if max_chunks is None
+                else max_chunks - usage.get(owner_id, 0)
+            )
+
+    async def _get_max_chunks(self, owner_id: UUID) -> Optional[int]:
+        max_chunks = (
+            self.providers.database.config.app.default_max_chunks_per_user
+        )
+        user = await self.providers.database.users_handler.get_user_by_id(
+            owner_id
+        )
+        if user.limits_overrides and "max_chunks" in user.limits_overrides:
+            max_chunks = user.limits_overrides["max_chunks"]
+        return max_chunks
+
+    async def ingest_chunk_stream(
+        self,
+        document_info: DocumentResponse,
+        chunks: AsyncIterable[DocumentChunk],
+        summarize: bool = True,
+        embedding_batch_size: int = 8,
+        storage_batch_size: int = 128,
+    ) -> None:
+        """Embeds and stores a stream of chunks as connected stages.
+
+        Parsing, embedding and storage run concurrently and are linked by
+        bounded queues, so a slow stage holds back the ones before it and
+        only a few batches are held in memory at any time, regardless of
+        the document size. Embedded chunks are written to the database as
+        soon as `storage_batch_size` of them are ready.
+
+        Also counts the document's tokens and, with `summarize`, generates
+        the document summary from the first chunks while the rest of the
+        document is still being processed.
+        """
+        pipeline_settings = self.config.ingestion.pipeline_settings
+        workers = pipeline_settings.embed_workers
+        embed_queue: asyncio.Queue[Optional[list[DocumentChunk]]] = (
+            asyncio.Queue(maxsize=pipeline_settings.queue_depth)
+        )
+        store_queue: asyncio.Queue[Optional[list[VectorEntry]]] = (
+            asyncio.Queue(maxsize=pipeline_settings.queue_depth)
+        )
+        summary_chunks: list[dict] = []
+        summary_task: Optional[asyncio.Task] = None
+        total_tokens = 0
+
+        def start_summary() -> None:
+            nonlocal summary_task
+            if summarize and summary_task is None and summary_chunks:
+                summary_task = asyncio.create_task(
+                    self.augment_document_info(document_info, summary_chunks)
+                )
+
+        async def parse_stage() -> None:
+            nonlocal total_tokens
+            batch: list[DocumentChunk] = []
+            async for chunk in chunks:
+                text = (
+                    chunk.data.decode("utf-8", errors="ignore")
+                    if isinstance(chunk.data, bytes)
+                    else chunk.data
+                )
+                # Token chunking already counted the chunk's tokens
+                total_tokens += (
+                    chunk.token_count
+                    if chunk.token_count is not None
+                    else count_tokens(
+                        text, self.config.ingestion.tokenizer_model
+                    )
+                )
+                if (
+                    len(summary_chunks)
+                    < self.config.ingestion.chunks_for_document_summary
+                ):
+                    summary_chunks.append({"data": text})
+                    if (
+                        len(summary_chunks)
+                        == self.config.ingestion.chunks_for_document_summary
+                    ):
+                        start_summary()
+
+                batch.append(chunk)
+                if len(batch) >= embedding_batch_size:
+                    await embed_queue.put(batch)
+                    batch = []
+            if batch:
+                await embed_queue.put(batch)
+            start_summary()
+            for _ in range(workers):
+                await embed_queue.put(None)
+
+        async def embed_worker() -> None:
+            while (batch := await embed_queue.get()) is not None:
+                await store_queue.put(await self._embed_chunks(batch))
+
+        async def embed_stage() -> None:
+            await asyncio.gather(*(embed_worker() for _ in range(workers)))
+            await store_queue.put(None)
+
+        async def store_stage() -> None:
+            quota = _ChunkQuota()
+            pending: list[VectorEntry] = []
+            while (entries := await store_queue.get()) is not None:
+                pending.extend(entries)
+                if len(pending) >= storage_batch_size:
+                    await self._drain(
+                        self.store_embeddings(pending, chunk_quota=quota)
+                    )
+                    pending = []
+            if pending:
+                await self._drain(
+                    self.store_embeddings(pending, chunk_quota=quota)
+                )
+
+        await self.update_document_status(
+            document_info, status=IngestionStatus.EMBEDDING
+        )
+        stages = [
+            asyncio.create_task(stage())
+            for stage in (parse_stage, embed_stage, store_stage)
+        ]
+        try:
+            await asyncio.gather(*stages)
+            if summary_task is not None:
+                if not summary_task.done():
+                    await self.update_document_status(
+                        document_info, status=IngestionStatus.AUGMENTING
+                    )
+                await summary_task
+        except BaseException:
+            for task in [*stages, summary_task]:
+                if task is not None:
+                    task.cancel()
+            await asyncio.gather(
+                *(t for t in [*stages, summary_task] if t is not None),
+                return_exceptions=True,
+            )
+            raise
+
+        document_info.total_tokens = total_tokens
+
+    @staticmethod
+    async def _drain(messages: AsyncGenerator[str, None]) -> None:
+        async for _ in messages:
+            pass
+
     async def finalize_ingestion(
         self, document_info: DocumentResponse
     ) -> None:
@@ -819,9 +1005,7 @@ class IngestionService:
         )
 
         # Insert the newly enriched entries
-        await self.providers.database.chunks_handler.upsert_entries(
-            new_vector_entries
-        )
+        await self._upsert_vector_entries(new_vector_entries)
         return len(new_vector_entries)
 
     async def list_chunks(
@@ -840,6 +1024,20 @@ class IngestionService:
             include_vectors=include_vectors,
         )
 
+    def stream_chunks(
+        self,
+        offset: int,
+        limit: Optional[int],
+        filters: Optional[dict[str, Any]] = None,
+        include_vectors: bool = False,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        return self.providers.database.chunks_handler.stream_chunks(
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include_vectors=include_vectors,
+        )
+
     async def get_chunk(
         self,
         chunk_id: UUID,
@@ -23,6 +23,7 @@ from core.base import (
     AggregateSearchResult,
     ChunkSearchResult,
     DocumentResponse,
+    EmbeddingPurpose,
     GenerationConfig,
     GraphCommunityResult,
     GraphEntityResult,
@@ -273,8 +274,107 @@ class RetrievalService(Service):
             # 'vanilla', 'basic', or anything else...
             return await self._basic_search(query, search_settings)
 
+    async def search_many(
+        self,
+        queries: list[str],
+        search_settings: list[SearchSettings],
+        max_concurrency: int = 8,
+    ) -> list[AggregateSearchResult]:
+        """
+        Run several independent searches in one call.
+
+        Queries using the vanilla strategy are embedded with a single
+        provider request and then searched concurrently with the
+        precomputed vectors; hyde / rag_fusion queries go through `search`.
+        Results are returned in the same order as `queries`.
+        """
+        if len(queries) != len(search_settings):
+            raise ValueError(
+                "search_many requires one SearchSettings per query"
+            )
+
+        embed_indices = [
+            i
+            for i, settings in enumerate(search_settings)
+            if settings.search_strategy.lower() not in ("hyde", "rag_fusion")
+            and self._needs_query_vector(settings)
+        ]
+        vectors: list[Optional[list[float]]] = [None] * len(queries)
+        if embed_indices:
+            embeddings = (
+                await self.providers.completion_embedding.async_get_embeddings(
+                    [queries[i] for i in embed_indices],
+                    purpose=EmbeddingPurpose.QUERY,
+                )
+            )
+            for i, embedding in zip(embed_indices, embeddings, strict=True):
+                vectors[i] = embedding
+
+        searches = []
+        for query, settings, vector in zip(
+            queries, search_settings, vectors, strict=True
+        ):
+            if vector is None:
+                searches.append(self.search(query, settings))
+            else:
+                searches.append(self._basic_search(query, settings, vector))
+
+        return await self._gather_bounded(searches, max_concurrency)
+
+    async def stream_search(
+        self,
+        query: str,
+        search_settings: SearchSettings,
+    ) -> AsyncGenerator[ChunkSearchResult, None]:
+        """
+        Prepare a streaming chunk search for export-style, large limits.
+
+        The settings are validated and the query embedded before the
+        results generator is returned, so errors surface before a caller
+        starts its response. Each search leg is read through a server-side
+        cursor and results are yielded in rank order without re-ranking;
+        hybrid search keeps only chunk ids in memory while fusing.
+        """
+        use_hybrid = search_settings.use_hybrid_search or (
+            search_settings.use_fulltext_search
+            and search_settings.use_semantic_search
+        )
+        if not (
+            use_hybrid
+            or search_settings.use_semantic_search
+            or search_settings.use_fulltext_search
+        ):
+            raise ValueError(
+                "At least one of use_fulltext_search or use_semantic_search must be True"
+            )
+
+        chunks_handler = self.providers.database.chunks_handler
+        if not use_hybrid and search_settings.use_fulltext_search:
+            return chunks_handler.stream_full_text_search(
+                query_text=query, search_settings=search_settings
+            )
+
+        query_vector = (
+            await self.providers.completion_embedding.async_get_embedding(
+                query,
+                purpose=EmbeddingPurpose.QUERY,
+            )
+        )
+        if use_hybrid:
+            return chunks_handler.stream_hybrid_search(
+                query_text=query,
+                query_vector=query_vector,
+                search_settings=search_settings,
+            )
+        return chunks_handler.stream_semantic_search(
+            query_vector=query_vector, search_settings=search_settings
+        )
+
     async def _basic_search(
-        self, query: str, search_settings: SearchSettings
+        self,
+        query: str,
+        search_settings: SearchSettings,
+        precomputed_vector: Optional[list[float]] = None,
     ) -> AggregateSearchResult:
         """
         1) Possibly embed the query (if semantic or hybrid).
@@ -283,14 +383,15 @@ class RetrievalService(Service):
         4) Combine into an AggregateSearchResult.
         """
         # -- 1) Possibly embed the query
-        query_vector = None
-        if (
+        query_vector = precomputed_vector
+        if query_vector is None and (
             search_settings.use_semantic_search
             or search_settings.use_hybrid_search
         ):
             query_vector = (
                 await self.providers.completion_embedding.async_get_embedding(
-                    query  # , EmbeddingPurpose.QUERY
+                    query,
+                    purpose=EmbeddingPurpose.QUERY,
                 )
             )
 
@@ -347,16 +448,23 @@ class RetrievalService(Service):
         #    We’ll store them in a structure so we can fuse them.
         #    chunk_results_list is a list of lists of ChunkSearchResult
         #    graph_results_list is a list of lists of GraphSearchResult
-        chunk_results_list = []
-        graph_results_list = []
-
-        for sq in sub_queries:
-            # Recompute or reuse the embedding if desired
-            # (You could do so, but not mandatory if you have a local approach)
-            # chunk + graph search
-            aggr = await self._basic_search(sq, search_settings)
-            chunk_results_list.append(aggr.chunk_search_results)
-            graph_results_list.append(aggr.graph_search_results)
+        #    All sub-queries are embedded in one request and searched
+        #    concurrently; gather keeps the results in sub-query order so the
+        #    fused ranking is unchanged.
+        sub_query_vectors = await self._embed_sub_queries(
+            sub_queries, search_settings
+        )
+        aggregates = await self._gather_bounded(
+            [
+                self._basic_search(sq, search_settings, vector)
+                for sq, vector in zip(
+                    sub_queries, sub_query_vectors, strict=True
+                )
+            ],
+            search_settings.sub_query_concurrency,
+        )
+        chunk_results_list = [aggr.chunk_search_results for aggr in aggregates]
+        graph_results_list = [aggr.graph_search_results for aggr in aggregates]
 
         # 3) Fuse the chunk results and fuse the graph results.
         #    We'll use a simple RRF approach: each sub-query's result list
@@ -397,6 +505,39 @@ class RetrievalService(Service):
             graph_search_results=fused_graph_results,
         )
 
+    async def _embed_sub_queries(
+        self, texts: list[str], search_settings: SearchSettings
+    ) -> list[Optional[list[float]]]:
+        """
+        Embed all sub-queries / hypothetical docs in a single request.
+        Returns `None` per text when no search leg needs a vector.
+        """
+        if not texts or not self._needs_query_vector(search_settings):
+            return [None] * len(texts)
+        return await self.providers.completion_embedding.async_get_embeddings(
+            texts,
+            purpose=EmbeddingPurpose.QUERY,
+        )
+
+    @staticmethod
+    def _needs_query_vector(search_settings: SearchSettings) -> bool:
+        return (
+            search_settings.use_semantic_search
+            or search_settings.use_hybrid_search
+            or search_settings.graph_settings.enabled
+        )
+
+    @staticmethod
+    async def _gather_bounded(coros: list, limit: int) -> list:
+        """asyncio.gather with at most `limit` coroutines in flight."""
+        semaphore = asyncio.Semaphore(max(limit, 1))
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros))
+
     async def _generate_similar_queries(
         self, query: str, num_sub_queries: int = 2
     ) -> list[str]:
@@ -563,21 +704,27 @@ class RetrievalService(Service):
         chunk_all = []
         graph_all = []
 
-        # We'll gather the per-doc searches in parallel
-        tasks = []
-        for hypothetical_text in hyde_docs:
-            tasks.append(
-                asyncio.create_task(
-                    self._fanout_chunk_and_graph_search(
-                        user_text=query,  # The user’s original query
-                        alt_text=hypothetical_text,  # The hypothetical doc
-                        search_settings=search_settings,
-                    )
-                )
-            )
+        # Embed every hypothetical doc in one request, then run the per-doc
+        # searches in parallel
+        hyde_vectors = await self._embed_sub_queries(
+            hyde_docs, search_settings
+        )
 
         # 2) Wait for them all
-        results_list = await asyncio.gather(*tasks)
+        results_list = await self._gather_bounded(
+            [
+                self._fanout_chunk_and_graph_search(
+                    user_text=query,  # The user’s original query
+                    alt_text=hypothetical_text,  # The hypothetical doc
+                    search_settings=search_settings,
+                    precomputed_vector=vector,
+                )
+                for hypothetical_text, vector in zip(
+                    hyde_docs, hyde_vectors, strict=True
+                )
+            ],
+            search_settings.sub_query_concurrency,
+        )
         # each item in results_list is a tuple: (chunks, graphs)
 
         # Flatten chunk+graph results
@@ -613,15 +760,21 @@ class RetrievalService(Service):
         user_text: str,
         alt_text: str,
         search_settings: SearchSettings,
+        precomputed_vector: Optional[list[float]] = None,
     ) -> tuple[list[ChunkSearchResult], list[GraphSearchResult]]:
         """
         1) embed alt_text (HyDE doc or sub-query, etc.)
         2) chunk search + graph search with that embedding
         """
         # Precompute the embedding of alt_text
-        vec = await self.providers.completion_embedding.async_get_embedding(
-            alt_text  # , EmbeddingPurpose.QUERY
-        )
+        vec = precomputed_vector
+        if vec is None:
+            vec = (
+                await self.providers.completion_embedding.async_get_embedding(
+                    alt_text,
+                    purpose=EmbeddingPurpose.QUERY,
+                )
+            )
 
         # chunk search
         chunk_results = []
@@ -666,7 +819,8 @@ class RetrievalService(Service):
         ):
             query_vector = (
                 await self.providers.completion_embedding.async_get_embedding(
-                    query_text  # , EmbeddingPurpose.QUERY
+                    query_text,
+                    purpose=EmbeddingPurpose.QUERY,
                 )
             )
 
@@ -753,130 +907,119 @@ class RetrievalService(Service):
         base_limit = search_settings.limit
         graph_limits = search_settings.graph_settings.limits or {}
 
-        # Entity search
-        entity_limit = graph_limits.get("entities", base_limit)
-        entity_cursor = self.providers.database.graphs_handler.graph_search(
-            query_text,
-            search_type="entities",
-            limit=entity_limit,
-            query_embedding=query_embedding,
-            property_names=["name", "description", "id"],
-            filters=search_settings.filters,
+        # 2) Entity, relationship and community searches are independent
+        #    vector scans, so issue them concurrently and keep the
+        #    entities -> relationships -> communities ordering in the output.
+        legs = await asyncio.gather(
+            self._graph_search_leg(
+                query_text=query_text,
+                query_embedding=query_embedding,
+                search_settings=search_settings,
+                search_type="entities",
+                limit=graph_limits.get("entities", base_limit),
+                property_names=["name", "description", "id"],
+            ),
+            self._graph_search_leg(
+                query_text=query_text,
+                query_embedding=query_embedding,
+                search_settings=search_settings,
+                search_type="relationships",
+                limit=graph_limits.get("relationships", base_limit),
+                property_names=[
+                    "id",
+                    "subject",
+                    "predicate",
+                    "object",
+                    "description",
+                    "subject_id",
+                    "object_id",
+                ],
+            ),
+            self._graph_search_leg(
+                query_text=query_text,
+                query_embedding=query_embedding,
+                search_settings=search_settings,
+                search_type="communities",
+                limit=graph_limits.get("communities", base_limit),
+                property_names=[
+                    "id",
+                    "name",
+                    "summary",
+                ],
+            ),
         )
-        async for ent in entity_cursor:
-            score = ent.get("similarity_score")
-            metadata = ent.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except Exception as e:
-                    pass
+        for leg in legs:
+            results.extend(leg)
 
-            results.append(
-                GraphSearchResult(
-                    id=ent.get("id", None),
-                    content=GraphEntityResult(
-                        name=ent.get("name", ""),
-                        description=ent.get("description", ""),
-                        id=ent.get("id", None),
-                    ),
-                    result_type=GraphSearchResultType.ENTITY,
-                    score=score if search_settings.include_scores else None,
-                    metadata=(
-                        {
-                            **(metadata or {}),
-                            "associated_query": query_text,
-                        }
-                        if search_settings.include_metadatas
-                        else {}
-                    ),
-                )
-            )
+        return results
 
-        # Relationship search
-        rel_limit = graph_limits.get("relationships", base_limit)
-        rel_cursor = self.providers.database.graphs_handler.graph_search(
+    async def _graph_search_leg(
+        self,
+        query_text: str,
+        query_embedding: list[float],
+        search_settings: SearchSettings,
+        search_type: str,
+        limit: int,
+        property_names: list[str],
+    ) -> list[GraphSearchResult]:
+        """
+        Run one graph search (entities, relationships or communities) and
+        convert each row into a GraphSearchResult as it is read.
+        """
+        results: list[GraphSearchResult] = []
+        cursor = self.providers.database.graphs_handler.graph_search(
             query_text,
-            search_type="relationships",
-            limit=rel_limit,
+            search_type=search_type,
+            limit=limit,
             query_embedding=query_embedding,
-            property_names=[
-                "id",
-                "subject",
-                "predicate",
-                "object",
-                "description",
-                "subject_id",
-                "object_id",
-            ],
+            property_names=property_names,
             filters=search_settings.filters,
         )
-        async for rel in rel_cursor:
-            score = rel.get("similarity_score")
-            metadata = rel.get("metadata", {})
+        async for row in cursor:
+            score = row.get("similarity_score")
+            metadata = row.get("metadata", {})
             if isinstance(metadata, str):
                 try:
                     metadata = json.loads(metadata)
                 except Exception as e:
                     pass
 
-            results.append(
-                GraphSearchResult(
-                    id=ent.get("id", None),
-                    content=GraphRelationshipResult(
-                        id=rel.get("id", None),
-                        subject=rel.get("subject", ""),
-                        predicate=rel.get("predicate", ""),
-                        object=rel.get("object", ""),
-                        subject_id=rel.get("subject_id", None),
-                        object_id=rel.get("object_id", None),
-                        description=rel.get("description", ""),
-                    ),
-                    result_type=GraphSearchResultType.RELATIONSHIP,
-                    score=score if search_settings.include_scores else None,
-                    metadata=(
-                        {
-                            **(metadata or {}),
-                            "associated_query": query_text,
-                        }
-                        if search_settings.include_metadatas
-                        else {}
-                    ),
-                )
+            content: (
+                GraphEntityResult
+                | GraphRelationshipResult
+                | GraphCommunityResult
             )
-
-        # Community search
-        comm_limit = graph_limits.get("communities", base_limit)
-        comm_cursor = self.providers.database.graphs_handler.graph_search(
-            query_text,
-            search_type="communities",
-            limit=comm_limit,
-            query_embedding=query_embedding,
-            property_names=[
-                "id",
-                "name",
-                "summary",
-            ],
-            filters=search_settings.filters,
-        )
-        async for comm in comm_cursor:
-            score = comm.get("similarity_score")
-            metadata = comm.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except Exception as e:
-                    pass
+            if search_type == "entities":
+                content = GraphEntityResult(
+                    name=row.get("name", ""),
+                    description=row.get("description", ""),
+                    id=row.get("id", None),
+                )
+                result_type = GraphSearchResultType.ENTITY
+            elif search_type == "relationships":
+                content = GraphRelationshipResult(
+                    id=row.get("id", None),
+                    subject=row.get("subject", ""),
+                    predicate=row.get("predicate", ""),
+                    object=row.get("object", ""),
+                    subject_id=row.get("subject_id", None),
+                    object_id=row.get("object_id", None),
+                    description=row.get("description", ""),
+                )
+                result_type = GraphSearchResultType.RELATIONSHIP
+            else:
+                content = GraphCommunityResult(
+                    id=row.get("id", None),
+                    name=row.get("name", ""),
+                    summary=row.get("summary", ""),
+                )
+                result_type = GraphSearchResultType.COMMUNITY
 
             results.append(
                 GraphSearchResult(
-                    id=ent.get("id", None),
-                    content=GraphCommunityResult(
-                        id=comm.get("id", None),
-                        name=comm.get("name", ""),
-                        summary=comm.get("summary", ""),
-                    ),
-                    result_type=GraphSearchResultType.COMMUNITY,
+                    id=row.get("id", None),
+                    content=content,
+                    result_type=result_type,
                     score=score if search_settings.include_scores else None,
                     metadata=(
                         {
@@ -955,6 +1098,27 @@ class RetrievalService(Service):
         )
         return result
 
+    async def evaluate_quantized_search(
+        self,
+        queries: list[str],
+        search_settings: SearchSettings,
+        oversampling_factors: list[int],
+    ) -> list[dict[str, Any]]:
+        """Compares INT1 search at each oversampling factor with an exact
+        scan, for a sample of queries.
+
+        Returns one entry per factor with the mean recall and latencies,
+        see `PostgresChunksHandler.evaluate_quantized_search`.
+        """
+        query_vectors = (
+            await self.providers.completion_embedding.async_get_embeddings(
+                queries
+            )
+        )
+        return await self.providers.database.chunks_handler.evaluate_quantized_search(
+            query_vectors, search_settings, oversampling_factors
+        )
+
     async def completion(
         self,
         messages: list[dict],
@@ -1,6 +1,6 @@
 # type: ignore
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 from docx import Document
 
@@ -26,6 +26,13 @@ class DOCXParser(AsyncParser[str | bytes]):
         self.config = config
         self.Document = Document
 
+    @staticmethod
+    def extract(data: bytes) -> Iterator[str]:
+        """Extract the text of each paragraph."""
+        doc = Document(BytesIO(data))
+        for paragraph in doc.paragraphs:
+            yield paragraph.text
+
     async def ingest(
         self, data: str | bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:  # type: ignore
@@ -33,6 +40,5 @@ class DOCXParser(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("DOCX data must be in bytes format.")
 
-        doc = self.Document(BytesIO(data))
-        for paragraph in doc.paragraphs:
-            yield paragraph.text
+        for text in self.extract(data):
+            yield text
@@ -7,7 +7,7 @@ import string
 import time
 import unicodedata
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Iterator, Optional
 
 import pymupdf
 from pypdf import PdfReader
@@ -18,6 +18,7 @@ from core.base.providers import (
     CompletionProvider,
     DatabaseProvider,
     IngestionConfig,
+    VLMParsingSettings,
 )
 
 logger = logging.getLogger()
@@ -165,10 +166,89 @@ class VLMPDFParser(AsyncParser[str | bytes]):
                 "content": f"Error processing page: {str(e)}",
             }
 
+    @staticmethod
+    def render(
+        data: str | bytes,
+        dpi: int = 150,
+        min_text_characters: Optional[int] = None,
+        min_text_ratio: float = 0.0,
+    ) -> Iterator[tuple[int, Optional[bytes], Optional[str]]]:
+        """Yields `(page_number, image, text)` for each page, with
+        1-indexed page numbers and the page rendered to a JPEG image.
+
+        With `min_text_characters`, pages that have no images and a good
+        text layer are yielded with their text instead of an image.
+        """
+        if isinstance(data, str):
+            doc = pymupdf.open(data)
+        else:
+            doc = pymupdf.open(stream=data, filetype="pdf")
+        with doc:
+            for page_idx, page in enumerate(doc):
+                if min_text_characters is not None:
+                    text = VLMPDFParser._text_layer(
+                        page, min_text_characters, min_text_ratio
+                    )
+                    if text is not None:
+                        yield page_idx + 1, None, text
+                        continue
+                image = page.get_pixmap(dpi=dpi).tobytes("jpeg")
+                yield page_idx + 1, image, None
+
+    @staticmethod
+    def _text_layer(
+        page, min_characters: int, min_ratio: float
+    ) -> Optional[str]:
+        """Returns the cleaned up text of a page, or None when the page has
+        images or its text layer is short or mostly unusable characters."""
+        if page.get_images():
+            return None
+        text = page.get_text()
+        kept = BasicPDFParser.clean_text(text)
+        if len(kept.strip()) < min_characters or len(kept) < min_ratio * len(
+            text
+        ):
+            return None
+        return kept.strip()
+
+    async def _iter_pages(
+        self, data: str | bytes, settings: VLMParsingSettings
+    ) -> AsyncIterator[tuple[int, Optional[bytes], Optional[str]]]:
+        options = {"dpi": settings.render_dpi}
+        if settings.skip_pages_with_text:
+            options["min_text_characters"] = settings.min_text_characters
+            options["min_text_ratio"] = settings.min_text_ratio
+        # Render in a thread rather than a parser worker: the renderer
+        # waits on the model most of the time and would hold the worker
+        # for the whole transcription
+        pages = self.render(data, **options)
+        while (page := await asyncio.to_thread(next, pages, None)) is not None:
+            yield page
+
+    async def _transcribe(
+        self,
+        semaphore: asyncio.Semaphore,
+        page_number: int,
+        image: Optional[bytes],
+        text: Optional[str],
+    ) -> str:
+        if image is None:
+            return text
+        async with semaphore:
+            result = await self.process_page(image, page_number)
+        return result.get("content", "") or ""
+
     async def ingest(
         self, data: str | bytes, maintain_order: bool = True, **kwargs
     ) -> AsyncGenerator[dict[str, str | int], None]:
-        """Process PDF with PyMuPDF for better performance."""
+        """Transcribes each page of a PDF with the vision model.
+
+        Pages are rendered one at a time in a thread while earlier pages
+        are with the model. Up to
+        `max_concurrent_requests` pages are transcribed at a time and
+        results are yielded in page order as soon as they are ready.
+        Rendering pauses once `max_buffered_pages` more pages are waiting.
+        """
         ingest_start = time.perf_counter()
         logger.info("Starting PDF ingestion using VLMPDFParser with PyMuPDF.")
 
@@ -180,68 +260,84 @@ class VLMPDFParser(AsyncParser[str | bytes]):
             )
             logger.info("Retrieved vision prompt text from database.")
 
+        settings = self.config.vlm_parsing_settings
+        semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        window = settings.max_concurrent_requests + settings.max_buffered_pages
+        # Pages that are rendered but not yet yielded, by page number
+        pending: dict[int, asyncio.Task] = {}
+        next_page = 1
+        skipped = 0
         try:
-            # Use a batch approach for better performance
-            batch_size = 20
-
-            # Open PDF document with PyMuPDF
-            if isinstance(data, str):
-                doc = pymupdf.open(data)
-            else:
-                doc = pymupdf.open(stream=data, filetype="pdf")
-
-            max_pages = len(doc)
-            logger.info(f"PDF has {max_pages} pages to process")
-
-            # Process in batches
-            for batch_start in range(0, max_pages, batch_size):
-                batch_end = min(batch_start + batch_size, max_pages)
-                logger.info(
-                    f"Processing batch: pages {batch_start + 1}-{batch_end}/{max_pages}"
+            async for page_number, image, text in self._iter_pages(
+                data, settings
+            ):
+                skipped += image is None
+                pending[page_number] = asyncio.create_task(
+                    self._transcribe(semaphore, page_number, image, text)
                 )
-
-                # Create tasks for this batch
-                batch_tasks = []
-                for page_idx in range(batch_start, batch_end):
-                    page_num = page_idx + 1  # 1-indexed page numbers
-
-                    # Get page pixmap (render the page)
-                    page = doc[page_idx]
-                    pix = page.get_pixmap(dpi=150)
-
-                    # Convert to JPEG bytes directly
-                    img_data = pix.tobytes("jpeg")
-
-                    # Create task for processing this page
-                    batch_tasks.append(self.process_page(img_data, page_num))
-
-                # Process the batch concurrently
-                batch_results = await asyncio.gather(*batch_tasks)
-
-                # Yield results
-                for page_idx, result in enumerate(batch_results):
-                    page_num = batch_start + page_idx + 1
+                while next_page in pending and (
+                    len(pending) >= window or pending[next_page].done()
+                ):
                     yield {
-                        "content": result.get("content", "") or "",
-                        "page_number": page_num,
+                        "content": await pending.pop(next_page),
+                        "page_number": next_page,
                     }
+                    next_page += 1
+            while next_page in pending:
+                yield {
+                    "content": await pending.pop(next_page),
+                    "page_number": next_page,
+                }
+                next_page += 1
+        except Exception as e:
+            logger.error(f"Error processing PDF: {str(e)}")
+            raise
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+        total_elapsed = time.perf_counter() - ingest_start
+        logger.info(
+            f"Completed PDF ingestion of {next_page - 1} pages, "
+            f"{skipped} from their text layer, in {total_elapsed:.2f} seconds"
+        )
 
-                # Force garbage collection after each batch
-                import gc
 
-                gc.collect()
+# Unicode categories of the letters and numbers kept in PDF text
+KEPT_CATEGORIES = frozenset({"Ll", "Lu", "Lt", "Lm", "Lo", "Nl", "No"})
+# Scripts whose characters are all kept, including punctuation and marks
+KEPT_RANGES = [
+    ("\u4e00", "\u9fff"),  # Chinese characters
+    ("\u0600", "\u06ff"),  # Arabic characters
+    ("\u0400", "\u04ff"),  # Cyrillic letters
+    ("\u0370", "\u03ff"),  # Greek letters
+    ("\u0e00", "\u0e7f"),  # Thai
+    ("\u3040", "\u309f"),  # Japanese Hiragana
+    ("\u30a0", "\u30ff"),  # Katakana
+]
+
+
+class _CleaningTable(dict):
+    """A `str.translate` table that drops characters which are neither
+    letters or numbers, in one of `KEPT_RANGES`, nor in
+    `string.printable`.
+
+    Each character is classified the first time it is seen, so cleaning a
+    page costs a lookup per character after the first few pages.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        kept = (
+            char in string.printable
+            or unicodedata.category(char) in KEPT_CATEGORIES
+            or any(first <= char <= last for first, last in KEPT_RANGES)
+        )
+        self[codepoint] = codepoint if kept else None
+        return self[codepoint]
 
-            # Close the document
-            doc.close()
 
-            total_elapsed = time.perf_counter() - ingest_start
-            logger.info(
-                f"Completed PDF ingestion in {total_elapsed:.2f} seconds"
-            )
-
-        except Exception as e:
-            logger.error(f"Error processing PDF: {str(e)}")
-            raise
+_CLEANING_TABLE = _CleaningTable()
 
 
 class BasicPDFParser(AsyncParser[str | bytes]):
@@ -258,42 +354,64 @@ class BasicPDFParser(AsyncParser[str | bytes]):
         self.config = config
         self.PdfReader = PdfReader
 
+    def extract_options(self, **overrides: Any) -> dict[str, str]:
+        return {
+            "extractor": overrides.get(
+                "pdf_text_extractor", self.config.pdf_text_extractor
+            )
+        }
+
+    @staticmethod
+    def clean_text(text: str) -> str:
+        """Keep letters, numbers and printable characters in common
+        languages."""
+        return text.translate(_CLEANING_TABLE)
+
+    @staticmethod
+    def count_pages(data: bytes, extractor: str = "pypdf") -> int:
+        if extractor == "pymupdf":
+            with pymupdf.open(stream=data, filetype="pdf") as doc:
+                return len(doc)
+        return len(PdfReader(BytesIO(data)).pages)
+
+    @staticmethod
+    def _iter_page_text(
+        data: bytes, start: int, end: Optional[int], extractor: str
+    ) -> Iterator[Optional[str]]:
+        if extractor == "pymupdf":
+            with pymupdf.open(stream=data, filetype="pdf") as doc:
+                end = len(doc) if end is None else min(end, len(doc))
+                for page_idx in range(start, end):
+                    yield doc[page_idx].get_text()
+        elif extractor == "pypdf":
+            pdf = PdfReader(BytesIO(data))
+            end = len(pdf.pages) if end is None else min(end, len(pdf.pages))
+            for page_idx in range(start, end):
+                yield pdf.pages[page_idx].extract_text()
+        else:
+            raise ValueError(f"Unsupported PDF text extractor: {extractor}")
+
+    @classmethod
+    def extract(
+        cls,
+        data: bytes,
+        start: int = 0,
+        end: Optional[int] = None,
+        extractor: str = "pypdf",
+    ) -> Iterator[str]:
+        """Extract the text of pages `start` to `end`, or of every page."""
+        for page_text in cls._iter_page_text(data, start, end, extractor):
+            if page_text is not None:
+                yield cls.clean_text(page_text)
+
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest PDF data and yield text from each page."""
         if isinstance(data, str):
             raise ValueError("PDF data must be in bytes format.")
-        pdf = self.PdfReader(BytesIO(data))
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text is not None:
-                page_text = "".join(
-                    filter(
-                        lambda x: (
-                            unicodedata.category(x)
-                            in [
-                                "Ll",
-                                "Lu",
-                                "Lt",
-                                "Lm",
-                                "Lo",
-                                "Nl",
-                                "No",
-                            ]  # Keep letters and numbers
-                            or "\u4e00" <= x <= "\u9fff"  # Chinese characters
-                            or "\u0600" <= x <= "\u06ff"  # Arabic characters
-                            or "\u0400" <= x <= "\u04ff"  # Cyrillic letters
-                            or "\u0370" <= x <= "\u03ff"  # Greek letters
-                            or "\u0e00" <= x <= "\u0e7f"  # Thai
-                            or "\u3040" <= x <= "\u309f"  # Japanese Hiragana
-                            or "\u30a0" <= x <= "\u30ff"  # Katakana
-                            or x in string.printable
-                        ),
-                        page_text,
-                    )
-                )  # Keep characters in common languages ; # Filter out non-printable characters
-                yield page_text
+        for page_text in self.extract(data, **self.extract_options(**kwargs)):
+            yield page_text
 
 
 class PDFParserUnstructured(AsyncParser[str | bytes]):
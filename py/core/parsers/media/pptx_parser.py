@@ -1,6 +1,6 @@
 # type: ignore
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 from pptx import Presentation
 
@@ -26,6 +26,15 @@ class PPTXParser(AsyncParser[str | bytes]):
         self.config = config
         self.Presentation = Presentation
 
+    @staticmethod
+    def extract(data: bytes) -> Iterator[str]:
+        """Extract the text of each shape on each slide."""
+        prs = Presentation(BytesIO(data))
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                if hasattr(shape, "text"):
+                    yield shape.text
+
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:  # type: ignore
@@ -33,8 +42,5 @@ class PPTXParser(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("PPT data must be in bytes format.")
 
-        prs = self.Presentation(BytesIO(data))
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    yield shape.text
+        for text in self.extract(data):
+            yield text
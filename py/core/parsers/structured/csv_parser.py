@@ -1,7 +1,8 @@
 # type: ignore
-from typing import IO, AsyncGenerator, Optional
+from typing import IO, AsyncGenerator, AsyncIterable, Optional
 
 from core.base.parsers.base_parser import AsyncParser
+from core.base.parsers.streaming import iter_csv_rows
 from core.base.providers import (
     CompletionProvider,
     DatabaseProvider,
@@ -9,9 +10,11 @@ from core.base.providers import (
 )
 
 
-class CSVParser(AsyncParser[str | bytes]):
+class CSVParser(AsyncParser[str | bytes | AsyncIterable[bytes]]):
     """A parser for CSV data."""
 
+    supports_streaming = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -29,9 +32,14 @@ class CSVParser(AsyncParser[str | bytes]):
         self.StringIO = StringIO
 
     async def ingest(
-        self, data: str | bytes, *args, **kwargs
+        self, data: str | bytes | AsyncIterable[bytes], *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest CSV data and yield text from each row."""
+        if not isinstance(data, (str, bytes)):
+            async for row in iter_csv_rows(data):
+                yield ", ".join(row)
+            return
+
         if isinstance(data, bytes):
             data = data.decode("utf-8")
         csv_reader = self.csv.reader(self.StringIO(data))
@@ -1,6 +1,7 @@
 # type: ignore
 from email import message_from_bytes, policy
-from typing import AsyncGenerator
+from email.parser import BytesFeedParser
+from typing import AsyncGenerator, AsyncIterable
 
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
@@ -10,9 +11,11 @@ from core.base.providers import (
 )
 
 
-class EMLParser(AsyncParser[str | bytes]):
+class EMLParser(AsyncParser[str | bytes | AsyncIterable[bytes]]):
     """Parser for EML (email) files."""
 
+    supports_streaming = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -24,14 +27,21 @@ class EMLParser(AsyncParser[str | bytes]):
         self.config = config
 
     async def ingest(
-        self, data: str | bytes, **kwargs
+        self, data: str | bytes | AsyncIterable[bytes], **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest EML data and yield email content."""
         if isinstance(data, str):
             raise ValueError("EML data must be in bytes format.")
 
         # Parse email with policy for modern email handling
-        email_message = message_from_bytes(data, policy=policy.default)
+        if isinstance(data, bytes):
+            email_message = message_from_bytes(data, policy=policy.default)
+        else:
+            # Fed chunk by chunk, without joining the raw file first
+            feed_parser = BytesFeedParser(policy=policy.default)
+            async for chunk in data:
+                feed_parser.feed(chunk)
+            email_message = feed_parser.close()
 
         # Extract and yield email metadata
         metadata = []
@@ -1,6 +1,6 @@
 # type: ignore
 import logging
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 import epub
 
@@ -28,7 +28,8 @@ class EPUBParser(AsyncParser[str | bytes]):
         self.config = config
         self.epub = epub
 
-    def _safe_get_metadata(self, book, field: str) -> str | None:
+    @staticmethod
+    def _safe_get_metadata(book, field: str) -> str | None:
         """Safely extract metadata field from epub book."""
         try:
             return getattr(book, field, None) or getattr(book.opf, field, None)
@@ -36,7 +37,8 @@ class EPUBParser(AsyncParser[str | bytes]):
             logger.debug(f"Error getting {field} metadata: {e}")
             return None
 
-    def _clean_text(self, content: bytes) -> str:
+    @staticmethod
+    def _clean_text(content: bytes) -> str:
         """Clean HTML content and return plain text."""
         try:
             import re
@@ -53,19 +55,15 @@ class EPUBParser(AsyncParser[str | bytes]):
             logger.warning(f"Error cleaning text: {e}")
             return ""
 
-    async def ingest(
-        self, data: str | bytes, **kwargs
-    ) -> AsyncGenerator[str, None]:
-        """Ingest EPUB data and yield book content."""
-        if isinstance(data, str):
-            raise ValueError("EPUB data must be in bytes format.")
-
+    @classmethod
+    def extract(cls, data: bytes) -> Iterator[str]:
+        """Extract the book metadata and the text of each content item."""
         from io import BytesIO
 
         file_obj = BytesIO(data)
 
         try:
-            book = self.epub.open_epub(file_obj)
+            book = epub.open_epub(file_obj)
 
             # Safely extract metadata
             metadata = []
@@ -76,7 +74,7 @@ class EPUBParser(AsyncParser[str | bytes]):
                 ("publisher", "Publisher"),
                 ("date", "Date"),
             ]:
-                if value := self._safe_get_metadata(book, field):
+                if value := cls._safe_get_metadata(book, field):
                     metadata.append(f"{label}: {value}")
 
             if metadata:
@@ -92,7 +90,7 @@ class EPUBParser(AsyncParser[str | bytes]):
                             == "application/xhtml+xml"
                         ):
                             if content := book.read_item(item):
-                                if cleaned_text := self._clean_text(content):
+                                if cleaned_text := cls._clean_text(content):
                                     yield cleaned_text
                     except Exception as e:
                         logger.warning(f"Error processing item: {e}")
@@ -105,7 +103,7 @@ class EPUBParser(AsyncParser[str | bytes]):
                     for item_id in getattr(book, "items", []):
                         try:
                             if content := book.read_item(item_id):
-                                if cleaned_text := self._clean_text(content):
+                                if cleaned_text := cls._clean_text(content):
                                     yield cleaned_text
                         except Exception as e:
                             logger.warning(f"Error in fallback reading: {e}")
@@ -119,3 +117,13 @@ class EPUBParser(AsyncParser[str | bytes]):
                 file_obj.close()
             except Exception as e:
                 logger.warning(f"Error closing file: {e}")
+
+    async def ingest(
+        self, data: str | bytes, **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """Ingest EPUB data and yield book content."""
+        if isinstance(data, str):
+            raise ValueError("EPUB data must be in bytes format.")
+
+        for text in self.extract(data):
+            yield text
@@ -1,10 +1,11 @@
 # type: ignore
 import asyncio
 import json
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterable
 
 from core.base import R2RException
 from core.base.parsers.base_parser import AsyncParser
+from core.base.parsers.streaming import iter_lines
 from core.base.providers import (
     CompletionProvider,
     DatabaseProvider,
@@ -12,8 +13,14 @@ from core.base.providers import (
 )
 
 
-class JSONParser(AsyncParser[str | bytes]):
-    """A parser for JSON data."""
+class JSONParser(AsyncParser[str | bytes | AsyncIterable[bytes]]):
+    """A parser for JSON data.
+
+    Streamed input may also be JSON lines, one value per line, which is
+    parsed and yielded record by record.
+    """
+
+    supports_streaming = True
 
     def __init__(
         self,
@@ -26,13 +33,19 @@ class JSONParser(AsyncParser[str | bytes]):
         self.config = config
 
     async def ingest(
-        self, data: str | bytes, *args, **kwargs
+        self, data: str | bytes | AsyncIterable[bytes], *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest JSON data and yield a formatted text representation.
 
         :param data: The JSON data to parse.
         :param kwargs: Additional keyword arguments.
         """
+        chunk_size = kwargs.get("chunk_size")
+        if not isinstance(data, (str, bytes)):
+            async for text in self._ingest_stream(data, chunk_size):
+                yield text
+            return
+
         if isinstance(data, bytes):
             data = data.decode("utf-8")
 
@@ -49,7 +62,53 @@ class JSONParser(AsyncParser[str | bytes]):
                 status_code=400,
             ) from e
 
-        chunk_size = kwargs.get("chunk_size")
+        async for text in self._split(formatted_text, chunk_size):
+            yield text
+
+    async def _ingest_stream(
+        self, data: AsyncIterable[bytes], chunk_size
+    ) -> AsyncGenerator[str, None]:
+        lines = iter_lines(data)
+        head = ""
+        async for line in lines:
+            head += line
+            if line.strip():
+                break
+
+        try:
+            first_record = json.loads(head)
+        except json.JSONDecodeError:
+            # A document spanning several lines, parsed as a whole
+            async for line in lines:
+                head += line
+            async for text in self.ingest(head, chunk_size=chunk_size):
+                yield text
+            return
+
+        # JSON lines: every non-empty line holds one value
+        async for text in self._split(
+            self._parse_json(first_record), chunk_size
+        ):
+            yield text
+        async for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise R2RException(
+                    message=f"Failed to parse JSON data, likely due to invalid JSON: {str(e)}",
+                    status_code=400,
+                ) from e
+            async for text in self._split(
+                self._parse_json(record), chunk_size
+            ):
+                yield text
+
+    @staticmethod
+    async def _split(
+        formatted_text: str, chunk_size
+    ) -> AsyncGenerator[str, None]:
         if chunk_size and isinstance(chunk_size, int):
             # If chunk_size is provided and is an integer, yield the formatted text in chunks
             for i in range(0, len(formatted_text), chunk_size):
@@ -1,6 +1,6 @@
 # type: ignore
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 import networkx as nx
 import numpy as np
@@ -28,6 +28,14 @@ class XLSXParser(AsyncParser[str | bytes]):
         self.config = config
         self.load_workbook = load_workbook
 
+    @staticmethod
+    def extract(data: bytes) -> Iterator[str]:
+        """Extract the text of each row of each sheet."""
+        wb = load_workbook(filename=BytesIO(data))
+        for sheet in wb.worksheets:
+            for row in sheet.iter_rows(values_only=True):
+                yield ", ".join(map(str, row))
+
     async def ingest(
         self, data: bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
@@ -35,10 +43,8 @@ class XLSXParser(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("XLSX data must be in bytes format.")
 
-        wb = self.load_workbook(filename=BytesIO(data))
-        for sheet in wb.worksheets:
-            for row in sheet.iter_rows(values_only=True):
-                yield ", ".join(map(str, row))
+        for text in self.extract(data):
+            yield text
 
 
 class XLSXParserAdvanced(AsyncParser[str | bytes]):
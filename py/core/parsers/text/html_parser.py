@@ -1,9 +1,11 @@
 # type: ignore
-from typing import AsyncGenerator
+from html.parser import HTMLParser as _StdlibHTMLParser
+from typing import AsyncGenerator, AsyncIterable, Iterator
 
 from bs4 import BeautifulSoup
 
 from core.base.parsers.base_parser import AsyncParser
+from core.base.parsers.streaming import iter_text
 from core.base.providers import (
     CompletionProvider,
     DatabaseProvider,
@@ -11,9 +13,44 @@ from core.base.providers import (
 )
 
 
-class HTMLParser(AsyncParser[str | bytes]):
+class _TextCollector(_StdlibHTMLParser):
+    """Incremental text extraction matching `BeautifulSoup.get_text()`
+    with the `html.parser` builder: the contents of script, style and
+    template elements are skipped and CDATA sections are kept."""
+
+    SKIPPED_TAGS = {"script", "style", "template"}
+
+    def __init__(self):
+        super().__init__()
+        self.text: list[str] = []
+        self._skipped_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skipped_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skipped_depth:
+            self._skipped_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skipped_depth:
+            self.text.append(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA[") and not self._skipped_depth:
+            self.text.append(data[len("CDATA[") :])
+
+    def take_text(self) -> str:
+        text, self.text = "".join(self.text), []
+        return text
+
+
+class HTMLParser(AsyncParser[str | bytes | AsyncIterable[bytes]]):
     """A parser for HTML data."""
 
+    supports_streaming = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -24,9 +61,25 @@ class HTMLParser(AsyncParser[str | bytes]):
         self.llm_provider = llm_provider
         self.config = config
 
+    @staticmethod
+    def extract(data: str | bytes) -> Iterator[str]:
+        """Extract the text of the whole document."""
+        yield BeautifulSoup(data, "html.parser").get_text()
+
     async def ingest(
-        self, data: str | bytes, *args, **kwargs
+        self, data: str | bytes | AsyncIterable[bytes], *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest HTML data and yield text."""
-        soup = BeautifulSoup(data, "html.parser")
-        yield soup.get_text()
+        if isinstance(data, (str, bytes)):
+            for text in self.extract(data):
+                yield text
+            return
+
+        collector = _TextCollector()
+        async for markup in iter_text(data, errors="replace"):
+            collector.feed(markup)
+            if text := collector.take_text():
+                yield text
+        collector.close()
+        if text := collector.take_text():
+            yield text
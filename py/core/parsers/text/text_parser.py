@@ -1,7 +1,8 @@
 # type: ignore
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterable
 
 from core.base.parsers.base_parser import AsyncParser
+from core.base.parsers.streaming import iter_text
 from core.base.providers import (
     CompletionProvider,
     DatabaseProvider,
@@ -9,9 +10,14 @@ from core.base.providers import (
 )
 
 
-class TextParser(AsyncParser[str | bytes]):
+class TextParser(AsyncParser[str | bytes | AsyncIterable[bytes]]):
     """A parser for raw text data."""
 
+    supports_streaming = True
+    # Streamed text is yielded in blocks of at least this many characters,
+    # cut at a paragraph or line break where possible
+    block_size = 1024 * 1024
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -23,8 +29,28 @@ class TextParser(AsyncParser[str | bytes]):
         self.config = config
 
     async def ingest(
-        self, data: str | bytes, *args, **kwargs
+        self, data: str | bytes | AsyncIterable[bytes], *args, **kwargs
     ) -> AsyncGenerator[str | bytes, None]:
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
-        yield data
+        if isinstance(data, (str, bytes)):
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            yield data
+            return
+
+        pending = ""
+        async for text in iter_text(data):
+            pending += text
+            while len(pending) >= self.block_size:
+                cut = self._find_break(pending, self.block_size)
+                yield pending[:cut]
+                pending = pending[cut:]
+        if pending:
+            yield pending
+
+    @staticmethod
+    def _find_break(text: str, min_size: int) -> int:
+        for separator in ("\n\n", "\n"):
+            position = text.rfind(separator, min_size // 2)
+            if position != -1:
+                return position + len(separator)
+        return len(text)
@@ -149,28 +149,17 @@ class R2RAuthProvider(AuthProvider):
 
         Returns a User if successful, or raises R2RException if not.
         """
-        try:
-            key_id, raw_key = api_key.split(".", 1)
-        except ValueError as e:
+        if "." not in api_key:
             raise R2RException(
                 status_code=401, message="Invalid API key format"
-            ) from e
-
-        key_record = (
-            await self.database_provider.users_handler.get_api_key_record(
-                key_id=key_id
             )
-        )
-        if not key_record:
-            raise R2RException(status_code=401, message="Invalid API key")
 
-        if not self.crypto_provider.verify_api_key(
-            raw_api_key=raw_key, hashed_key=key_record["hashed_key"]
-        ):
+        user_id = await self._verify_api_key(api_key)
+        if user_id is None:
             raise R2RException(status_code=401, message="Invalid API key")
 
         user = await self.database_provider.users_handler.get_user_by_id(
-            id=key_record["user_id"]
+            id=user_id
         )
         if not user.is_active:
             raise R2RException(
@@ -365,9 +354,11 @@ class R2RAuthProvider(AuthProvider):
             )
 
         try:
-            password_verified = self.crypto_provider.verify_password(
-                plain_password=password,
-                hashed_password=user.hashed_password,
+            password_verified = (
+                await self.crypto_provider.async_verify_password(
+                    plain_password=password,
+                    hashed_password=user.hashed_password,
+                )
             )
         except Exception as e:
             logger.error(f"Error during password verification: {str(e)}")
@@ -436,7 +427,7 @@ class R2RAuthProvider(AuthProvider):
                 detail="Invalid password hash in database",
             )
 
-        if not self.crypto_provider.verify_password(
+        if not await self.crypto_provider.async_verify_password(
             plain_password=current_password,
             hashed_password=user.hashed_password,
         ):
@@ -444,8 +435,10 @@ class R2RAuthProvider(AuthProvider):
                 status_code=400, message="Incorrect current password"
             )
 
-        hashed_new_password = self.crypto_provider.get_password_hash(
-            password=new_password
+        hashed_new_password = (
+            await self.crypto_provider.async_get_password_hash(
+                password=new_password
+            )
         )
         await self.database_provider.users_handler.update_user_password(
             id=user.id,
@@ -517,8 +510,10 @@ class R2RAuthProvider(AuthProvider):
                 status_code=400, message="Invalid or expired reset token"
             )
 
-        hashed_new_password = self.crypto_provider.get_password_hash(
-            password=new_password
+        hashed_new_password = (
+            await self.crypto_provider.async_get_password_hash(
+                password=new_password
+            )
         )
         await self.database_provider.users_handler.update_user_password(
             id=user_id,
@@ -575,7 +570,7 @@ class R2RAuthProvider(AuthProvider):
         description: Optional[str] = None,
     ) -> dict[str, str]:
         key_id, raw_api_key = self.crypto_provider.generate_api_key()
-        hashed_key = self.crypto_provider.hash_api_key(raw_api_key)
+        hashed_key = await self.crypto_provider.async_hash_api_key(raw_api_key)
 
         api_key_uuid = (
             await self.database_provider.users_handler.store_user_api_key(
@@ -600,19 +595,25 @@ class R2RAuthProvider(AuthProvider):
         )
 
     async def delete_user_api_key(self, user_id: UUID, key_id: UUID) -> bool:
-        return await self.database_provider.users_handler.delete_api_key(
+        deleted = await self.database_provider.users_handler.delete_api_key(
             user_id=user_id,
             key_id=key_id,
         )
+        self.invalidate_api_key(key_id)
+        return deleted
 
     async def rename_api_key(
         self, user_id: UUID, key_id: UUID, new_name: str
     ) -> bool:
-        return await self.database_provider.users_handler.update_api_key_name(
-            user_id=user_id,
-            key_id=key_id,
-            name=new_name,
+        renamed = (
+            await self.database_provider.users_handler.update_api_key_name(
+                user_id=user_id,
+                key_id=key_id,
+                name=new_name,
+            )
         )
+        self.invalidate_api_key(key_id)
+        return renamed
 
     async def oauth_callback_handler(
         self, provider: str, oauth_id: str, email: str
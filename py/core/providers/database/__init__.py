@@ -1,5 +1,8 @@
 from .postgres import PostgresDatabaseProvider
+from .user_cache import UserCache, UserCacheMiddleware
 
 __all__ = [
     "PostgresDatabaseProvider",
+    "UserCache",
+    "UserCacheMiddleware",
 ]
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import textwrap
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 
@@ -8,13 +9,66 @@ import asyncpg
 
 from core.base.providers import DatabaseConnectionManager
 
+from .vector_codec import register_vector_codec
+
 logger = logging.getLogger()
 
 
+class PoolMetrics:
+    """Usage counters for a connection pool, used to size
+    `max_connections`."""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.acquire_wait_total = 0.0
+        self.acquire_wait_max = 0.0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.statements = 0
+        self.statement_time_total = 0.0
+        self.statement_time_max = 0.0
+
+    def record_acquire(self, wait: float) -> None:
+        self.acquisitions += 1
+        self.acquire_wait_total += wait
+        self.acquire_wait_max = max(self.acquire_wait_max, wait)
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def record_release(self) -> None:
+        self.in_use -= 1
+
+    def record_statement(self, elapsed: float) -> None:
+        self.statements += 1
+        self.statement_time_total += elapsed
+        self.statement_time_max = max(self.statement_time_max, elapsed)
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "acquisitions": self.acquisitions,
+            "acquire_wait_avg_ms": (
+                self.acquire_wait_total / self.acquisitions * 1000
+                if self.acquisitions
+                else 0.0
+            ),
+            "acquire_wait_max_ms": self.acquire_wait_max * 1000,
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "statements": self.statements,
+            "statement_latency_avg_ms": (
+                self.statement_time_total / self.statements * 1000
+                if self.statements
+                else 0.0
+            ),
+            "statement_latency_max_ms": self.statement_time_max * 1000,
+        }
+
+
 class SemaphoreConnectionPool:
     def __init__(self, connection_string, postgres_configuration_settings):
         self.connection_string = connection_string
         self.postgres_configuration_settings = postgres_configuration_settings
+        self.metrics = PoolMetrics()
 
     async def initialize(self):
         try:
@@ -30,6 +84,7 @@ class SemaphoreConnectionPool:
                 self.connection_string,
                 max_size=self.postgres_configuration_settings.max_connections,
                 statement_cache_size=self.postgres_configuration_settings.statement_cache_size,
+                init=register_vector_codec,
             )
 
             logger.info(
@@ -42,9 +97,27 @@ class SemaphoreConnectionPool:
 
     @asynccontextmanager
     async def get_connection(self):
+        wait_start = time.perf_counter()
         async with self.semaphore:
             async with self.pool.acquire() as conn:
-                yield conn
+                self.metrics.record_acquire(time.perf_counter() - wait_start)
+                try:
+                    yield conn
+                finally:
+                    self.metrics.record_release()
+
+    async def timed(self, awaitable):
+        """Awaits a single statement, recording its latency."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.metrics.record_statement(time.perf_counter() - start)
+
+    async def reset_connections(self):
+        """Recycles pooled connections so that type codecs are registered
+        against the current database schema."""
+        await self.pool.expire_connections()
 
     async def close(self):
         await self.pool.close()
@@ -151,52 +224,76 @@ class QueryBuilder:
 class PostgresConnectionManager(DatabaseConnectionManager):
     def __init__(self):
         self.pool: Optional[SemaphoreConnectionPool] = None
+        self.read_pool: Optional[SemaphoreConnectionPool] = None
 
-    async def initialize(self, pool: SemaphoreConnectionPool):
+    async def initialize(
+        self,
+        pool: SemaphoreConnectionPool,
+        read_pool: Optional[SemaphoreConnectionPool] = None,
+    ):
         self.pool = pool
+        self.read_pool = read_pool
 
-    async def execute_query(self, query, params=None, isolation_level=None):
+    def _get_pool(self, read_only: bool = False) -> SemaphoreConnectionPool:
         if not self.pool:
             raise ValueError("PostgresConnectionManager is not initialized.")
-        async with self.pool.get_connection() as conn:
+        if read_only and self.read_pool:
+            return self.read_pool
+        return self.pool
+
+    def pool_metrics(self) -> dict[str, dict[str, float]]:
+        metrics = {}
+        if self.pool:
+            metrics["primary"] = self.pool.metrics.snapshot()
+        if self.read_pool:
+            metrics["replica"] = self.read_pool.metrics.snapshot()
+        return metrics
+
+    async def execute_query(self, query, params=None, isolation_level=None):
+        pool = self._get_pool()
+        async with pool.get_connection() as conn:
             if isolation_level:
                 async with conn.transaction(isolation=isolation_level):
                     if params:
-                        return await conn.execute(query, *params)
+                        return await pool.timed(conn.execute(query, *params))
                     else:
-                        return await conn.execute(query)
+                        return await pool.timed(conn.execute(query))
             else:
                 if params:
-                    return await conn.execute(query, *params)
+                    return await pool.timed(conn.execute(query, *params))
                 else:
-                    return await conn.execute(query)
+                    return await pool.timed(conn.execute(query))
 
     async def execute_many(self, query, params=None, batch_size=1000):
-        if not self.pool:
-            raise ValueError("PostgresConnectionManager is not initialized.")
-        async with self.pool.get_connection() as conn:
+        pool = self._get_pool()
+        async with pool.get_connection() as conn:
             async with conn.transaction():
                 if params:
                     results = []
                     for i in range(0, len(params), batch_size):
                         param_batch = params[i : i + batch_size]
-                        result = await conn.executemany(query, param_batch)
+                        result = await pool.timed(
+                            conn.executemany(query, param_batch)
+                        )
                         results.append(result)
                     return results
                 else:
-                    return await conn.executemany(query)
+                    return await pool.timed(conn.executemany(query))
 
-    async def fetch_query(self, query, params=None):
-        if not self.pool:
-            raise ValueError("PostgresConnectionManager is not initialized.")
+    async def fetch_query(self, query, params=None, read_only=False):
+        """Runs a single statement and returns all rows.
+
+        A single statement is atomic on its own, so no explicit transaction
+        is opened; this saves the BEGIN/COMMIT round trips. With
+        `read_only=True` the statement is sent to the read replica pool
+        when one is configured.
+        """
+        pool = self._get_pool(read_only)
         try:
-            async with self.pool.get_connection() as conn:
-                async with conn.transaction():
-                    return (
-                        await conn.fetch(query, *params)
-                        if params
-                        else await conn.fetch(query)
-                    )
+            async with pool.get_connection() as conn:
+                return await pool.timed(
+                    conn.fetch(query, *params) if params else conn.fetch(query)
+                )
         except asyncpg.exceptions.DuplicatePreparedStatementError:
             error_msg = textwrap.dedent("""
                 Database Configuration Error
@@ -215,15 +312,40 @@ class PostgresConnectionManager(DatabaseConnectionManager):
             """).strip()
             raise ValueError(error_msg) from None
 
-    async def fetchrow_query(self, query, params=None):
-        if not self.pool:
-            raise ValueError("PostgresConnectionManager is not initialized.")
-        async with self.pool.get_connection() as conn:
+    async def fetchrow_query(self, query, params=None, read_only=False):
+        pool = self._get_pool(read_only)
+        async with pool.get_connection() as conn:
+            if params:
+                return await pool.timed(conn.fetchrow(query, *params))
+            else:
+                return await pool.timed(conn.fetchrow(query))
+
+    async def stream_query(
+        self, query, params=None, prefetch=500, read_only=False
+    ):
+        """Yields rows from a server-side cursor.
+
+        At most `prefetch` rows are buffered client-side, so memory stays
+        flat regardless of how many rows the query returns. The pooled
+        connection is held until the generator is exhausted or closed.
+        """
+        pool = self._get_pool(read_only)
+        async with pool.get_connection() as conn:
             async with conn.transaction():
-                if params:
-                    return await conn.fetchrow(query, *params)
-                else:
-                    return await conn.fetchrow(query)
+                async for record in conn.cursor(
+                    query, *(params or []), prefetch=prefetch
+                ):
+                    yield record
+
+    @asynccontextmanager
+    async def connection(self):
+        """Checks out a connection from the primary pool.
+
+        For handlers that need several statements to share one
+        transaction; the caller opens it with `conn.transaction()`.
+        """
+        async with self._get_pool().get_connection() as conn:
+            yield conn
 
     @asynccontextmanager
     async def transaction(self, isolation_level=None):
@@ -235,10 +357,8 @@ class PostgresConnectionManager(DatabaseConnectionManager):
         Yields:
             The connection manager instance for use within the transaction
         """
-        if not self.pool:
-            raise ValueError("PostgresConnectionManager is not initialized.")
-
-        async with self.pool.get_connection() as conn:
+        pool = self._get_pool()
+        async with pool.get_connection() as conn:
             async with conn.transaction(isolation=isolation_level):
                 try:
                     yield self
@@ -1,21 +1,25 @@
+import asyncio
 import copy
 import json
 import logging
 import math
 import time
 import uuid
-from typing import Any, Optional, TypedDict
+from typing import Any, AsyncGenerator, Callable, Optional, TypedDict
 from uuid import UUID
 
 import numpy as np
 
 from core.base import (
+    BulkLoadSettings,
     ChunkSearchResult,
+    DatabaseConfig,
     Handler,
     IndexArgsHNSW,
     IndexArgsIVFFlat,
     IndexMeasure,
     IndexMethod,
+    QuantizedSearchSettings,
     R2RException,
     SearchSettings,
     VectorEntry,
@@ -27,6 +31,7 @@ from core.base.utils import _decorate_vector_type
 from .base import PostgresConnectionManager
 from .filters import apply_filters
 from .utils import psql_quote_literal
+from .vector_codec import vector_to_list
 
 logger = logging.getLogger()
 
@@ -65,6 +70,46 @@ def quantize_vector_to_binary(
     return binary_string.encode("ascii")
 
 
+# Operators whose operands are collections the results are drawn from;
+# `$ne` and `$nin` name collections that are excluded
+_SELECTING_OPERATORS = ("$eq", "$in", "$overlap")
+
+
+def _collect_filter_collection_ids(filters: Any) -> set[UUID]:
+    """Collects the collection ids a filter dict selects results from."""
+    collection_ids: set[UUID] = set()
+
+    def _add(value: Any) -> None:
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        for item in values:
+            try:
+                collection_ids.add(UUID(str(item)))
+            except ValueError:
+                continue
+
+    def _walk(node: Any) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ("collection_id", "collection_ids"):
+                    if isinstance(value, dict):
+                        for operator, operand in value.items():
+                            if operator in _SELECTING_OPERATORS:
+                                _add(operand)
+                    else:
+                        _add(value)
+                else:
+                    _walk(value)
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                _walk(item)
+
+    _walk(filters)
+    return collection_ids
+
+
+_SEARCH_COLUMNS = ["id", "document_id", "owner_id", "collection_ids", "text"]
+
+
 class HybridSearchIntermediateResult(TypedDict):
     semantic_rank: int
     full_text_rank: int
@@ -74,6 +119,9 @@ class HybridSearchIntermediateResult(TypedDict):
 
 class PostgresChunksHandler(Handler):
     TABLE_NAME = VectorTableName.CHUNKS
+    # Per-owner chunk totals, maintained alongside every write to the chunks
+    # table so quota checks do not have to count rows
+    COUNTS_TABLE_NAME = "chunk_counts"
 
     def __init__(
         self,
@@ -81,10 +129,15 @@ class PostgresChunksHandler(Handler):
         connection_manager: PostgresConnectionManager,
         dimension: int | float,
         quantization_type: VectorQuantizationType,
+        config: Optional[DatabaseConfig] = None,
     ):
         super().__init__(project_name, connection_manager)
         self.dimension = dimension
         self.quantization_type = quantization_type
+        self.config = config
+        # Vector indexes dropped for a bulk load whose rebuild failed,
+        # retried by the next bulk load
+        self._missing_vector_indexes: dict[str, str] = {}
 
     async def create_tables(self):
         # First check if table already exists and validate dimensions
@@ -181,76 +234,122 @@ class PostgresChunksHandler(Handler):
         """
 
         await self.connection_manager.execute_query(query)
+        await self._create_counts_table()
 
-    async def upsert(self, entry: VectorEntry) -> None:
-        """Upsert function that handles vector quantization only when
-        quantization_type is INT1.
+        if (
+            self.quantization_type == VectorQuantizationType.INT1
+            and self._quantized_search_settings.halfvec_rescoring
+            and not math.isnan(self.dimension)
+        ):
+            # Half precision copy of `vec`, read by the intermediate rescoring
+            # stage of binary search instead of the full precision vectors.
+            await self.connection_manager.execute_query(f"""
+            ALTER TABLE {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+            ADD COLUMN IF NOT EXISTS vec_halfvec halfvec({self.dimension})
+            GENERATED ALWAYS AS (vec::halfvec({self.dimension})) STORED;
+            """)
+
+    async def _create_counts_table(self) -> None:
+        counts_table = self._get_table_name(
+            PostgresChunksHandler.COUNTS_TABLE_NAME
+        )
+        exists = await self.connection_manager.fetchrow_query(
+            "SELECT to_regclass($1) IS NOT NULL AS exists", (counts_table,)
+        )
+        await self.connection_manager.execute_query(f"""
+        CREATE TABLE IF NOT EXISTS {counts_table} (
+            owner_id UUID PRIMARY KEY,
+            chunk_count BIGINT NOT NULL DEFAULT 0
+        );
+        """)
+        if exists and exists["exists"]:
+            return
+
+        # First start against an existing chunks table: seed the counters
+        await self.connection_manager.execute_query(f"""
+        INSERT INTO {counts_table} (owner_id, chunk_count)
+        SELECT owner_id, count(*)
+        FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        WHERE owner_id IS NOT NULL
+        GROUP BY owner_id
+        ON CONFLICT (owner_id) DO NOTHING;
+        """)
 
-        Matches the table schema where vec_binary column only exists for INT1
-        quantization.
+    async def get_chunk_counts(self, owner_ids: list[UUID]) -> dict[UUID, int]:
+        """Returns the number of chunks stored for each of the given
+        owners.
+
+        Reads from the primary: quotas are enforced against these counts,
+        and a lagging replica would let bursts of ingestion overshoot them.
         """
-        # Check the quantization type to determine which columns to use
-        if self.quantization_type == VectorQuantizationType.INT1:
-            bit_dim = (
-                "" if math.isnan(self.dimension) else f"({self.dimension})"
-            )
+        if not owner_ids:
+            return {}
+        query = f"""
+        SELECT owner_id, chunk_count
+        FROM {self._get_table_name(PostgresChunksHandler.COUNTS_TABLE_NAME)}
+        WHERE owner_id = ANY($1::uuid[])
+        """
+        rows = await self.connection_manager.fetch_query(
+            query, (list(owner_ids),)
+        )
+        counts = {owner_id: 0 for owner_id in owner_ids}
+        counts.update({row["owner_id"]: row["chunk_count"] for row in rows})
+        return counts
+
+    async def _apply_count_deltas(self, conn, deltas: dict[UUID, int]):
+        deltas = {
+            owner_id: delta
+            for owner_id, delta in deltas.items()
+            if owner_id is not None and delta
+        }
+        if not deltas:
+            return
+        counts_table = self._get_table_name(
+            PostgresChunksHandler.COUNTS_TABLE_NAME
+        )
+        # Sorted so concurrent writers lock counter rows in the same order
+        owner_ids = sorted(deltas)
+        await conn.execute(
+            f"""
+            INSERT INTO {counts_table} (owner_id, chunk_count)
+            SELECT owner_id, delta
+            FROM unnest($1::uuid[], $2::bigint[]) AS d(owner_id, delta)
+            ORDER BY owner_id
+            ON CONFLICT (owner_id) DO UPDATE
+            SET chunk_count = {counts_table}.chunk_count + EXCLUDED.chunk_count;
+            """,
+            owner_ids,
+            [deltas[owner_id] for owner_id in owner_ids],
+        )
 
-            # For quantized vectors, use vec_binary column
-            query = f"""
-            INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            (id, document_id, owner_id, collection_ids, vec, vec_binary, text, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6::bit({bit_dim}), $7, $8)
-            ON CONFLICT (id) DO UPDATE SET
-            document_id = EXCLUDED.document_id,
-            owner_id = EXCLUDED.owner_id,
-            collection_ids = EXCLUDED.collection_ids,
-            vec = EXCLUDED.vec,
-            vec_binary = EXCLUDED.vec_binary,
-            text = EXCLUDED.text,
-            metadata = EXCLUDED.metadata;
-            """
-            await self.connection_manager.execute_query(
-                query,
-                (
-                    entry.id,
-                    entry.document_id,
-                    entry.owner_id,
-                    entry.collection_ids,
-                    str(entry.vector.data),
-                    quantize_vector_to_binary(
-                        entry.vector.data
-                    ),  # Convert to binary
-                    entry.text,
-                    json.dumps(entry.metadata),
-                ),
-            )
-        else:
-            # For regular vectors, use vec column only
-            query = f"""
-            INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            (id, document_id, owner_id, collection_ids, vec, text, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            ON CONFLICT (id) DO UPDATE SET
-            document_id = EXCLUDED.document_id,
-            owner_id = EXCLUDED.owner_id,
-            collection_ids = EXCLUDED.collection_ids,
-            vec = EXCLUDED.vec,
-            text = EXCLUDED.text,
-            metadata = EXCLUDED.metadata;
-            """
+    async def _delete_chunks(
+        self, where_clause: str, params: list | tuple
+    ) -> list:
+        """Deletes the matching chunks and decrements the owners' counters
+        in the same statement."""
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+            WHERE {where_clause}
+            RETURNING id, document_id, owner_id, text
+        ), counted AS (
+            UPDATE {self._get_table_name(PostgresChunksHandler.COUNTS_TABLE_NAME)} AS c
+            SET chunk_count = c.chunk_count - d.removed
+            FROM (
+                SELECT owner_id, count(*) AS removed
+                FROM deleted
+                WHERE owner_id IS NOT NULL
+                GROUP BY owner_id
+            ) AS d
+            WHERE c.owner_id = d.owner_id
+        )
+        SELECT id, document_id, text FROM deleted;
+        """
+        return await self.connection_manager.fetch_query(query, params)
 
-            await self.connection_manager.execute_query(
-                query,
-                (
-                    entry.id,
-                    entry.document_id,
-                    entry.owner_id,
-                    entry.collection_ids,
-                    str(entry.vector.data),
-                    entry.text,
-                    json.dumps(entry.metadata),
-                ),
-            )
+    async def upsert(self, entry: VectorEntry) -> None:
+        """Upserts a single entry, see `upsert_entries`."""
+        await self.upsert_entries([entry])
 
     async def upsert_entries(self, entries: list[VectorEntry]) -> None:
         """Batch upsert function that handles vector quantization only when
@@ -284,7 +383,7 @@ class PostgresChunksHandler(Handler):
                     entry.document_id,
                     entry.owner_id,
                     entry.collection_ids,
-                    str(entry.vector.data),
+                    entry.vector.data,
                     quantize_vector_to_binary(
                         entry.vector.data
                     ),  # Convert to binary
@@ -293,7 +392,7 @@ class PostgresChunksHandler(Handler):
                 )
                 for entry in entries
             ]
-            await self.connection_manager.execute_many(query, bin_params)
+            await self._write_entries(query, bin_params, entries)
 
         else:
             # For regular vectors, use vec column only
@@ -315,18 +414,283 @@ class PostgresChunksHandler(Handler):
                     entry.document_id,
                     entry.owner_id,
                     entry.collection_ids,
-                    str(entry.vector.data),
+                    entry.vector.data,
                     entry.text,
                     json.dumps(entry.metadata),
                 )
                 for entry in entries
             ]
 
-            await self.connection_manager.execute_many(query, params)
+            await self._write_entries(query, params, entries)
 
-    async def semantic_search(
-        self, query_vector: list[float], search_settings: SearchSettings
-    ) -> list[ChunkSearchResult]:
+    async def _write_entries(
+        self, query: str, params: list[tuple], entries: list[VectorEntry]
+    ) -> None:
+        """Runs the upsert and the matching counter updates in one
+        transaction.
+
+        Only ids that are not stored yet add to their owner's count; rows
+        that change owner move between counters. The existing rows are
+        locked first so concurrent upserts of the same ids cannot both
+        count them as new.
+        """
+        table = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        ids = list({entry.id for entry in entries})
+        async with self.connection_manager.connection() as conn:
+            async with conn.transaction():
+                existing = await conn.fetch(
+                    f"""
+                    SELECT id, owner_id FROM {table}
+                    WHERE id = ANY($1::uuid[])
+                    ORDER BY id
+                    FOR UPDATE
+                    """,
+                    ids,
+                )
+                deltas = self._count_deltas(existing, entries)
+                await conn.executemany(query, params)
+                # Last, so the counter rows stay locked as briefly as possible
+                await self._apply_count_deltas(conn, deltas)
+
+    @staticmethod
+    def _count_deltas(
+        existing: list, entries: list[VectorEntry]
+    ) -> dict[UUID, int]:
+        """Per-owner chunk count changes for upserting `entries` over the
+        `existing` (id, owner_id) rows."""
+        owners = {row["id"]: row["owner_id"] for row in existing}
+        deltas: dict[UUID, int] = {}
+        for entry in entries:
+            if entry.id in owners:
+                previous = owners[entry.id]
+                if previous == entry.owner_id:
+                    continue
+                deltas[previous] = deltas.get(previous, 0) - 1
+            deltas[entry.owner_id] = deltas.get(entry.owner_id, 0) + 1
+            owners[entry.id] = entry.owner_id
+        return deltas
+
+    @property
+    def _bulk_load_settings(self) -> BulkLoadSettings:
+        if self.config is None:
+            return BulkLoadSettings()
+        return self.config.bulk_load_settings
+
+    async def bulk_upsert_entries(
+        self,
+        entries: list[VectorEntry],
+        defer_vector_index: Optional[bool] = None,
+    ) -> None:
+        """Upserts a large batch of entries through binary COPY.
+
+        The entries are copied into a temporary staging table and merged
+        into the chunks table with a single `INSERT ... SELECT ... ON
+        CONFLICT`, together with the owners' chunk counters, in one
+        transaction.
+
+        With `defer_vector_index` (by default when the batch reaches
+        `bulk_load_settings.defer_index_min_rows`) the HNSW/IVFFlat indexes
+        on the chunks table are dropped for the duration of the load and
+        rebuilt afterwards, whether or not the load succeeds. Deferred loads
+        hold an advisory lock from the drop until the rebuild, so concurrent
+        loads cannot drop or rebuild the indexes under each other. Vector
+        searches fall back to exact scans until the rebuild has finished.
+
+        A failed rebuild is raised, and the indexes it could not create are
+        retried by every later bulk load until they exist again.
+        """
+        if not entries:
+            return
+        # A merge statement may not touch the same row twice
+        entries = list({entry.id: entry for entry in entries}.values())
+
+        if defer_vector_index is None:
+            min_rows = self._bulk_load_settings.defer_index_min_rows
+            defer_vector_index = (
+                min_rows is not None and len(entries) >= min_rows
+            )
+
+        async with self.connection_manager.connection() as conn:
+            if not defer_vector_index and not self._missing_vector_indexes:
+                await self._copy_entries(conn, entries)
+                return
+
+            lock_key = (
+                f"{self._get_table_name(PostgresChunksHandler.TABLE_NAME)}"
+                ":bulk_load"
+            )
+            await conn.execute(
+                "SELECT pg_advisory_lock(hashtext($1))", lock_key
+            )
+            try:
+                if not defer_vector_index:
+                    # Left missing by an earlier load; failures are logged
+                    # and retried again, but do not fail this load
+                    await self._rebuild_vector_indexes(conn, {})
+                    await self._copy_entries(conn, entries)
+                    return
+
+                index_definitions = await self._vector_index_definitions(conn)
+                try:
+                    await self._drop_vector_indexes(conn, index_definitions)
+                    await self._copy_entries(conn, entries)
+                finally:
+                    errors = await self._rebuild_vector_indexes(
+                        conn, index_definitions
+                    )
+                    if errors:
+                        raise errors[0]
+            finally:
+                try:
+                    await conn.execute(
+                        "SELECT pg_advisory_unlock(hashtext($1))", lock_key
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to release bulk load lock: {e}")
+
+    async def _copy_entries(
+        self, conn: Any, entries: list[VectorEntry]
+    ) -> None:
+        table = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        staging = "_chunks_staging"
+        quantized = self.quantization_type == VectorQuantizationType.INT1
+        vector_type = (
+            f"vector({self.dimension})" if self.dimension > 0 else "vector"
+        )
+        bit_dim = "" if math.isnan(self.dimension) else f"({self.dimension})"
+
+        columns = ["id", "document_id", "owner_id", "collection_ids", "vec"]
+        if quantized:
+            columns.append("vec_binary")
+        columns += ["text", "metadata"]
+        selected = [
+            f"vec_binary::bit{bit_dim}" if column == "vec_binary" else column
+            for column in columns
+        ]
+        updates = ",\n".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in columns
+            if column != "id"
+        )
+
+        records = (
+            (
+                entry.id,
+                entry.document_id,
+                entry.owner_id,
+                entry.collection_ids,
+                entry.vector.data,
+                *(
+                    (quantize_vector_to_binary(entry.vector.data).decode(),)
+                    if quantized
+                    else ()
+                ),
+                entry.text,
+                json.dumps(entry.metadata),
+            )
+            for entry in entries
+        )
+
+        async with conn.transaction():
+            await conn.execute(f"""
+            CREATE TEMP TABLE {staging} (
+                id UUID,
+                document_id UUID,
+                owner_id UUID,
+                collection_ids UUID[],
+                vec {vector_type},
+                {"vec_binary TEXT," if quantized else ""}
+                text TEXT,
+                metadata JSONB
+            ) ON COMMIT DROP;
+            """)
+            await conn.copy_records_to_table(
+                staging, records=records, columns=columns
+            )
+            existing = await conn.fetch(f"""
+            SELECT c.id, c.owner_id
+            FROM {table} AS c
+            JOIN {staging} AS s ON s.id = c.id
+            ORDER BY c.id
+            FOR UPDATE OF c
+            """)
+            deltas = self._count_deltas(existing, entries)
+            await conn.execute(f"""
+            INSERT INTO {table} ({", ".join(columns)})
+            SELECT {", ".join(selected)} FROM {staging}
+            ON CONFLICT (id) DO UPDATE SET
+            {updates};
+            """)
+            await self._apply_count_deltas(conn, deltas)
+
+    async def _vector_index_definitions(self, conn: Any) -> dict[str, str]:
+        """Returns the names and definitions of the HNSW/IVFFlat indexes on
+        the chunks table."""
+        rows = await conn.fetch(
+            """
+            SELECT indexname, indexdef
+            FROM pg_indexes
+            WHERE schemaname = $1
+            AND tablename = $2
+            AND (indexdef ILIKE '%USING hnsw%'
+                 OR indexdef ILIKE '%USING ivfflat%')
+            """,
+            self.project_name,
+            PostgresChunksHandler.TABLE_NAME,
+        )
+        return {row["indexname"]: row["indexdef"] for row in rows}
+
+    async def _drop_vector_indexes(
+        self, conn: Any, definitions: dict[str, str]
+    ) -> None:
+        for name in definitions:
+            logger.info(f"Dropping vector index {name} for bulk load")
+            await conn.execute(
+                f'DROP INDEX IF EXISTS {self.project_name}."{name}"'
+            )
+
+    async def _rebuild_vector_indexes(
+        self, conn: Any, definitions: dict[str, str]
+    ) -> list[Exception]:
+        """Creates the given indexes and any left missing by earlier loads.
+
+        Returns the errors of the indexes that could not be created, which
+        are remembered so that the next bulk load tries them again.
+        """
+        errors = []
+        for name, definition in {
+            **self._missing_vector_indexes,
+            **definitions,
+        }.items():
+            # Indexes left in place by a failed drop are skipped
+            statement = definition.replace(
+                "CREATE INDEX ", "CREATE INDEX IF NOT EXISTS ", 1
+            )
+            try:
+                await conn.execute(statement)
+            except Exception as e:
+                logger.error(
+                    f"Failed to rebuild vector index `{statement}` "
+                    f"after bulk load: {e}"
+                )
+                self._missing_vector_indexes[name] = definition
+                errors.append(e)
+            else:
+                self._missing_vector_indexes.pop(name, None)
+        return errors
+
+    def _build_semantic_query(
+        self,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+        include_distance: bool = False,
+    ) -> tuple[str, list[Any]]:
+        """Builds the semantic search query and its parameters.
+
+        The query is self-contained so that it can either be executed
+        directly or embedded as a CTE inside of a larger statement, such as
+        the fused hybrid search query.
+        """
         try:
             imeasure_obj = IndexMeasure(
                 search_settings.chunk_settings.index_measure
@@ -335,73 +699,142 @@ class PostgresChunksHandler(Handler):
             raise ValueError("Invalid index measure") from None
 
         table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
-        cols = [
-            f"{table_name}.id",
-            f"{table_name}.document_id",
-            f"{table_name}.owner_id",
-            f"{table_name}.collection_ids",
-            f"{table_name}.text",
-        ]
+        cols = [f"{table_name}.{col}" for col in _SEARCH_COLUMNS]
 
-        params: list[str | int | bytes] = []
+        params: list[Any] = []
 
         # For binary vectors (INT1), implement two-stage search
         if self.quantization_type == VectorQuantizationType.INT1:
-            # Convert query vector to binary format
-            binary_query = quantize_vector_to_binary(query_vector)
-            # TODO - Put depth multiplier in config / settings
-            extended_limit = (
-                search_settings.limit * 20
-            )  # Get 20x candidates for re-ranking
+            return self._build_binary_semantic_query(
+                query_vector, search_settings, imeasure_obj, cols
+            )
 
-            if (
-                imeasure_obj == IndexMeasure.hamming_distance
-                or imeasure_obj == IndexMeasure.jaccard_distance
-            ):
-                binary_search_measure_repr = imeasure_obj.pgvector_repr
-            else:
-                binary_search_measure_repr = (
-                    IndexMeasure.hamming_distance.pgvector_repr
-                )
+        # Standard float vector handling
+        vector_dim = (
+            "" if math.isnan(self.dimension) else f"({self.dimension})"
+        )
+        distance_calc = f"{table_name}.vec {search_settings.chunk_settings.index_measure.pgvector_repr} $1::vector{vector_dim}"
+        query_param = query_vector
 
-            # Use binary column and binary-specific distance measures for first stage
-            bit_dim = (
-                "" if math.isnan(self.dimension) else f"({self.dimension})"
+        if search_settings.include_scores or include_distance:
+            cols.append(f"({distance_calc}) AS distance")
+        if search_settings.include_metadatas:
+            cols.append(f"{table_name}.metadata")
+
+        select_clause = ", ".join(cols)
+        where_clause = ""
+        params.append(query_param)
+
+        if search_settings.filters:
+            where_clause, new_params = apply_filters(
+                search_settings.filters,
+                params,
+                mode="where_clause",  # Get just conditions without WHERE
             )
-            stage1_distance = f"{table_name}.vec_binary {binary_search_measure_repr} $1::bit{bit_dim}"
-            stage1_param = binary_query
+            params = new_params
 
-            cols.append(
-                f"{table_name}.vec"
-            )  # Need original vector for re-ranking
-            if search_settings.include_metadatas:
-                cols.append(f"{table_name}.metadata")
+        query = f"""
+        SELECT {select_clause}
+        FROM {table_name}
+        {where_clause}
+        ORDER BY {distance_calc}
+        LIMIT ${len(params) + 1}
+        OFFSET ${len(params) + 2}
+        """
+        params.extend([search_settings.limit, search_settings.offset])
 
-            select_clause = ", ".join(cols)
-            where_clause = ""
-            params.append(stage1_param)
+        return query, params
 
-            if search_settings.filters:
-                where_clause, params = apply_filters(
-                    search_settings.filters, params, mode="where_clause"
-                )
+    def _build_binary_semantic_query(
+        self,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+        imeasure_obj: IndexMeasure,
+        cols: list[str],
+        oversampling_factor: Optional[int] = None,
+    ) -> tuple[str, list[Any]]:
+        """Builds the multi-stage search query used for INT1 quantization.
+
+        Candidates are selected by binary distance, optionally rescored with
+        the stored half precision copy of the vectors, and finally re-ranked
+        with the full precision vectors. Pagination is applied after re-ranking so
+        that deep pages are drawn from the same candidate set as the first.
+        """
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        settings = self._quantized_search_settings
 
-            vector_dim = (
-                "" if math.isnan(self.dimension) else f"({self.dimension})"
+        oversampling_factor = (
+            oversampling_factor
+            or self._get_oversampling_factor(search_settings)
+        )
+        window = search_settings.offset + search_settings.limit
+        candidate_limit = window * oversampling_factor
+
+        if (
+            imeasure_obj == IndexMeasure.hamming_distance
+            or imeasure_obj == IndexMeasure.jaccard_distance
+        ):
+            binary_search_measure_repr = imeasure_obj.pgvector_repr
+        else:
+            binary_search_measure_repr = (
+                IndexMeasure.hamming_distance.pgvector_repr
             )
 
-            # First stage: Get candidates using binary search
-            query = f"""
+        # Use binary column and binary-specific distance measures for first stage
+        bit_dim = "" if math.isnan(self.dimension) else f"({self.dimension})"
+        vector_dim = bit_dim
+        stage1_distance = f"{table_name}.vec_binary {binary_search_measure_repr} $1::bit{bit_dim}"
+
+        use_halfvec = settings.halfvec_rescoring and not math.isnan(
+            self.dimension
+        )
+        cols.append(f"{table_name}.vec")  # Need original vector for re-ranking
+        if use_halfvec:
+            cols.append(f"{table_name}.vec_halfvec")
+        if search_settings.include_metadatas:
+            cols.append(f"{table_name}.metadata")
+
+        select_clause = ", ".join(cols)
+        where_clause = ""
+        params: list[Any] = [quantize_vector_to_binary(query_vector)]
+
+        if search_settings.filters:
+            where_clause, params = apply_filters(
+                search_settings.filters, params, mode="where_clause"
+            )
+
+        candidate_limit_param = f"${len(params) + 1}"
+        query_vector_param = f"${len(params) + 2}::vector{vector_dim}"
+        params.extend([candidate_limit, query_vector])
+
+        rescore_cte = ""
+        source = "candidates"
+        if use_halfvec:
+            rescore_limit = min(
+                candidate_limit, window * settings.halfvec_oversampling_factor
+            )
+            rescore_cte = f""",
+            -- Intermediate stage: Narrow candidates using half precision vectors
+            rescored AS (
+                SELECT *
+                FROM candidates
+                ORDER BY vec_halfvec <=> {query_vector_param}::halfvec{vector_dim}
+                LIMIT ${len(params) + 1}
+            )"""
+            params.append(rescore_limit)
+            source = "rescored"
+
+        # First stage: Get candidates using binary search
+        query = f"""
             WITH candidates AS (
                 SELECT {select_clause},
                     ({stage1_distance}) as binary_distance
                 FROM {table_name}
                 {where_clause}
                 ORDER BY {stage1_distance}
-                LIMIT ${len(params) + 1}
-                OFFSET ${len(params) + 2}
-            )
-            -- Second stage: Re-rank using original vectors
+                LIMIT {candidate_limit_param}
+            ){rescore_cte}
+            -- Final stage: Re-rank using original vectors
             SELECT
                 id,
                 document_id,
@@ -409,85 +842,244 @@ class PostgresChunksHandler(Handler):
                 collection_ids,
                 text,
                 {"metadata," if search_settings.include_metadatas else ""}
-                (vec <=> ${len(params) + 4}::vector{vector_dim}) as distance
-            FROM candidates
+                (vec <=> {query_vector_param}) as distance
+            FROM {source}
             ORDER BY distance
-            LIMIT ${len(params) + 3}
+            LIMIT ${len(params) + 1}
+            OFFSET ${len(params) + 2}
             """
 
-            params.extend(
-                [
-                    extended_limit,  # First stage limit
-                    search_settings.offset,
-                    search_settings.limit,  # Final limit
-                    str(query_vector),  # For re-ranking
-                ]
+        params.extend([search_settings.limit, search_settings.offset])
+
+        return query, params
+
+    @property
+    def _quantized_search_settings(self) -> QuantizedSearchSettings:
+        if self.config is None:
+            return QuantizedSearchSettings()
+        return self.config.quantized_search_settings
+
+    def _get_oversampling_factor(self, search_settings: SearchSettings) -> int:
+        """Resolves the INT1 oversampling factor for a search.
+
+        A factor set on the request takes precedence, followed by the largest
+        override configured for any collection referenced by the filters,
+        followed by the configured default.
+        """
+        if search_settings.chunk_settings.oversampling_factor:
+            return search_settings.chunk_settings.oversampling_factor
+
+        settings = self._quantized_search_settings
+        if settings.collection_oversampling_factors:
+            collection_ids = _collect_filter_collection_ids(
+                search_settings.filters
             )
+            overrides = [
+                factor
+                for collection_id, factor in settings.collection_oversampling_factors.items()
+                if collection_id in collection_ids
+            ]
+            if overrides:
+                return max(overrides)
 
-        else:
-            # Standard float vector handling
-            vector_dim = (
-                "" if math.isnan(self.dimension) else f"({self.dimension})"
+        return settings.oversampling_factor
+
+    async def evaluate_quantized_search(
+        self,
+        query_vectors: list[list[float]],
+        search_settings: SearchSettings,
+        oversampling_factors: list[int],
+    ) -> list[dict[str, Any]]:
+        """Measures recall and latency of the INT1 search for a range of
+        oversampling factors.
+
+        Each query is first answered with an exact scan over the full
+        precision vectors, which serves as ground truth for recall@limit.
+
+        Args:
+            query_vectors (list[list[float]]): Query embeddings to evaluate.
+            search_settings (SearchSettings): Settings shared by all queries.
+            oversampling_factors (list[int]): Factors to compare.
+
+        Returns:
+            list[dict[str, Any]]: One entry per factor with the mean recall,
+                mean and p95 latency in milliseconds, and the exact scan's
+                mean latency for reference.
+        """
+        if self.quantization_type != VectorQuantizationType.INT1:
+            raise ValueError(
+                "Quantized search evaluation requires INT1 quantization."
             )
-            distance_calc = f"{table_name}.vec {search_settings.chunk_settings.index_measure.pgvector_repr} $1::vector{vector_dim}"
-            query_param = str(query_vector)
+        if not query_vectors:
+            raise ValueError("At least one query vector is required.")
 
-            if search_settings.include_scores:
-                cols.append(f"({distance_calc}) AS distance")
-            if search_settings.include_metadatas:
-                cols.append(f"{table_name}.metadata")
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        vector_dim = (
+            "" if math.isnan(self.dimension) else f"({self.dimension})"
+        )
 
-            select_clause = ", ".join(cols)
+        exact_ids: list[set[UUID]] = []
+        exact_latencies: list[float] = []
+        for query_vector in query_vectors:
+            params: list[Any] = [query_vector]
             where_clause = ""
-            params.append(query_param)
-
             if search_settings.filters:
-                where_clause, new_params = apply_filters(
-                    search_settings.filters,
-                    params,
-                    mode="where_clause",  # Get just conditions without WHERE
+                where_clause, params = apply_filters(
+                    search_settings.filters, params, mode="where_clause"
                 )
-                params = new_params
-
+            # Distances are computed for every row in a materialized CTE,
+            # so the ground truth is an exact scan even when an
+            # approximate index exists on `vec`
             query = f"""
-            SELECT {select_clause}
-            FROM {table_name}
-            {where_clause}
-            ORDER BY {distance_calc}
+            WITH scored AS MATERIALIZED (
+                SELECT id, vec <=> $1::vector{vector_dim} AS distance
+                FROM {table_name}
+                {where_clause}
+            )
+            SELECT id
+            FROM scored
+            ORDER BY distance
             LIMIT ${len(params) + 1}
             OFFSET ${len(params) + 2}
             """
             params.extend([search_settings.limit, search_settings.offset])
-        results = await self.connection_manager.fetch_query(query, params)
 
-        return [
-            ChunkSearchResult(
-                id=UUID(str(result["id"])),
-                document_id=UUID(str(result["document_id"])),
-                owner_id=UUID(str(result["owner_id"])),
-                collection_ids=result["collection_ids"],
-                text=result["text"],
-                score=(
-                    (1 - float(result["distance"]))
-                    if "distance" in result
-                    else -1
-                ),
-                metadata=(
-                    json.loads(result["metadata"])
-                    if search_settings.include_metadatas
-                    else {}
-                ),
+            start = time.perf_counter()
+            rows = await self.connection_manager.fetch_query(
+                query, params, read_only=True
+            )
+            exact_latencies.append(time.perf_counter() - start)
+            exact_ids.append({row["id"] for row in rows})
+
+        imeasure_obj = IndexMeasure(
+            search_settings.chunk_settings.index_measure
+        )
+        report = []
+        for factor in oversampling_factors:
+            recalls: list[float] = []
+            latencies: list[float] = []
+            for query_vector, truth in zip(
+                query_vectors, exact_ids, strict=True
+            ):
+                query, params = self._build_binary_semantic_query(
+                    query_vector,
+                    search_settings,
+                    imeasure_obj,
+                    [f"{table_name}.{col}" for col in _SEARCH_COLUMNS],
+                    oversampling_factor=factor,
+                )
+                start = time.perf_counter()
+                rows = await self.connection_manager.fetch_query(
+                    query, params, read_only=True
+                )
+                latencies.append(time.perf_counter() - start)
+                found = {row["id"] for row in rows}
+                recalls.append(
+                    len(found & truth) / len(truth) if truth else 1.0
+                )
+
+            report.append(
+                {
+                    "oversampling_factor": factor,
+                    "recall": float(np.mean(recalls)),
+                    "mean_latency_ms": float(np.mean(latencies) * 1000),
+                    "p95_latency_ms": float(
+                        np.percentile(latencies, 95) * 1000
+                    ),
+                    "exact_mean_latency_ms": float(
+                        np.mean(exact_latencies) * 1000
+                    ),
+                }
             )
+
+        return report
+
+    @staticmethod
+    def _semantic_search_result(
+        result: Any, search_settings: SearchSettings
+    ) -> ChunkSearchResult:
+        return ChunkSearchResult(
+            id=UUID(str(result["id"])),
+            document_id=UUID(str(result["document_id"])),
+            owner_id=UUID(str(result["owner_id"])),
+            collection_ids=result["collection_ids"],
+            text=result["text"],
+            score=(
+                (1 - float(result["distance"])) if "distance" in result else -1
+            ),
+            metadata=(
+                json.loads(result["metadata"])
+                if search_settings.include_metadatas
+                else {}
+            ),
+        )
+
+    async def semantic_search(
+        self, query_vector: list[float], search_settings: SearchSettings
+    ) -> list[ChunkSearchResult]:
+        query, params = self._build_semantic_query(
+            query_vector, search_settings
+        )
+        results = await self.connection_manager.fetch_query(
+            query, params, read_only=True
+        )
+
+        return [
+            self._semantic_search_result(result, search_settings)
             for result in results
         ]
 
-    async def full_text_search(
-        self, query_text: str, search_settings: SearchSettings
-    ) -> list[ChunkSearchResult]:
-        conditions = []
-        params: list[str | int | bytes] = [query_text]
+    def stream_semantic_search(
+        self,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+        prefetch: int = 500,
+    ) -> AsyncGenerator[ChunkSearchResult, None]:
+        """Streaming variant of `semantic_search` backed by a server-side
+        cursor, for callers asking for very large limits.
 
-        conditions.append("fts @@ websearch_to_tsquery('english', $1)")
+        The query is built before returning, so invalid settings raise
+        before the first result is requested.
+        """
+        query, params = self._build_semantic_query(
+            query_vector, search_settings
+        )
+        return self._stream_results(
+            query,
+            params,
+            prefetch,
+            lambda row: self._semantic_search_result(row, search_settings),
+        )
+
+    async def _stream_results(
+        self,
+        query: str,
+        params: list[Any],
+        prefetch: int,
+        convert: Callable[[Any], ChunkSearchResult],
+    ) -> AsyncGenerator[ChunkSearchResult, None]:
+        async for row in self.connection_manager.stream_query(
+            query, params, prefetch=prefetch, read_only=True
+        ):
+            yield convert(row)
+
+    def _build_full_text_query(
+        self,
+        query_text: str,
+        search_settings: SearchSettings,
+        params: Optional[list[Any]] = None,
+    ) -> tuple[str, list[Any]]:
+        """Builds the full text search query and its parameters.
+
+        When `params` is provided, the query text and any filter values are
+        appended to it and the placeholders are numbered accordingly, which
+        allows the query to be combined with other statements.
+        """
+        params = list(params) if params else []
+        params.append(query_text)
+        query_param = f"${len(params)}"
+
+        conditions = [f"fts @@ websearch_to_tsquery('english', {query_param})"]
 
         if search_settings.filters:
             filter_condition, params = apply_filters(
@@ -506,7 +1098,7 @@ class PostgresChunksHandler(Handler):
                 collection_ids,
                 text,
                 metadata,
-                ts_rank(fts, websearch_to_tsquery('english', $1), 32) as rank
+                ts_rank(fts, websearch_to_tsquery('english', {query_param}), 32) as rank
             FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
             {where_clause}
             ORDER BY rank DESC
@@ -521,19 +1113,46 @@ class PostgresChunksHandler(Handler):
             ]
         )
 
-        results = await self.connection_manager.fetch_query(query, params)
-        return [
-            ChunkSearchResult(
-                id=UUID(str(r["id"])),
-                document_id=UUID(str(r["document_id"])),
-                owner_id=UUID(str(r["owner_id"])),
-                collection_ids=r["collection_ids"],
-                text=r["text"],
-                score=float(r["rank"]),
-                metadata=json.loads(r["metadata"]),
-            )
-            for r in results
-        ]
+        return query, params
+
+    async def full_text_search(
+        self, query_text: str, search_settings: SearchSettings
+    ) -> list[ChunkSearchResult]:
+        query, params = self._build_full_text_query(
+            query_text, search_settings
+        )
+
+        results = await self.connection_manager.fetch_query(
+            query, params, read_only=True
+        )
+        return [self._full_text_search_result(r) for r in results]
+
+    def stream_full_text_search(
+        self,
+        query_text: str,
+        search_settings: SearchSettings,
+        prefetch: int = 500,
+    ) -> AsyncGenerator[ChunkSearchResult, None]:
+        """Streaming variant of `full_text_search` backed by a server-side
+        cursor. Returns up to `search_settings.limit` results."""
+        settings = copy.deepcopy(search_settings)
+        settings.hybrid_settings.full_text_limit = search_settings.limit
+        query, params = self._build_full_text_query(query_text, settings)
+        return self._stream_results(
+            query, params, prefetch, self._full_text_search_result
+        )
+
+    @staticmethod
+    def _full_text_search_result(r: Any) -> ChunkSearchResult:
+        return ChunkSearchResult(
+            id=UUID(str(r["id"])),
+            document_id=UUID(str(r["document_id"])),
+            owner_id=UUID(str(r["owner_id"])),
+            collection_ids=r["collection_ids"],
+            text=r["text"],
+            score=float(r["rank"]),
+            metadata=json.loads(r["metadata"]),
+        )
 
     async def hybrid_search(
         self,
@@ -543,38 +1162,28 @@ class PostgresChunksHandler(Handler):
         *args,
         **kwargs,
     ) -> list[ChunkSearchResult]:
-        if search_settings.hybrid_settings is None:
-            raise ValueError(
-                "Please provide a valid `hybrid_settings` in the `search_settings`."
-            )
-        if (
-            search_settings.hybrid_settings.full_text_limit
-            < search_settings.limit
-        ):
-            raise ValueError(
-                "The `full_text_limit` must be greater than or equal to the `limit`."
-            )
-
-        semantic_settings = copy.deepcopy(search_settings)
-        semantic_settings.limit += search_settings.offset
-
-        full_text_settings = copy.deepcopy(search_settings)
-        full_text_settings.hybrid_settings.full_text_limit += (
-            search_settings.offset
+        semantic_settings, full_text_settings = self._hybrid_leg_settings(
+            search_settings
         )
 
-        semantic_results: list[ChunkSearchResult] = await self.semantic_search(
-            query_vector, semantic_settings
+        if search_settings.hybrid_settings.fusion_mode == "sql":
+            return await self._fused_hybrid_search(
+                query_text,
+                query_vector,
+                search_settings,
+                semantic_settings,
+                full_text_settings,
+            )
+
+        # Both legs run on their own pooled connection, so they can be
+        # issued concurrently instead of paying for two round trips.
+        semantic_results, full_text_results = await asyncio.gather(
+            self.semantic_search(query_vector, semantic_settings),
+            self.full_text_search(query_text, full_text_settings),
         )
-        full_text_results: list[
-            ChunkSearchResult
-        ] = await self.full_text_search(query_text, full_text_settings)
 
         semantic_limit = search_settings.limit
         full_text_limit = search_settings.hybrid_settings.full_text_limit
-        semantic_weight = search_settings.hybrid_settings.semantic_weight
-        full_text_weight = search_settings.hybrid_settings.full_text_weight
-        rrf_k = search_settings.hybrid_settings.rrf_k
 
         combined_results: dict[uuid.UUID, HybridSearchIntermediateResult] = {}
 
@@ -605,12 +1214,11 @@ class PostgresChunksHandler(Handler):
         }
 
         for hyb_result in combined_results.values():
-            semantic_score = 1 / (rrf_k + hyb_result["semantic_rank"])
-            full_text_score = 1 / (rrf_k + hyb_result["full_text_rank"])
-            hyb_result["rrf_score"] = (
-                semantic_score * semantic_weight
-                + full_text_score * full_text_weight
-            ) / (semantic_weight + full_text_weight)
+            hyb_result["rrf_score"] = self._rrf_score(
+                hyb_result["semantic_rank"],
+                hyb_result["full_text_rank"],
+                search_settings,
+            )
 
         sorted_results = sorted(
             combined_results.values(),
@@ -639,6 +1247,288 @@ class PostgresChunksHandler(Handler):
             for result in offset_results
         ]
 
+    @staticmethod
+    def _hybrid_leg_settings(
+        search_settings: SearchSettings,
+    ) -> tuple[SearchSettings, SearchSettings]:
+        """Validates a hybrid search and returns the settings for its
+        semantic and full text legs, which both cover `offset` extra
+        results."""
+        if search_settings.hybrid_settings is None:
+            raise ValueError(
+                "Please provide a valid `hybrid_settings` in the `search_settings`."
+            )
+        if (
+            search_settings.hybrid_settings.full_text_limit
+            < search_settings.limit
+        ):
+            raise ValueError(
+                "The `full_text_limit` must be greater than or equal to the `limit`."
+            )
+
+        semantic_settings = copy.deepcopy(search_settings)
+        semantic_settings.limit += search_settings.offset
+
+        full_text_settings = copy.deepcopy(search_settings)
+        full_text_settings.hybrid_settings.full_text_limit += (
+            search_settings.offset
+        )
+        return semantic_settings, full_text_settings
+
+    @staticmethod
+    def _rrf_score(
+        semantic_rank: int,
+        full_text_rank: int,
+        search_settings: SearchSettings,
+    ) -> float:
+        hybrid_settings = search_settings.hybrid_settings
+        semantic_weight = hybrid_settings.semantic_weight
+        full_text_weight = hybrid_settings.full_text_weight
+        semantic_score = 1 / (hybrid_settings.rrf_k + semantic_rank)
+        full_text_score = 1 / (hybrid_settings.rrf_k + full_text_rank)
+        return (
+            semantic_score * semantic_weight
+            + full_text_score * full_text_weight
+        ) / (semantic_weight + full_text_weight)
+
+    def stream_hybrid_search(
+        self,
+        query_text: str,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+        prefetch: int = 500,
+        page_size: int = 1000,
+    ) -> AsyncGenerator[ChunkSearchResult, None]:
+        """Streaming variant of the parallel `hybrid_search`.
+
+        Each leg is read through its own cursor, keeping only chunk ids and
+        ranks, which are fused with the same reciprocal rank formula. The
+        fused chunks are then fetched by id `page_size` at a time, so large
+        limits hold ids in memory rather than full rows.
+        """
+        semantic_settings, full_text_settings = self._hybrid_leg_settings(
+            search_settings
+        )
+        semantic_query = self._build_semantic_query(
+            query_vector, semantic_settings
+        )
+        full_text_query = self._build_full_text_query(
+            query_text, full_text_settings
+        )
+        return self._stream_hybrid_results(
+            semantic_query,
+            full_text_query,
+            search_settings,
+            prefetch,
+            page_size,
+        )
+
+    async def _collect_ranks(
+        self, query: tuple[str, list[Any]], prefetch: int
+    ) -> dict[UUID, int]:
+        ranks: dict[UUID, int] = {}
+        async for row in self.connection_manager.stream_query(
+            *query, prefetch=prefetch, read_only=True
+        ):
+            ranks.setdefault(UUID(str(row["id"])), len(ranks) + 1)
+        return ranks
+
+    async def _stream_hybrid_results(
+        self,
+        semantic_query: tuple[str, list[Any]],
+        full_text_query: tuple[str, list[Any]],
+        search_settings: SearchSettings,
+        prefetch: int,
+        page_size: int,
+    ) -> AsyncGenerator[ChunkSearchResult, None]:
+        semantic_ranks, full_text_ranks = await asyncio.gather(
+            self._collect_ranks(semantic_query, prefetch),
+            self._collect_ranks(full_text_query, prefetch),
+        )
+
+        semantic_limit = search_settings.limit
+        full_text_limit = search_settings.hybrid_settings.full_text_limit
+        fused: list[tuple[float, UUID, int, int]] = []
+        # Semantic hits first, matching the tie order of `hybrid_search`
+        for chunk_id in {**semantic_ranks, **full_text_ranks}:
+            semantic_rank = semantic_ranks.get(chunk_id, semantic_limit)
+            full_text_rank = full_text_ranks.get(chunk_id, full_text_limit)
+            if (
+                semantic_rank <= semantic_limit * 2
+                and full_text_rank <= full_text_limit * 2
+            ):
+                fused.append(
+                    (
+                        self._rrf_score(
+                            semantic_rank, full_text_rank, search_settings
+                        ),
+                        chunk_id,
+                        semantic_rank,
+                        full_text_rank,
+                    )
+                )
+        fused.sort(key=lambda item: item[0], reverse=True)
+        fused = fused[
+            search_settings.offset : search_settings.offset
+            + search_settings.limit
+        ]
+
+        columns = list(_SEARCH_COLUMNS)
+        if search_settings.include_metadatas:
+            columns.append("metadata")
+        query = f"""
+            SELECT {", ".join(columns)}
+            FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+            WHERE id = ANY($1::uuid[])
+        """
+        for start in range(0, len(fused), page_size):
+            page = fused[start : start + page_size]
+            rows = await self.connection_manager.fetch_query(
+                query, [[item[1] for item in page]], read_only=True
+            )
+            rows_by_id = {UUID(str(row["id"])): row for row in rows}
+            for score, chunk_id, semantic_rank, full_text_rank in page:
+                row = rows_by_id.get(chunk_id)
+                if row is None:
+                    # Deleted since the ranks were read
+                    continue
+                metadata = (
+                    json.loads(row["metadata"])
+                    if search_settings.include_metadatas
+                    else {}
+                )
+                yield ChunkSearchResult(
+                    id=chunk_id,
+                    document_id=UUID(str(row["document_id"])),
+                    owner_id=UUID(str(row["owner_id"])),
+                    collection_ids=row["collection_ids"],
+                    text=row["text"],
+                    score=score,
+                    metadata={
+                        **metadata,
+                        "semantic_rank": semantic_rank,
+                        "full_text_rank": full_text_rank,
+                    },
+                )
+
+    async def _fused_hybrid_search(
+        self,
+        query_text: str,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+        semantic_settings: SearchSettings,
+        full_text_settings: SearchSettings,
+    ) -> list[ChunkSearchResult]:
+        """Performs the hybrid search as a single statement, pushing the
+        weighted reciprocal rank fusion down to the database.
+
+        Ranks, defaults and cutoffs mirror the `parallel` fusion mode so
+        that both modes return the same results.
+        """
+        semantic_query, params = self._build_semantic_query(
+            query_vector, semantic_settings, include_distance=True
+        )
+        full_text_query, params = self._build_full_text_query(
+            query_text, full_text_settings, params
+        )
+
+        semantic_limit_param = f"${len(params) + 1}"
+        full_text_limit_param = f"${len(params) + 2}"
+        semantic_weight_param = f"${len(params) + 3}::float8"
+        full_text_weight_param = f"${len(params) + 4}::float8"
+        rrf_k_param = f"${len(params) + 5}::float8"
+
+        query = f"""
+        WITH semantic_results AS (
+            {semantic_query}
+        ),
+        semantic AS (
+            SELECT id, ROW_NUMBER() OVER (ORDER BY distance) AS semantic_rank
+            FROM semantic_results
+        ),
+        full_text_results AS (
+            {full_text_query}
+        ),
+        full_text AS (
+            SELECT id, ROW_NUMBER() OVER (ORDER BY rank DESC) AS full_text_rank
+            FROM full_text_results
+        ),
+        fused AS (
+            SELECT
+                COALESCE(s.id, f.id) AS id,
+                COALESCE(s.semantic_rank, {semantic_limit_param}) AS semantic_rank,
+                COALESCE(f.full_text_rank, {full_text_limit_param}) AS full_text_rank,
+                s.id IS NOT NULL AS from_semantic
+            FROM semantic s
+            FULL OUTER JOIN full_text f ON s.id = f.id
+        ),
+        scored AS (
+            SELECT
+                *,
+                (
+                    (1.0 / ({rrf_k_param} + semantic_rank)) * {semantic_weight_param}
+                    + (1.0 / ({rrf_k_param} + full_text_rank)) * {full_text_weight_param}
+                ) / ({semantic_weight_param} + {full_text_weight_param}) AS rrf_score
+            FROM fused
+            WHERE semantic_rank <= {semantic_limit_param} * 2
+            AND full_text_rank <= {full_text_limit_param} * 2
+        )
+        SELECT
+            c.id,
+            c.document_id,
+            c.owner_id,
+            c.collection_ids,
+            c.text,
+            c.metadata,
+            scored.semantic_rank,
+            scored.full_text_rank,
+            scored.from_semantic,
+            scored.rrf_score
+        FROM scored
+        JOIN {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} c ON c.id = scored.id
+        ORDER BY scored.rrf_score DESC, scored.semantic_rank, scored.full_text_rank
+        OFFSET ${len(params) + 6}
+        LIMIT ${len(params) + 7}
+        """
+
+        params.extend(
+            [
+                search_settings.limit,
+                search_settings.hybrid_settings.full_text_limit,
+                search_settings.hybrid_settings.semantic_weight,
+                search_settings.hybrid_settings.full_text_weight,
+                search_settings.hybrid_settings.rrf_k,
+                search_settings.offset,
+                search_settings.limit,
+            ]
+        )
+
+        results = await self.connection_manager.fetch_query(
+            query, params, read_only=True
+        )
+
+        return [
+            ChunkSearchResult(
+                id=UUID(str(r["id"])),
+                document_id=UUID(str(r["document_id"])),
+                owner_id=UUID(str(r["owner_id"])),
+                collection_ids=r["collection_ids"],
+                text=r["text"],
+                score=float(r["rrf_score"]),
+                metadata={
+                    **(
+                        json.loads(r["metadata"])
+                        if search_settings.include_metadatas
+                        or not r["from_semantic"]
+                        else {}
+                    ),
+                    "semantic_rank": r["semantic_rank"],
+                    "full_text_rank": r["full_text_rank"],
+                },
+            )
+            for r in results
+        ]
+
     async def delete(
         self, filters: dict[str, Any]
     ) -> dict[str, dict[str, str]]:
@@ -647,13 +1537,7 @@ class PostgresChunksHandler(Handler):
             filters, params, mode="condition_only"
         )
 
-        query = f"""
-        DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-        WHERE {where_clause}
-        RETURNING id, document_id, text;
-        """
-
-        results = await self.connection_manager.fetch_query(query, params)
+        results = await self._delete_chunks(where_clause, params)
 
         return {
             str(result["id"]): {
@@ -690,19 +1574,10 @@ class PostgresChunksHandler(Handler):
         )
 
     async def delete_user_vector(self, owner_id: UUID) -> None:
-        query = f"""
-        DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-        WHERE owner_id = $1;
-        """
-        await self.connection_manager.execute_query(query, (owner_id,))
+        await self._delete_chunks("owner_id = $1", (owner_id,))
 
     async def delete_collection_vector(self, collection_id: UUID) -> None:
-        query = f"""
-         DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-         WHERE $1 = ANY(collection_ids)
-         RETURNING collection_ids
-         """
-        await self.connection_manager.fetchrow_query(query, (collection_id,))
+        await self._delete_chunks("$1 = ANY(collection_ids)", (collection_id,))
         return None
 
     async def list_document_chunks(
@@ -741,7 +1616,9 @@ class PostgresChunksHandler(Handler):
                     "text": result["text"],
                     "metadata": json.loads(result["metadata"]),
                     "vector": (
-                        json.loads(result["vec"]) if include_vectors else None
+                        vector_to_list(result["vec"])
+                        if include_vectors
+                        else None
                     ),
                 }
                 for result in results
@@ -1122,7 +1999,9 @@ class PostgresChunksHandler(Handler):
         params.extend([limit, offset])
 
         # Execute the query
-        results = await self.connection_manager.fetch_query(query, params)
+        results = await self.connection_manager.fetch_query(
+            query, params, read_only=True
+        )
 
         # Process results
         chunks = []
@@ -1130,22 +2009,66 @@ class PostgresChunksHandler(Handler):
         if results:
             total_entries = results[0].get("total_entries", 0)
             chunks = [
-                {
-                    "id": str(result["id"]),
-                    "document_id": str(result["document_id"]),
-                    "owner_id": str(result["owner_id"]),
-                    "collection_ids": result["collection_ids"],
-                    "text": result["text"],
-                    "metadata": json.loads(result["metadata"]),
-                    "vector": (
-                        json.loads(result["vec"]) if include_vectors else None
-                    ),
-                }
+                self._chunk_record(result, include_vectors)
                 for result in results
             ]
 
         return {"results": chunks, "total_entries": total_entries}
 
+    async def stream_chunks(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        filters: Optional[dict[str, Any]] = None,
+        include_vectors: bool = False,
+        prefetch: int = 500,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Streaming variant of `list_chunks` backed by a server-side cursor.
+
+        Unlike `list_chunks` no total count is computed, since that would
+        force Postgres to materialize every matching row up front.
+        """
+        vector_select = ", vec" if include_vectors else ""
+        params: list[str | int | bytes] = []
+        where_clause = ""
+        if filters:
+            where_clause, params = apply_filters(
+                filters, params, mode="where_clause"
+            )
+
+        limit_clause = ""
+        if limit is not None:
+            params.append(limit)
+            limit_clause = f"LIMIT ${len(params)}"
+        params.append(offset)
+
+        query = f"""
+        SELECT id, document_id, owner_id, collection_ids, text, metadata{vector_select}
+        FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        {where_clause}
+        {limit_clause}
+        OFFSET ${len(params)}
+        """
+
+        async for result in self.connection_manager.stream_query(
+            query, params, prefetch=prefetch, read_only=True
+        ):
+            yield self._chunk_record(result, include_vectors)
+
+    @staticmethod
+    def _chunk_record(result: Any, include_vectors: bool) -> dict[str, Any]:
+        return {
+            "id": str(result["id"]),
+            "document_id": str(result["document_id"]),
+            "owner_id": str(result["owner_id"]),
+            "collection_ids": result["collection_ids"],
+            "text": result["text"],
+            "metadata": json.loads(result["metadata"]),
+            "vector": (
+                vector_to_list(result["vec"]) if include_vectors else None
+            ),
+        }
+
     async def search_documents(
         self,
         query_text: str,
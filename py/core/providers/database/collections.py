@@ -23,6 +23,7 @@ from core.base.abstractions import (
 from core.base.api.models import CollectionResponse
 
 from .base import PostgresConnectionManager
+from .user_cache import UserCache
 
 logger = logging.getLogger()
 
@@ -35,8 +36,10 @@ class PostgresCollectionsHandler(Handler):
         project_name: str,
         connection_manager: PostgresConnectionManager,
         config: DatabaseConfig,
+        user_cache: Optional[UserCache] = None,
     ):
         self.config = config
+        self.user_cache = user_cache
         super().__init__(project_name, connection_manager)
 
     async def create_tables(self) -> None:
@@ -258,6 +261,9 @@ class PostgresCollectionsHandler(Handler):
         await self.connection_manager.execute_query(
             user_update_query, [collection_id]
         )
+        if self.user_cache is not None:
+            # Membership of an unknown set of users changed
+            self.user_cache.clear()
 
         # Remove collection_id from documents
         document_update_query = f"""
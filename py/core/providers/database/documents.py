@@ -24,6 +24,7 @@ from core.base import (
 
 from .base import PostgresConnectionManager
 from .filters import apply_filters
+from .vector_codec import vector_to_list
 
 logger = logging.getLogger()
 
@@ -640,27 +641,7 @@ class PostgresDocumentsHandler(Handler):
 
             documents = []
             for row in results:
-                # Safely handle the embedding
-                embedding = None
-                if (
-                    "summary_embedding" in row
-                    and row["summary_embedding"] is not None
-                ):
-                    try:
-                        # The embedding is stored as a string like "[0.1, 0.2, ...]"
-                        embedding_str = row["summary_embedding"]
-                        if embedding_str.startswith(
-                            "["
-                        ) and embedding_str.endswith("]"):
-                            embedding = [
-                                float(x)
-                                for x in embedding_str[1:-1].split(",")
-                                if x
-                            ]
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to parse embedding for document {row['id']}: {e}"
-                        )
+                embedding = vector_to_list(row["summary_embedding"])
 
                 documents.append(
                     DocumentResponse(
@@ -740,7 +721,7 @@ class PostgresDocumentsHandler(Handler):
         embeddings."""
 
         where_clauses = ["summary_embedding IS NOT NULL"]
-        params: list[str | int | bytes] = [str(query_embedding)]
+        params: list[Any] = [query_embedding]
 
         vector_dim = (
             "" if math.isnan(self.dimension) else f"({self.dimension})"
@@ -814,11 +795,7 @@ class PostgresDocumentsHandler(Handler):
                 created_at=row["created_at"],
                 updated_at=row["updated_at"],
                 summary=row["summary"],
-                summary_embedding=[
-                    float(x)
-                    for x in row["summary_embedding"][1:-1].split(",")
-                    if x
-                ],
+                summary_embedding=vector_to_list(row["summary_embedding"]),
                 total_tokens=row["total_tokens"],
             )
             for row in results
@@ -899,15 +876,7 @@ class PostgresDocumentsHandler(Handler):
                 created_at=row["created_at"],
                 updated_at=row["updated_at"],
                 summary=row["summary"],
-                summary_embedding=(
-                    [
-                        float(x)
-                        for x in row["summary_embedding"][1:-1].split(",")
-                        if x
-                    ]
-                    if row["summary_embedding"]
-                    else None
-                ),
+                summary_embedding=vector_to_list(row["summary_embedding"]),
                 total_tokens=row["total_tokens"],
             )
             for row in results
@@ -1,8 +1,9 @@
 import io
 import logging
+import tempfile
 from datetime import datetime
 from io import BytesIO
-from typing import BinaryIO, Optional
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Optional
 from uuid import UUID
 from zipfile import ZipFile
 
@@ -15,6 +16,11 @@ from .base import PostgresConnectionManager
 
 logger = logging.getLogger()
 
+# Large objects are written and read in chunks of this size
+LOBJECT_CHUNK_SIZE = 1024 * 1024
+# Retrieved files larger than this are spooled to a temporary file
+FILE_SPOOL_MAX_MEMORY = 16 * 1024 * 1024
+
 
 class PostgresFilesHandler(Handler):
     """PostgreSQL implementation of the FileHandler."""
@@ -64,7 +70,13 @@ class PostgresFilesHandler(Handler):
         file_type: Optional[str] = None,
     ) -> None:
         """Add or update a file entry in storage."""
-        query = f"""
+        await self.connection_manager.execute_query(
+            self._upsert_file_query(),
+            [document_id, file_name, file_oid, file_size, file_type],
+        )
+
+    def _upsert_file_query(self) -> str:
+        return f"""
         INSERT INTO {self._get_table_name(PostgresFilesHandler.TABLE_NAME)}
         (document_id, name, oid, size, type)
         VALUES ($1, $2, $3, $4, $5)
@@ -75,9 +87,6 @@ class PostgresFilesHandler(Handler):
             type = EXCLUDED.type,
             updated_at = NOW();
         """
-        await self.connection_manager.execute_query(
-            query, [document_id, file_name, file_oid, file_size, file_type]
-        )
 
     async def store_file(
         self,
@@ -87,42 +96,72 @@ class PostgresFilesHandler(Handler):
         file_type: Optional[str] = None,
     ) -> None:
         """Store a new file in the database."""
-        size = file_content.getbuffer().nbytes
 
+        async def read_chunks() -> AsyncIterator[bytes]:
+            while chunk := file_content.read(LOBJECT_CHUNK_SIZE):
+                yield chunk
+
+        await self.store_file_stream(
+            document_id, file_name, read_chunks(), file_type
+        )
+
+    async def store_file_stream(
+        self,
+        document_id: UUID,
+        file_name: str,
+        chunks: AsyncIterable[bytes],
+        file_type: Optional[str] = None,
+    ) -> int:
+        """Store a file from a stream of byte chunks and return its size.
+
+        Each chunk is written to the large object as it arrives, so the
+        file is never held in memory as a whole. If the stream raises, for
+        example because an upload exceeded its size limit, the transaction
+        is rolled back and the large object discarded with it.
+        """
         async with (
             self.connection_manager.pool.get_connection() as conn  # type: ignore
         ):
             async with conn.transaction():
                 oid = await conn.fetchval("SELECT lo_create(0)")
-                await self._write_lobject(conn, oid, file_content)
-                await self.upsert_file(
-                    document_id, file_name, oid, size, file_type
+                size = await self._write_lobject(conn, oid, chunks)
+                # On the same connection, so the row and the large object
+                # are committed together
+                await conn.execute(
+                    self._upsert_file_query(),
+                    document_id,
+                    file_name,
+                    oid,
+                    size,
+                    file_type,
                 )
+        return size
 
     async def _write_lobject(
-        self, conn, oid: int, file_content: io.BytesIO
-    ) -> None:
+        self, conn, oid: int, chunks: AsyncIterable[bytes]
+    ) -> int:
         """Write content to a large object."""
         lobject = await conn.fetchval("SELECT lo_open($1, $2)", oid, 0x20000)
 
+        size = 0
         try:
-            chunk_size = 8192  # 8 KB chunks
-            while True:
-                if chunk := file_content.read(chunk_size):
+            async for chunk in chunks:
+                if chunk:
+                    size += len(chunk)
                     await conn.execute(
                         "SELECT lowrite($1, $2)", lobject, chunk
                     )
-                else:
-                    break
 
             await conn.execute("SELECT lo_close($1)", lobject)
 
+        except R2RException:
+            raise
         except Exception as e:
-            await conn.execute("SELECT lo_unlink($1)", oid)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to write to large object: {e}",
             ) from e
+        return size
 
     async def retrieve_file(
         self, document_id: UUID
@@ -149,9 +188,20 @@ class PostgresFilesHandler(Handler):
             result["size"],
         )
 
-        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-            file_content = await self._read_lobject(conn, oid)
-            return file_name, io.BytesIO(file_content), size
+        # Spooled to disk past FILE_SPOOL_MAX_MEMORY, so large files are
+        # never held in memory as a whole
+        file_content = tempfile.SpooledTemporaryFile(
+            max_size=FILE_SPOOL_MAX_MEMORY
+        )
+        try:
+            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+                async for chunk in self._iter_lobject(conn, oid):
+                    file_content.write(chunk)
+        except BaseException:
+            file_content.close()
+            raise
+        file_content.seek(0)
+        return file_name, file_content, size
 
     async def retrieve_files_as_zip(
         self,
@@ -212,8 +262,15 @@ class PostgresFilesHandler(Handler):
     async def _read_lobject(self, conn, oid: int) -> bytes:
         """Read content from a large object."""
         file_data = io.BytesIO()
-        chunk_size = 8192
+        async for chunk in self._iter_lobject(conn, oid):
+            file_data.write(chunk)
+        return file_data.getvalue()
 
+    async def _iter_lobject(
+        self, conn, oid: int, chunk_size: int = LOBJECT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a large object in chunks."""
+        lobject = None
         async with conn.transaction():
             try:
                 lo_exists = await conn.fetchval(
@@ -242,16 +299,15 @@ class PostgresFilesHandler(Handler):
                     )
                     if not chunk:
                         break
-                    file_data.write(chunk)
+                    yield chunk
             except asyncpg.exceptions.UndefinedObjectError:
                 raise R2RException(
                     status_code=404,
                     message=f"Failed to read large object {oid}",
                 ) from None
             finally:
-                await conn.execute("SELECT lo_close($1)", lobject)
-
-        return file_data.getvalue()
+                if lobject is not None:
+                    await conn.execute("SELECT lo_close($1)", lobject)
 
     async def delete_file(self, document_id: UUID) -> bool:
         """Delete a file from storage."""
@@ -128,9 +128,6 @@ class PostgresEntitiesHandler(Handler):
             with contextlib.suppress(json.JSONDecodeError):
                 metadata = json.loads(metadata)
 
-        if isinstance(description_embedding, list):
-            description_embedding = str(description_embedding)
-
         query = f"""
             INSERT INTO {self._get_table_name(table_name)}
             (name, category, description, parent_id, description_embedding, chunk_ids, metadata)
@@ -781,9 +778,6 @@ class PostgresRelationshipsHandler(Handler):
             with contextlib.suppress(json.JSONDecodeError):
                 metadata = json.loads(metadata)
 
-        if isinstance(description_embedding, list):
-            description_embedding = str(description_embedding)
-
         query = f"""
             INSERT INTO {self._get_table_name(table_name)}
             (subject, predicate, object, description, subject_id, object_id,
@@ -1244,9 +1238,6 @@ class PostgresCommunitiesHandler(Handler):
     ) -> Community:
         table_name = "graphs_communities"
 
-        if isinstance(description_embedding, list):
-            description_embedding = str(description_embedding)
-
         query = f"""
             INSERT INTO {self._get_table_name(table_name)}
             (collection_id, name, summary, findings, rating, rating_explanation, description_embedding)
@@ -2275,10 +2266,6 @@ class PostgresGraphsHandler(Handler):
         return communities, count
 
     async def add_community(self, community: Community) -> None:
-        # TODO: Fix in the short term.
-        # we need to do this because postgres insert needs to be a string
-        community.description_embedding = str(community.description_embedding)  # type: ignore[assignment]
-
         non_null_attrs = {
             k: v for k, v in community.__dict__.items() if v is not None
         }
@@ -2553,8 +2540,8 @@ class PostgresGraphsHandler(Handler):
         property_names_str = ", ".join(property_names)
 
         # Build the WHERE clause from filters
-        params: list[str | int | bytes] = [
-            json.dumps(query_embedding),
+        params: list[Any] = [
+            query_embedding,
             limit,
         ]
         conditions_clause = self._build_filters(filters, params, search_type)
@@ -2576,7 +2563,7 @@ class PostgresGraphsHandler(Handler):
         """
 
         results = await self.connection_manager.fetch_query(
-            QUERY, tuple(params)
+            QUERY, tuple(params), read_only=True
         )
 
         for result in results:
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
@@ -8,12 +10,34 @@ from shared.abstractions import User
 
 from ...base.providers.database import DatabaseConfig, LimitSettings
 from .base import PostgresConnectionManager
+from .rate_limiter import (
+    InMemoryRateLimitBackend,
+    PostgresRateLimitBackend,
+    RateLimitBackend,
+    SlidingWindowRateLimiter,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _MonthlyUsage:
+    """Request log count for the month as of the last refresh, plus the
+    requests this process has recorded since."""
+
+    def __init__(self, month_start: datetime, baseline: int):
+        self.month_start = month_start
+        self.baseline = baseline
+        self.recorded = 0
+        self.refreshed_at = time.monotonic()
+
+    @property
+    def total(self) -> int:
+        return self.baseline + self.recorded
+
+
 class PostgresLimitsHandler(Handler):
     TABLE_NAME = "request_log"
+    COUNTERS_TABLE_NAME = "rate_limit_counters"
 
     def __init__(
         self,
@@ -26,11 +50,38 @@ class PostgresLimitsHandler(Handler):
         """
         super().__init__(project_name, connection_manager)
         self.config = config
+        self.settings = config.rate_limiter_settings
+
+        backend: RateLimitBackend
+        if self.settings.counter_backend == "postgres":
+            backend = PostgresRateLimitBackend(
+                connection_manager,
+                self._get_table_name(
+                    PostgresLimitsHandler.COUNTERS_TABLE_NAME
+                ),
+            )
+        elif self.settings.counter_backend == "memory":
+            backend = InMemoryRateLimitBackend()
+        else:
+            raise ValueError(
+                f"Invalid rate limiter counter backend '{self.settings.counter_backend}', expected one of 'memory' or 'postgres'."
+            )
+        self.limiter = SlidingWindowRateLimiter(backend)
+        self._monthly_usage: dict[tuple[UUID, str], _MonthlyUsage] = {}
+        self._pending_logs: list[tuple[datetime, UUID, str]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._next_prune = 0.0
 
         logger.debug(
             f"Initialized PostgresLimitsHandler with project: {project_name}"
         )
 
+    def set_backend(self, backend: RateLimitBackend) -> None:
+        """Shares the per-minute counters across workers through
+        `backend`."""
+        self.limiter.backend = backend
+
     async def create_tables(self):
         query = f"""
         CREATE TABLE IF NOT EXISTS {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)} (
@@ -38,9 +89,13 @@ class PostgresLimitsHandler(Handler):
             user_id UUID NOT NULL,
             route TEXT NOT NULL
         );
+        CREATE INDEX IF NOT EXISTS idx_request_log_user_route_time_{self.project_name}
+        ON {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)} (user_id, route, time);
         """
         logger.debug("Creating request_log table if not exists")
         await self.connection_manager.execute_query(query)
+        if isinstance(self.limiter.backend, PostgresRateLimitBackend):
+            await self.limiter.backend.create_table()
 
     async def _count_requests(
         self,
@@ -50,6 +105,8 @@ class PostgresLimitsHandler(Handler):
     ) -> int:
         """Count how many requests a user (optionally for a specific route) has
         made since the given datetime."""
+        # Make sure buffered requests are visible to the count
+        await self.flush_request_log()
         if route:
             query = f"""
             SELECT COUNT(*)::int
@@ -152,56 +209,94 @@ class PostgresLimitsHandler(Handler):
 
         return effective
 
+    @staticmethod
+    def _counter_key(user_id: UUID, route: Optional[str]) -> str:
+        return f"{user_id}:{route or ''}"
+
+    async def _monthly_requests(self, user_id: UUID, route: str) -> int:
+        """This month's request count for a user and route.
+
+        The count is read from the request log at most once every
+        `monthly_refresh_seconds`; requests recorded by this process in
+        between are added on top.
+        """
+        now = datetime.now(timezone.utc)
+        month_start = now.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        usage = self._monthly_usage.get((user_id, route))
+        if (
+            usage is not None
+            and usage.month_start == month_start
+            and time.monotonic() - usage.refreshed_at
+            < self.settings.monthly_refresh_seconds
+        ):
+            return usage.total
+
+        if usage is not None and usage.month_start != month_start:
+            self._monthly_usage = {
+                key: value
+                for key, value in self._monthly_usage.items()
+                if value.month_start == month_start
+            }
+        baseline = await self._count_monthly_requests(user_id, route)
+        usage = _MonthlyUsage(month_start, baseline)
+        self._monthly_usage[(user_id, route)] = usage
+        return usage.total
+
     async def check_limits(self, user: User, route: str):
         """Perform rate limit checks for a user on a specific route.
 
+        Per-minute limits are checked against sliding-window counters and
+        monthly limits against a periodically refreshed count, so the
+        request log is not scanned on every request.
+
         :param user: The fully-fetched User object with .limits_overrides, etc.
         :param route: The route/path being accessed.
         :raises ValueError: if any limit is exceeded.
         """
         user_id = user.id
-        now = datetime.now(timezone.utc)
-        one_min_ago = now - timedelta(minutes=1)
 
         # 1) Compute the final (effective) limits for this user & route
         limits = self.determine_effective_limits(user, route)
 
         # 2) Check each of them in turn, if they exist
-        # ------------------------------------------------------------
-        # Global per-minute limit
-        # ------------------------------------------------------------
-        if limits.global_per_min is not None:
-            user_req_count = await self._count_requests(
-                user_id, None, one_min_ago
+        if (
+            limits.global_per_min is not None
+            or limits.route_per_min is not None
+        ):
+            user_req_count, route_req_count = await self.limiter.counts(
+                [
+                    self._counter_key(user_id, None),
+                    self._counter_key(user_id, route),
+                ]
             )
-            if user_req_count > limits.global_per_min:
+
+            # Global per-minute limit
+            if (
+                limits.global_per_min is not None
+                and user_req_count > limits.global_per_min
+            ):
                 logger.warning(
                     f"Global per-minute limit exceeded for "
                     f"user_id={user_id}, route={route}"
                 )
                 raise ValueError("Global per-minute rate limit exceeded")
 
-        # ------------------------------------------------------------
-        # Route-specific per-minute limit
-        # ------------------------------------------------------------
-        if limits.route_per_min is not None:
-            route_req_count = await self._count_requests(
-                user_id, route, one_min_ago
-            )
-            if route_req_count > limits.route_per_min:
+            # Route-specific per-minute limit
+            if (
+                limits.route_per_min is not None
+                and route_req_count > limits.route_per_min
+            ):
                 logger.warning(
                     f"Per-route per-minute limit exceeded for "
                     f"user_id={user_id}, route={route}"
                 )
                 raise ValueError("Per-route per-minute rate limit exceeded")
 
-        # ------------------------------------------------------------
         # Monthly limit
-        # ------------------------------------------------------------
         if limits.monthly_limit is not None:
-            # If you truly want a per-route monthly limit, we pass 'route'.
-            # If you want a global monthly limit, pass 'None'.
-            monthly_count = await self._count_monthly_requests(user_id, route)
+            monthly_count = await self._monthly_requests(user_id, route)
             if monthly_count > limits.monthly_limit:
                 logger.warning(
                     f"Monthly limit exceeded for user_id={user_id}, "
@@ -210,13 +305,80 @@ class PostgresLimitsHandler(Handler):
                 raise ValueError("Monthly rate limit exceeded")
 
     async def log_request(self, user_id: UUID, route: str):
-        """Log a successful request to the request_log table."""
+        """Record a successful request.
+
+        The rate limit counters are updated immediately; the request_log
+        row is buffered and written in batches by a background task.
+        """
+        await self.limiter.hit(
+            [
+                self._counter_key(user_id, None),
+                self._counter_key(user_id, route),
+            ]
+        )
+        usage = self._monthly_usage.get((user_id, route))
+        if usage is not None:
+            usage.recorded += 1
+
+        self._pending_logs.append((datetime.now(timezone.utc), user_id, route))
+        if len(self._pending_logs) >= self.settings.flush_batch_size:
+            await self.flush_request_log()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self):
+        while self._pending_logs:
+            await asyncio.sleep(self.settings.flush_interval_seconds)
+            try:
+                await self.flush_request_log()
+                await self._prune_request_log()
+            except Exception as e:
+                logger.error(f"Failed to flush request log: {e}")
+
+    async def flush_request_log(self):
+        """Write all buffered request_log rows."""
+        async with self._flush_lock:
+            if not self._pending_logs:
+                return
+            batch, self._pending_logs = self._pending_logs, []
+            query = f"""
+            INSERT INTO {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)}
+            (time, user_id, route)
+            VALUES ($1, $2, $3)
+            """
+            try:
+                await self.connection_manager.execute_many(query, batch)
+            except Exception:
+                # Keep the rows for the next attempt, dropping the oldest
+                # ones if the database stays unreachable
+                self._pending_logs = (batch + self._pending_logs)[
+                    -self.settings.max_pending_logs :
+                ]
+                raise
+
+    async def _prune_request_log(self):
+        retention_days = self.settings.request_log_retention_days
+        if retention_days is None or time.monotonic() < self._next_prune:
+            return
+        self._next_prune = time.monotonic() + 3600
         query = f"""
-        INSERT INTO {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)}
-        (time, user_id, route)
-        VALUES (CURRENT_TIMESTAMP AT TIME ZONE 'UTC', $1, $2)
+        DELETE FROM {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)}
+        WHERE time < $1
         """
-        await self.connection_manager.execute_query(query, [user_id, route])
+        await self.connection_manager.execute_query(
+            query,
+            [datetime.now(timezone.utc) - timedelta(days=retention_days)],
+        )
+
+    async def close(self):
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        try:
+            await self.flush_request_log()
+        except Exception as e:
+            logger.error(
+                f"Dropping {len(self._pending_logs)} request log rows: {e}"
+            )
 
 
 # import logging
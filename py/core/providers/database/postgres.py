@@ -24,6 +24,7 @@ from .graphs import (
 from .limits import PostgresLimitsHandler
 from .prompts_handler import PostgresPromptsHandler
 from .tokens import PostgresTokensHandler
+from .user_cache import UserCache
 from .users import PostgresUserHandler
 
 if TYPE_CHECKING:
@@ -117,6 +118,12 @@ class PostgresDatabaseProvider(DatabaseProvider):
             self.connection_string = f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
             logger.info("Connecting to Postgres via TCP/IP")
 
+        self.read_replica_connection_string: Optional[str] = (
+            config.read_replica_dsn
+            or os.getenv("R2R_POSTGRES_READ_REPLICA_DSN")
+        )
+        self.read_pool: Optional[SemaphoreConnectionPool] = None
+
         self.dimension = dimension
         self.quantization_type = quantization_type
         self.conn = None
@@ -139,19 +146,29 @@ class PostgresDatabaseProvider(DatabaseProvider):
             dimension=self.dimension,
         )
         self.token_handler = PostgresTokensHandler(
-            self.project_name, self.connection_manager
+            self.project_name,
+            self.connection_manager,
+            cache_settings=self.config.token_blacklist_cache_settings,
         )
+        self.user_cache = UserCache(self.config.user_cache_settings)
         self.collections_handler = PostgresCollectionsHandler(
-            self.project_name, self.connection_manager, self.config
+            self.project_name,
+            self.connection_manager,
+            self.config,
+            user_cache=self.user_cache,
         )
         self.users_handler = PostgresUserHandler(
-            self.project_name, self.connection_manager, self.crypto_provider
+            self.project_name,
+            self.connection_manager,
+            self.crypto_provider,
+            user_cache=self.user_cache,
         )
         self.chunks_handler = PostgresChunksHandler(
             project_name=self.project_name,
             connection_manager=self.connection_manager,
             dimension=self.dimension,
             quantization_type=(self.quantization_type),
+            config=self.config,
         )
         self.conversations_handler = PostgresConversationsHandler(
             self.project_name, self.connection_manager
@@ -216,6 +233,29 @@ class PostgresDatabaseProvider(DatabaseProvider):
                 f'CREATE SCHEMA IF NOT EXISTS "{self.project_name}";'
             )
 
+        # Connections opened before the pgvector extension existed lack the
+        # binary vector codec, so recycle them now that it is available.
+        await self.pool.reset_connections()
+
+        # The replica pool is created only once the extension exists, so its
+        # connections register the vector codec on first use.
+        if self.read_replica_connection_string:
+            logger.info("Routing read-only queries to the read replica.")
+            replica_settings = self.postgres_configuration_settings
+            if self.config.read_replica_max_connections:
+                replica_settings = replica_settings.model_copy(
+                    update={
+                        "max_connections": self.config.read_replica_max_connections
+                    }
+                )
+            self.read_pool = SemaphoreConnectionPool(
+                self.read_replica_connection_string, replica_settings
+            )
+            await self.read_pool.initialize()
+            await self.connection_manager.initialize(
+                self.pool, read_pool=self.read_pool
+            )
+
         await self.documents_handler.create_tables()
         await self.collections_handler.create_tables()
         await self.token_handler.create_tables()
@@ -275,8 +315,11 @@ class PostgresDatabaseProvider(DatabaseProvider):
         return settings
 
     async def close(self):
+        await self.limits_handler.close()
         if self.pool:
             await self.pool.close()
+        if self.read_pool:
+            await self.read_pool.close()
 
     async def __aenter__(self):
         await self.initialize()
@@ -0,0 +1,174 @@
+"""Sliding-window request counters used for rate limiting.
+
+Per-minute limits are enforced with the sliding window counter
+approximation: every key keeps a count for the current and the previous
+fixed window, and the number of requests "in the last window" is the
+current count plus the previous count weighted by how much of the
+previous window still overlaps it. That is two integers per key instead of
+a `request_log` scan per check.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Optional
+
+
+class RateLimitBackend(ABC):
+    """Store for fixed-window request counters.
+
+    The default implementation is process-local; `PostgresRateLimitBackend`
+    (or any other shared store) makes limits hold across workers.
+    """
+
+    @abstractmethod
+    async def increment(self, keys: list[str], ttl_seconds: float) -> None:
+        """Increments each counter in `keys`, creating missing counters
+        with the given time to live."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[int]:
+        """Returns the current value of each counter, 0 if missing."""
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self):
+        # key -> [expires_at, count]
+        self._counters: dict[str, list] = {}
+        self._next_sweep = 0.0
+
+    async def increment(self, keys: list[str], ttl_seconds: float) -> None:
+        now = time.monotonic()
+        for key in keys:
+            counter = self._counters.get(key)
+            if counter is None or counter[0] <= now:
+                self._counters[key] = [now + ttl_seconds, 1]
+            else:
+                counter[1] += 1
+
+        if now >= self._next_sweep:
+            self._counters = {
+                key: counter
+                for key, counter in self._counters.items()
+                if counter[0] > now
+            }
+            self._next_sweep = now + ttl_seconds
+
+    async def get_many(self, keys: list[str]) -> list[int]:
+        now = time.monotonic()
+        counts = []
+        for key in keys:
+            counter = self._counters.get(key)
+            counts.append(
+                counter[1] if counter is not None and counter[0] > now else 0
+            )
+        return counts
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class PostgresRateLimitBackend(RateLimitBackend):
+    """Counters shared by every worker, stored in an unlogged table.
+
+    Counters are short-lived and can be rebuilt from nothing, so the table
+    skips the write-ahead log; a crash simply resets the current window.
+    Expired rows are reset in place on the next increment and swept
+    periodically.
+    """
+
+    def __init__(self, connection_manager: Any, table_name: str):
+        self.connection_manager = connection_manager
+        self.table_name = table_name
+        self._next_sweep = 0.0
+
+    async def create_table(self) -> None:
+        await self.connection_manager.execute_query(
+            f"""
+            CREATE UNLOGGED TABLE IF NOT EXISTS {self.table_name} (
+                key TEXT PRIMARY KEY,
+                count BIGINT NOT NULL,
+                expires_at TIMESTAMPTZ NOT NULL
+            );
+            """
+        )
+
+    async def increment(self, keys: list[str], ttl_seconds: float) -> None:
+        # One row per key, in a stable order so that concurrent upserts
+        # lock rows consistently
+        increments = sorted(Counter(keys).items())
+        await self.connection_manager.execute_query(
+            f"""
+            INSERT INTO {self.table_name} AS c (key, count, expires_at)
+            SELECT key, n, now() + make_interval(secs => $3)
+            FROM unnest($1::text[], $2::int[]) AS u(key, n)
+            ON CONFLICT (key) DO UPDATE SET
+                count = CASE WHEN c.expires_at <= now()
+                    THEN EXCLUDED.count ELSE c.count + EXCLUDED.count END,
+                expires_at = CASE WHEN c.expires_at <= now()
+                    THEN EXCLUDED.expires_at ELSE c.expires_at END
+            """,
+            [
+                [key for key, _ in increments],
+                [n for _, n in increments],
+                ttl_seconds,
+            ],
+        )
+
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._next_sweep = now + ttl_seconds
+            await self.connection_manager.execute_query(
+                f"DELETE FROM {self.table_name} WHERE expires_at <= now()"
+            )
+
+    async def get_many(self, keys: list[str]) -> list[int]:
+        rows = await self.connection_manager.fetch_query(
+            f"""
+            SELECT key, count
+            FROM {self.table_name}
+            WHERE key = ANY($1::text[]) AND expires_at > now()
+            """,
+            [keys],
+        )
+        counts = {row["key"]: row["count"] for row in rows}
+        return [counts.get(key, 0) for key in keys]
+
+
+class SlidingWindowRateLimiter:
+    def __init__(
+        self, backend: RateLimitBackend, window_seconds: float = 60.0
+    ):
+        self.backend = backend
+        self.window_seconds = window_seconds
+
+    def _window(self, now: Optional[float]) -> tuple[int, float]:
+        """Returns the current window index and the elapsed fraction of
+        it."""
+        now = time.time() if now is None else now
+        index = int(now // self.window_seconds)
+        elapsed = now / self.window_seconds - index
+        return index, elapsed
+
+    async def counts(
+        self, keys: list[str], now: Optional[float] = None
+    ) -> list[float]:
+        """Estimated number of hits for each key over the last window."""
+        index, elapsed = self._window(now)
+        raw = await self.backend.get_many(
+            [f"{key}:{i}" for key in keys for i in (index - 1, index)]
+        )
+        return [
+            raw[2 * i] * (1 - elapsed) + raw[2 * i + 1]
+            for i in range(len(keys))
+        ]
+
+    async def hit(self, keys: list[str], now: Optional[float] = None) -> None:
+        index, _ = self._window(now)
+        await self.backend.increment(
+            [f"{key}:{index}" for key in keys],
+            # The previous window is still read while the current one fills
+            ttl_seconds=2 * self.window_seconds,
+        )
@@ -1,18 +1,75 @@
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from core.base import Handler
+from core.base.providers.database import TokenBlacklistCacheSettings
 
 from .base import PostgresConnectionManager
 
+logger = logging.getLogger()
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings.
+
+    Sized for `capacity` items at the given false positive rate; the `k`
+    bit positions are derived from one blake2b digest with double hashing.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        self.capacity = capacity
+        self.num_bits = max(
+            8,
+            math.ceil(
+                -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+            ),
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
 
 class PostgresTokensHandler(Handler):
     TABLE_NAME = "blacklisted_tokens"
 
     def __init__(
-        self, project_name: str, connection_manager: PostgresConnectionManager
+        self,
+        project_name: str,
+        connection_manager: PostgresConnectionManager,
+        cache_settings: Optional[TokenBlacklistCacheSettings] = None,
     ):
         super().__init__(project_name, connection_manager)
+        self.cache_settings = cache_settings or TokenBlacklistCacheSettings()
+
+        self._bloom: Optional[BloomFilter] = None
+        # Tokens blacklisted since the last rebuild, answered without a query
+        self._recent: set[str] = set()
+        self._watermark: Optional[datetime] = None
+        self._next_refresh = 0.0
+        self._next_rebuild = 0.0
+        self._refresh_lock = asyncio.Lock()
 
     async def create_tables(self):
         query = f"""
@@ -41,8 +98,17 @@ class PostgresTokensHandler(Handler):
         await self.connection_manager.execute_query(
             query, [token, current_time]
         )
+        self._remember(token)
 
-    async def is_token_blacklisted(self, token: str) -> bool:
+    def _remember(self, token: str) -> None:
+        self._recent.add(token)
+        if self._bloom is not None:
+            self._bloom.add(token)
+            if self._bloom.count > self._bloom.capacity:
+                # Past capacity the false positive rate degrades quickly
+                self._next_rebuild = 0.0
+
+    async def _query_blacklisted(self, token: str) -> bool:
         query = f"""
         SELECT 1 FROM {self._get_table_name(PostgresTokensHandler.TABLE_NAME)}
         WHERE token = $1
@@ -51,6 +117,82 @@ class PostgresTokensHandler(Handler):
         result = await self.connection_manager.fetchrow_query(query, [token])
         return bool(result)
 
+    async def _refresh_filter(self) -> None:
+        """Rebuilds the bloom filter from the whole table when it is due,
+        otherwise adds the tokens blacklisted since the last refresh."""
+        async with self._refresh_lock:
+            now = time.monotonic()
+            if self._bloom is not None and now < self._next_refresh:
+                return
+
+            table = self._get_table_name(PostgresTokensHandler.TABLE_NAME)
+            rebuild = self._bloom is None or now >= self._next_rebuild
+            if rebuild:
+                started_at = datetime.now(timezone.utc)
+                rows = await self.connection_manager.fetch_query(
+                    f"SELECT token, blacklisted_at FROM {table}"
+                )
+            else:
+                # Overlap the previous refresh to tolerate clock skew
+                # between the workers writing `blacklisted_at`
+                rows = await self.connection_manager.fetch_query(
+                    f"""
+                    SELECT token, blacklisted_at FROM {table}
+                    WHERE blacklisted_at >= $1
+                    """,
+                    [self._watermark - timedelta(minutes=1)],
+                )
+
+            if rebuild:
+                bloom = BloomFilter(
+                    capacity=max(
+                        self.cache_settings.min_capacity, 2 * len(rows)
+                    ),
+                    false_positive_rate=self.cache_settings.false_positive_rate,
+                )
+                for row in rows:
+                    bloom.add(row["token"])
+                self._bloom = bloom
+                # Tokens blacklisted here while the table was being read
+                # may be missing from the rows, so only forget those the
+                # new filter holds
+                covered = {row["token"] for row in rows}
+                self._recent = {
+                    token for token in self._recent if token not in covered
+                }
+                self._watermark = started_at
+                self._next_rebuild = (
+                    now + self.cache_settings.rebuild_interval_seconds
+                )
+            else:
+                for row in rows:
+                    self._remember(row["token"])
+
+            if rows:
+                self._watermark = max(
+                    self._watermark, *(row["blacklisted_at"] for row in rows)
+                )
+            self._next_refresh = (
+                now + self.cache_settings.refresh_interval_seconds
+            )
+
+    async def is_token_blacklisted(self, token: str) -> bool:
+        if not self.cache_settings.enabled:
+            return await self._query_blacklisted(token)
+
+        try:
+            await self._refresh_filter()
+        except Exception as e:
+            logger.error(f"Failed to refresh token blacklist filter: {e}")
+            return await self._query_blacklisted(token)
+
+        if token in self._recent:
+            return True
+        if self._bloom is not None and token not in self._bloom:
+            return False
+        # Possible false positive, confirm against the table
+        return await self._query_blacklisted(token)
+
     async def clean_expired_blacklisted_tokens(
         self,
         max_age_hours: int = 7 * 24,
@@ -65,3 +207,6 @@ class PostgresTokensHandler(Handler):
         WHERE blacklisted_at < $1
         """
         await self.connection_manager.execute_query(query, [expiry_time])
+        # Bloom filters cannot forget; rebuild so pruned tokens drop out
+        self._next_rebuild = 0.0
+        self._next_refresh = 0.0
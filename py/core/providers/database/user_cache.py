@@ -0,0 +1,133 @@
+"""Caching in front of user lookups.
+
+A single authenticated request typically loads the same user several
+times: authentication, rate limiting and then the service layer. The
+`UserCache` keeps users for the duration of the current request and,
+optionally, for a few seconds across requests. Writes to a user row made
+through the database handlers invalidate both tiers.
+
+The request tier lives in a context variable that `UserCacheMiddleware`
+opens for every HTTP request; outside of a request scope only the process
+tier is used.
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from uuid import UUID
+
+from core.base.providers.database import UserCacheSettings
+from shared.abstractions import User
+
+_request_users: ContextVar[Optional[dict[UUID, User]]] = ContextVar(
+    "request_users", default=None
+)
+
+
+@contextmanager
+def request_user_scope() -> Iterator[None]:
+    """Opens a request-scoped user cache for the enclosed code."""
+    token = _request_users.set({})
+    try:
+        yield
+    finally:
+        _request_users.reset(token)
+
+
+class UserCacheMiddleware:
+    """ASGI middleware giving every HTTP request its own user cache."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        with request_user_scope():
+            await self.app(scope, receive, send)
+
+
+class UserCache:
+    def __init__(self, settings: Optional[UserCacheSettings] = None):
+        settings = settings or UserCacheSettings()
+        self.ttl_seconds = settings.process_ttl_seconds
+        self.max_entries = settings.max_entries
+        self.hits = 0
+        self.misses = 0
+        # user id -> (expires_at, user)
+        self._entries: OrderedDict[UUID, tuple[float, User]] = OrderedDict()
+        self._email_ids: dict[str, UUID] = {}
+
+    @property
+    def process_tier_enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, user_id: UUID) -> Optional[User]:
+        request_users = _request_users.get()
+        if request_users is not None and user_id in request_users:
+            self.hits += 1
+            return request_users[user_id].model_copy(deep=True)
+
+        if self.process_tier_enabled:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                if request_users is not None:
+                    request_users[user_id] = entry[1]
+                self.hits += 1
+                return entry[1].model_copy(deep=True)
+            if entry is not None:
+                self._drop(user_id)
+
+        self.misses += 1
+        return None
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        request_users = _request_users.get()
+        if request_users is not None:
+            for user in request_users.values():
+                if user.email == email:
+                    self.hits += 1
+                    return user.model_copy(deep=True)
+
+        user_id = self._email_ids.get(email)
+        if user_id is None:
+            self.misses += 1
+            return None
+        return self.get(user_id)
+
+    def put(self, user: User) -> None:
+        user = user.model_copy(deep=True)
+        request_users = _request_users.get()
+        if request_users is not None:
+            request_users[user.id] = user
+
+        if self.process_tier_enabled:
+            self._drop(user.id)
+            self._entries[user.id] = (
+                time.monotonic() + self.ttl_seconds,
+                user,
+            )
+            self._email_ids[user.email] = user.id
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, user_id: UUID) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._email_ids.pop(entry[1].email, None)
+
+    def invalidate(self, user_id: UUID) -> None:
+        request_users = _request_users.get()
+        if request_users is not None:
+            request_users.pop(user_id, None)
+        self._drop(user_id)
+
+    def clear(self) -> None:
+        request_users = _request_users.get()
+        if request_users is not None:
+            request_users.clear()
+        self._entries.clear()
+        self._email_ids.clear()
@@ -14,6 +14,7 @@ from shared.abstractions import User
 
 from .base import PostgresConnectionManager, QueryBuilder
 from .collections import PostgresCollectionsHandler
+from .user_cache import UserCache
 
 
 def _merge_metadata(
@@ -58,9 +59,11 @@ class PostgresUserHandler(Handler):
         project_name: str,
         connection_manager: PostgresConnectionManager,
         crypto_provider: CryptoProvider,
+        user_cache: Optional[UserCache] = None,
     ):
         super().__init__(project_name, connection_manager)
         self.crypto_provider = crypto_provider
+        self.user_cache = user_cache or UserCache()
 
     async def create_tables(self):
         user_table_query = f"""
@@ -141,6 +144,9 @@ class PostgresUserHandler(Handler):
         await self.connection_manager.execute_query(check_columns_query)
 
     async def get_user_by_id(self, id: UUID) -> User:
+        if cached := self.user_cache.get(id):
+            return cached
+
         query, _ = (
             QueryBuilder(self._get_table_name("users"))
             .select(
@@ -172,7 +178,7 @@ class PostgresUserHandler(Handler):
         if not result:
             raise R2RException(status_code=404, message="User not found")
 
-        return User(
+        user = User(
             id=result["id"],
             email=result["email"],
             is_superuser=result["is_superuser"],
@@ -191,8 +197,13 @@ class PostgresUserHandler(Handler):
             google_id=result["google_id"],
             github_id=result["github_id"],
         )
+        self.user_cache.put(user)
+        return user
 
     async def get_user_by_email(self, email: str) -> User:
+        if cached := self.user_cache.get_by_email(email):
+            return cached
+
         query, params = (
             QueryBuilder(self._get_table_name("users"))
             .select(
@@ -223,7 +234,7 @@ class PostgresUserHandler(Handler):
         if not result:
             raise R2RException(status_code=404, message="User not found")
 
-        return User(
+        user = User(
             id=result["id"],
             email=result["email"],
             is_superuser=result["is_superuser"],
@@ -242,6 +253,8 @@ class PostgresUserHandler(Handler):
             google_id=result["google_id"],
             github_id=result["github_id"],
         )
+        self.user_cache.put(user)
+        return user
 
     async def create_user(
         self,
@@ -292,7 +305,9 @@ class PostgresUserHandler(Handler):
                     status_code=400,
                     message="Password is required for a 'password' account_type",
                 )
-            hashed_password = self.crypto_provider.get_password_hash(password)  # type: ignore
+            hashed_password = (
+                await self.crypto_provider.async_get_password_hash(password)
+            )  # type: ignore
 
         query, params = (
             QueryBuilder(self._get_table_name(self.TABLE_NAME))
@@ -477,6 +492,7 @@ class PostgresUserHandler(Handler):
                 status_code=500,
                 detail="Failed to update user",
             )
+        self.user_cache.invalidate(user.id)
 
         return User(
             id=result["id"],
@@ -542,6 +558,7 @@ class PostgresUserHandler(Handler):
         result = await self.connection_manager.fetchrow_query(
             delete_query, [id]
         )
+        self.user_cache.invalidate(id)
 
         if not result:
             raise R2RException(status_code=404, message="User not found")
@@ -555,6 +572,7 @@ class PostgresUserHandler(Handler):
         await self.connection_manager.execute_query(
             query, [new_hashed_password, id]
         )
+        self.user_cache.invalidate(id)
 
     async def get_all_users(self) -> list[User]:
         """Get all users with minimal information."""
@@ -637,6 +655,7 @@ class PostgresUserHandler(Handler):
             raise R2RException(
                 status_code=400, message="Invalid or expired verification code"
             )
+        self.user_cache.invalidate(result["id"])
 
     async def remove_verification_code(self, verification_code: str):
         query = f"""
@@ -693,6 +712,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        self.user_cache.invalidate(id)
 
     async def add_user_to_collection(
         self, id: UUID, collection_id: UUID
@@ -714,6 +734,7 @@ class PostgresUserHandler(Handler):
         result = await self.connection_manager.fetchrow_query(
             query, [collection_id, id]
         )
+        self.user_cache.invalidate(id)
         if not result:
             raise R2RException(
                 status_code=400, message="User already in collection"
@@ -746,6 +767,7 @@ class PostgresUserHandler(Handler):
         result = await self.connection_manager.fetchrow_query(
             query, [collection_id, id]
         )
+        self.user_cache.invalidate(id)
         if not result:
             raise R2RException(
                 status_code=400,
@@ -831,6 +853,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        self.user_cache.invalidate(id)
 
     async def get_user_id_by_verification_code(
         self, verification_code: str
@@ -859,6 +882,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        self.user_cache.invalidate(id)
 
     async def get_users_overview(
         self,
@@ -1028,18 +1052,19 @@ class PostgresUserHandler(Handler):
     async def get_api_key_record(self, key_id: str) -> Optional[dict]:
         """Get API key record by 'public_key' and update 'updated_at' to now.
 
-        Returns { "user_id", "hashed_key" } or None if not found.
+        Returns { "id", "user_id", "hashed_key" } or None if not found.
         """
         query = f"""
             UPDATE {self._get_table_name(PostgresUserHandler.API_KEYS_TABLE_NAME)}
             SET updated_at = NOW()
             WHERE public_key = $1
-            RETURNING user_id, hashed_key
+            RETURNING id, user_id, hashed_key
         """
         result = await self.connection_manager.fetchrow_query(query, [key_id])
         if not result:
             return None
         return {
+            "id": result["id"],
             "user_id": result["user_id"],
             "hashed_key": result["hashed_key"],
         }
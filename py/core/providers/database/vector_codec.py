@@ -0,0 +1,119 @@
+"""Binary wire format for pgvector's `vector` and `halfvec` types.
+
+pgvector's binary send/recv representation is a big-endian header of two
+16-bit integers (dimension, unused) followed by `dimension` big-endian
+float32 values, or float16 values for `halfvec`. Registering codecs for
+them on every pooled connection lets us hand NumPy buffers straight to
+asyncpg instead of formatting and parsing `[0.1, 0.2, ...]` text literals
+on every upsert and search.
+
+`halfvec` is the column type under FP16 quantization, so it needs a codec
+as well: without one asyncpg uses the text format and rejects lists.
+"""
+
+import json
+import logging
+import struct
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger()
+
+_HEADER = struct.Struct(">HH")
+_WIRE_DTYPE = np.dtype(">f4")
+_HALF_WIRE_DTYPE = np.dtype(">f2")
+
+
+def _encode(value: Any, dtype: np.dtype) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        value = json.loads(value)
+
+    array = np.asarray(value, dtype=dtype)
+    if array.ndim != 1:
+        raise ValueError(
+            f"Expected a one-dimensional vector, got shape {array.shape}."
+        )
+    return _HEADER.pack(array.shape[0], 0) + array.tobytes()
+
+
+def _decode(data: bytes, dtype: np.dtype) -> np.ndarray:
+    dimension, _ = _HEADER.unpack_from(data)
+    return np.frombuffer(
+        data, dtype=dtype, count=dimension, offset=_HEADER.size
+    ).astype(np.float32)
+
+
+def encode_vector(value: Any) -> bytes:
+    """Encodes a vector into pgvector's binary format.
+
+    Accepts NumPy arrays, sequences of floats and, for callers that still
+    hold the text representation, a `[x, y, ...]` string literal.
+    """
+    return _encode(value, _WIRE_DTYPE)
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Decodes pgvector's binary format into a float32 NumPy array."""
+    return _decode(data, _WIRE_DTYPE)
+
+
+def encode_halfvec(value: Any) -> bytes:
+    """Encodes a vector into pgvector's binary `halfvec` format, accepting
+    the same inputs as `encode_vector`."""
+    return _encode(value, _HALF_WIRE_DTYPE)
+
+
+def decode_halfvec(data: bytes) -> np.ndarray:
+    """Decodes pgvector's binary `halfvec` format into a float32 array."""
+    return _decode(data, _HALF_WIRE_DTYPE)
+
+
+def vector_to_list(value: Any) -> Any:
+    """Converts a decoded vector to a plain list for JSON responses."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+_CODECS = {
+    "vector": (encode_vector, decode_vector),
+    "halfvec": (encode_halfvec, decode_halfvec),
+}
+
+
+async def register_vector_codec(conn) -> None:
+    """Registers the binary `vector` and `halfvec` codecs on an asyncpg
+    connection.
+
+    Used as the pool's `init` callback. Connections opened before the
+    pgvector extension exists are left untouched, the pool is expected to
+    recycle them once the extension has been created. `bit` columns, used
+    for INT1 quantization, are core Postgres types with their own codec.
+    """
+    schemas = await conn.fetch(
+        """
+        SELECT t.typname, n.nspname
+        FROM pg_type t
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE t.typname = ANY($1::text[])
+        """,
+        list(_CODECS),
+    )
+    if not schemas:
+        logger.debug(
+            "pgvector extension not found, skipping vector codec registration."
+        )
+        return
+
+    for row in schemas:
+        encoder, decoder = _CODECS[row["typname"]]
+        await conn.set_type_codec(
+            row["typname"],
+            schema=row["nspname"],
+            encoder=encoder,
+            decoder=decoder,
+            format="binary",
+        )
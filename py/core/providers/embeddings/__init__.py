@@ -1,9 +1,20 @@
 from .litellm import LiteLLMEmbeddingProvider
 from .ollama import OllamaEmbeddingProvider
 from .openai import OpenAIEmbeddingProvider
+from .rerank import (
+    CrossEncoderRerankBackend,
+    RerankBackend,
+    Reranker,
+    TEIRerankBackend,
+)
 
 __all__ = [
     "LiteLLMEmbeddingProvider",
     "OpenAIEmbeddingProvider",
     "OllamaEmbeddingProvider",
+    # Reranking
+    "Reranker",
+    "RerankBackend",
+    "TEIRerankBackend",
+    "CrossEncoderRerankBackend",
 ]
@@ -1,12 +1,9 @@
 import logging
 import math
 import os
-from copy import copy
-from typing import Any
+from typing import Any, Optional
 
 import litellm
-import requests
-from aiohttp import ClientError, ClientSession
 from litellm import AuthenticationError, aembedding, embedding
 
 from core.base import (
@@ -17,6 +14,13 @@ from core.base import (
     R2RException,
 )
 
+from .rerank import (
+    CrossEncoderRerankBackend,
+    RerankBackend,
+    Reranker,
+    TEIRerankBackend,
+)
+
 logger = logging.getLogger()
 
 
@@ -43,18 +47,30 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
             )
 
         self.rerank_url = None
+        self.reranker: Optional[Reranker] = None
         if config.rerank_model:
-            if "huggingface" not in config.rerank_model:
-                raise ValueError(
-                    "LiteLLMEmbeddingProvider only supports re-ranking via the HuggingFace text-embeddings-inference API"
+            if config.rerank_model.startswith("local/"):
+                backend: RerankBackend = CrossEncoderRerankBackend(
+                    config.rerank_model.split("local/", 1)[1],
+                    config.rerank_settings,
                 )
-
-            url = os.getenv("HUGGINGFACE_API_BASE") or config.rerank_url
-            if not url:
+            elif "huggingface" in config.rerank_model:
+                url = os.getenv("HUGGINGFACE_API_BASE") or config.rerank_url
+                if not url:
+                    raise ValueError(
+                        "LiteLLMEmbeddingProvider requires a valid reranking API url to be set via `embedding.rerank_url` in the r2r.toml, or via the environment variable `HUGGINGFACE_API_BASE`."
+                    )
+                self.rerank_url = url
+                backend = TEIRerankBackend(
+                    url,
+                    config.rerank_model.split("huggingface/")[1],
+                    config.rerank_settings,
+                )
+            else:
                 raise ValueError(
-                    "LiteLLMEmbeddingProvider requires a valid reranking API url to be set via `embedding.rerank_url` in the r2r.toml, or via the environment variable `HUGGINGFACE_API_BASE`."
+                    "LiteLLMEmbeddingProvider only supports re-ranking via the HuggingFace text-embeddings-inference API or a local cross-encoder (`local/<model>`)"
                 )
-            self.rerank_url = url
+            self.reranker = Reranker(backend, config.rerank_settings)
 
         self.base_model = config.base_model
         if "amazon" in self.base_model:
@@ -201,47 +217,9 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.Step = EmbeddingProvider.Step.RERANK,
         limit: int = 10,
     ):
-        if self.config.rerank_model is not None:
-            if not self.rerank_url:
-                raise ValueError(
-                    "Error, `rerank_url` was expected to be set inside LiteLLMEmbeddingProvider"
-                )
-
-            texts = [result.text for result in results]
-
-            payload = {
-                "query": query,
-                "texts": texts,
-                "model-id": self.config.rerank_model.split("huggingface/")[1],
-            }
-
-            headers = {"Content-Type": "application/json"}
-
-            try:
-                response = requests.post(
-                    self.rerank_url, json=payload, headers=headers
-                )
-                response.raise_for_status()
-                reranked_results = response.json()
-
-                # Copy reranked results into new array
-                scored_results = []
-                for rank_info in reranked_results:
-                    original_result = results[rank_info["index"]]
-                    copied_result = copy(original_result)
-                    # Inject the reranking score into the result object
-                    copied_result.score = rank_info["score"]
-                    scored_results.append(copied_result)
-
-                # Return only the ChunkSearchResult objects, limited to specified count
-                return scored_results[:limit]
-
-            except requests.RequestException as e:
-                logger.error(f"Error during reranking: {str(e)}")
-                # Fall back to returning the original results if reranking fails
-                return results[:limit]
-        else:
+        if self.reranker is None:
             return results[:limit]
+        return self.reranker.rerank(query, results, limit)
 
     async def arerank(
         self,
@@ -261,45 +239,10 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
         Returns:
             List of reranked ChunkSearchResult objects, limited to specified count
         """
-        if self.config.rerank_model is not None:
-            if not self.rerank_url:
-                raise ValueError(
-                    "Error, `rerank_url` was expected to be set inside LiteLLMEmbeddingProvider"
-                )
-
-            texts = [result.text for result in results]
-
-            payload = {
-                "query": query,
-                "texts": texts,
-                "model-id": self.config.rerank_model.split("huggingface/")[1],
-            }
-
-            headers = {"Content-Type": "application/json"}
-
-            try:
-                async with ClientSession() as session:
-                    async with session.post(
-                        self.rerank_url, json=payload, headers=headers
-                    ) as response:
-                        response.raise_for_status()
-                        reranked_results = await response.json()
-
-                        # Copy reranked results into new array
-                        scored_results = []
-                        for rank_info in reranked_results:
-                            original_result = results[rank_info["index"]]
-                            copied_result = copy(original_result)
-                            # Inject the reranking score into the result object
-                            copied_result.score = rank_info["score"]
-                            scored_results.append(copied_result)
-
-                        # Return only the ChunkSearchResult objects, limited to specified count
-                        return scored_results[:limit]
-
-            except (ClientError, Exception) as e:
-                logger.error(f"Error during async reranking: {str(e)}")
-                # Fall back to returning the original results if reranking fails
-                return results[:limit]
-        else:
+        if self.reranker is None:
             return results[:limit]
+        return await self.reranker.arerank(query, results, limit)
+
+    async def close(self) -> None:
+        if self.reranker is not None:
+            await self.reranker.close()
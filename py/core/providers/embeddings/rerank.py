@@ -0,0 +1,322 @@
+"""Reranking backends shared by the embedding providers.
+
+A `Reranker` wraps one scoring backend (a HuggingFace text-embeddings-
+inference server or an in-process cross-encoder) and adds the pieces that
+make reranking cheap on the search path:
+
+* a score cache keyed by `(query, chunk_id)`, so re-ranking the same chunk
+  for the same query (agent loops, RAG fusion) costs nothing;
+* micro-batching, which coalesces concurrent rerank calls for the same
+  query (e.g. HyDE fan-out) into a single backend request;
+* a persistent, pooled HTTP session for the TEI backend.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Optional
+
+import requests
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from core.base import ChunkSearchResult, RerankSettings
+
+logger = logging.getLogger()
+
+
+class RerankBackend(ABC):
+    """Scores `texts` against `query`, returning one score per text."""
+
+    @abstractmethod
+    async def score(self, query: str, texts: list[str]) -> list[float]:
+        pass
+
+    @abstractmethod
+    def score_sync(self, query: str, texts: list[str]) -> list[float]:
+        pass
+
+    async def close(self) -> None:
+        return None
+
+
+class TEIRerankBackend(RerankBackend):
+    """HuggingFace text-embeddings-inference `/rerank` backend.
+
+    Requests are split into `max_batch_size` slices (TEI rejects larger
+    client batches by default) which are sent concurrently over a single
+    pooled session.
+    """
+
+    def __init__(self, url: str, model_id: str, settings: RerankSettings):
+        self.url = url
+        self.model_id = model_id
+        self.settings = settings
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_session: Optional[requests.Session] = None
+
+    def _get_session(self) -> ClientSession:
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = ClientSession(
+                connector=TCPConnector(limit=self.settings.max_connections),
+                timeout=ClientTimeout(total=self.settings.timeout),
+            )
+            self._session_loop = loop
+        return self._session
+
+    def _payload(self, query: str, texts: list[str]) -> dict[str, Any]:
+        return {"query": query, "texts": texts, "model-id": self.model_id}
+
+    @staticmethod
+    def _parse(response: list[dict[str, Any]], size: int) -> list[float]:
+        scores = [0.0] * size
+        for rank_info in response:
+            scores[rank_info["index"]] = rank_info["score"]
+        return scores
+
+    def _slices(self, texts: list[str]) -> list[list[str]]:
+        step = self.settings.max_batch_size
+        return [texts[i : i + step] for i in range(0, len(texts), step)]
+
+    async def _score_slice(self, query: str, texts: list[str]) -> list[float]:
+        async with self._get_session().post(
+            self.url, json=self._payload(query, texts)
+        ) as response:
+            response.raise_for_status()
+            return self._parse(await response.json(), len(texts))
+
+    async def score(self, query: str, texts: list[str]) -> list[float]:
+        slices = await asyncio.gather(
+            *(self._score_slice(query, chunk) for chunk in self._slices(texts))
+        )
+        return [score for chunk in slices for score in chunk]
+
+    def score_sync(self, query: str, texts: list[str]) -> list[float]:
+        if self._sync_session is None:
+            self._sync_session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=self.settings.max_connections
+            )
+            self._sync_session.mount("http://", adapter)
+            self._sync_session.mount("https://", adapter)
+
+        scores: list[float] = []
+        for chunk in self._slices(texts):
+            response = self._sync_session.post(
+                self.url,
+                json=self._payload(query, chunk),
+                timeout=self.settings.timeout,
+            )
+            response.raise_for_status()
+            scores.extend(self._parse(response.json(), len(chunk)))
+        return scores
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._sync_session is not None:
+            self._sync_session.close()
+
+
+class CrossEncoderRerankBackend(RerankBackend):
+    """In-process cross-encoder, for reranking without a TEI server.
+
+    Requires `sentence-transformers`. Inference runs in a worker thread so
+    it does not block the event loop.
+    """
+
+    def __init__(self, model_name: str, settings: RerankSettings):
+        try:
+            from sentence_transformers import CrossEncoder
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers is not installed. Please install it using `pip install sentence-transformers` to use a local rerank model."
+            ) from None
+
+        self.settings = settings
+        self.model = CrossEncoder(model_name, device=settings.device)
+        self._lock = threading.Lock()
+
+    def score_sync(self, query: str, texts: list[str]) -> list[float]:
+        with self._lock:
+            scores = self.model.predict(
+                [(query, text) for text in texts],
+                batch_size=self.settings.max_batch_size,
+                show_progress_bar=False,
+            )
+        return [float(score) for score in scores]
+
+    async def score(self, query: str, texts: list[str]) -> list[float]:
+        return await asyncio.to_thread(self.score_sync, query, texts)
+
+
+class RerankScoreCache:
+    """Bounded LRU cache with per-entry TTL for `(query, chunk_id)` scores."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> Optional[float]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple[str, str], score: float) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, score)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class _PendingBatch:
+    def __init__(self) -> None:
+        self.texts: dict[str, int] = {}
+        self.future: asyncio.Future = (
+            asyncio.get_running_loop().create_future()
+        )
+
+
+class Reranker:
+    """Caching, micro-batching front end for a `RerankBackend`."""
+
+    def __init__(self, backend: RerankBackend, settings: RerankSettings):
+        self.backend = backend
+        self.settings = settings
+        self.cache: Optional[RerankScoreCache] = None
+        if settings.cache_enabled:
+            self.cache = RerankScoreCache(
+                max_entries=settings.cache_max_entries,
+                ttl_seconds=settings.cache_ttl_seconds,
+            )
+        self._pending: dict[str, _PendingBatch] = {}
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    async def _score_batched(
+        self, query: str, texts: list[str]
+    ) -> list[float]:
+        """Scores `texts`, sharing one backend call with every concurrent
+        request for the same query that arrives within the batch window."""
+        batch = self._pending.get(query)
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[query] = batch
+            asyncio.get_running_loop().create_task(self._flush(query, batch))
+        for text in texts:
+            batch.texts.setdefault(text, len(batch.texts))
+
+        scores = await asyncio.shield(batch.future)
+        return [scores[batch.texts[text]] for text in texts]
+
+    async def _flush(self, query: str, batch: _PendingBatch) -> None:
+        await asyncio.sleep(self.settings.batch_window_ms / 1000)
+        self._pending.pop(query, None)
+        try:
+            scores = await self.backend.score(query, list(batch.texts))
+        except Exception as e:
+            batch.future.set_exception(e)
+        else:
+            batch.future.set_result(scores)
+
+    def _cached_scores(
+        self, query: str, results: list[ChunkSearchResult]
+    ) -> list[Optional[float]]:
+        if self.cache is None:
+            return [None] * len(results)
+        return [self.cache.get((query, str(r.id))) for r in results]
+
+    def _apply_scores(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        scores: list[Optional[float]],
+        missing: list[int],
+        fresh: list[float],
+        limit: int,
+    ) -> list[ChunkSearchResult]:
+        for i, score in zip(missing, fresh, strict=True):
+            scores[i] = score
+            if self.cache is not None:
+                self.cache.put((query, str(results[i].id)), score)
+
+        scored_results = []
+        for result, score in zip(results, scores, strict=True):
+            copied_result = copy(result)
+            copied_result.score = score
+            scored_results.append(copied_result)
+        scored_results.sort(key=lambda r: r.score, reverse=True)
+        return scored_results[:limit]
+
+    async def arerank(
+        self, query: str, results: list[ChunkSearchResult], limit: int
+    ) -> list[ChunkSearchResult]:
+        if not results:
+            return []
+        scores = self._cached_scores(query, results)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        try:
+            fresh = (
+                await self._score_batched(
+                    query, [results[i].text for i in missing]
+                )
+                if missing
+                else []
+            )
+        except Exception as e:
+            logger.error(f"Error during async reranking: {str(e)}")
+            # Fall back to returning the original results if reranking fails
+            return results[:limit]
+        return self._apply_scores(
+            query, results, scores, missing, fresh, limit
+        )
+
+    def rerank(
+        self, query: str, results: list[ChunkSearchResult], limit: int
+    ) -> list[ChunkSearchResult]:
+        if not results:
+            return []
+        scores = self._cached_scores(query, results)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        try:
+            fresh = (
+                self.backend.score_sync(
+                    query, [results[i].text for i in missing]
+                )
+                if missing
+                else []
+            )
+        except Exception as e:
+            logger.error(f"Error during reranking: {str(e)}")
+            # Fall back to returning the original results if reranking fails
+            return results[:limit]
+        return self._apply_scores(
+            query, results, scores, missing, fresh, limit
+        )
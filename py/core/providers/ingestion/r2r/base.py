@@ -1,7 +1,7 @@
 # type: ignore
 import logging
 import time
-from typing import Any, AsyncGenerator, Optional
+from typing import IO, Any, AsyncGenerator, Optional
 
 from core import parsers
 from core.base import (
@@ -12,9 +12,12 @@ from core.base import (
     DocumentType,
     IngestionConfig,
     IngestionProvider,
+    ParserExecutionEngine,
     R2RDocumentProcessingError,
     RecursiveCharacterTextSplitter,
     TextSplitter,
+    TokenBudgetTextSplitter,
+    iter_file_chunks,
 )
 from core.utils import generate_extraction_id
 
@@ -109,6 +112,9 @@ class R2RIngestionProvider(IngestionProvider):
         ) = llm_provider
         self.parsers: dict[DocumentType, AsyncParser] = {}
         self.text_splitter = self._build_text_splitter()
+        self.parser_engine = ParserExecutionEngine(
+            self.config.parser_execution_settings
+        )
         self._initialize_parsers()
 
         logger.info(
@@ -125,13 +131,14 @@ class R2RIngestionProvider(IngestionProvider):
                     llm_provider=self.llm_provider,
                 )
         for doc_type, doc_parser_name in self.config.extra_parsers.items():
-            self.parsers[f"{doc_parser_name}_{str(doc_type)}"] = (
-                R2RIngestionProvider.EXTRA_PARSERS[doc_type][doc_parser_name](
-                    config=self.config,
-                    database_provider=self.database_provider,
-                    llm_provider=self.llm_provider,
-                )
+            parser = R2RIngestionProvider.EXTRA_PARSERS[doc_type][
+                doc_parser_name
+            ](
+                config=self.config,
+                database_provider=self.database_provider,
+                llm_provider=self.llm_provider,
             )
+            self.parsers[f"{doc_parser_name}_{str(doc_type)}"] = parser
 
     def _build_text_splitter(
         self, ingestion_config_override: Optional[dict] = None
@@ -157,7 +164,14 @@ class R2RIngestionProvider(IngestionProvider):
             or self.config.chunk_overlap
         )
 
-        if chunking_strategy == ChunkingStrategy.RECURSIVE:
+        if chunking_strategy == ChunkingStrategy.TOKEN:
+            return TokenBudgetTextSplitter(
+                model=ingestion_config_override.get("tokenizer_model")
+                or self.config.tokenizer_model,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+            )
+        elif chunking_strategy == ChunkingStrategy.RECURSIVE:
             return RecursiveCharacterTextSplitter(
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
@@ -214,9 +228,70 @@ class R2RIngestionProvider(IngestionProvider):
                 chunk.page_content if hasattr(chunk, "page_content") else chunk
             )
 
+    @staticmethod
+    def _split_with_token_counts(
+        text: str, text_splitter: TextSplitter
+    ) -> list[tuple[str, Optional[int]]]:
+        """Splits text into chunks, paired with their token counts when
+        the splitter measures them anyway."""
+        if isinstance(text_splitter, TokenBudgetTextSplitter):
+            return text_splitter.split_text_with_token_counts(text)
+        return [(chunk, None) for chunk in text_splitter.split_text(text)]
+
+    @staticmethod
+    def _read_all(file_content: bytes | IO[bytes]) -> bytes:
+        if isinstance(file_content, bytes):
+            return file_content
+        return file_content.read()
+
+    async def _iter_parser_contents(
+        self,
+        parser: AsyncParser,
+        document_type: DocumentType,
+        file_content: bytes | IO[bytes],
+        ingestion_config_override: dict,
+    ) -> AsyncGenerator[dict, None]:
+        """Runs a parser over the file.
+
+        Files are streamed into parsers that support it, so large text-like
+        files parse in constant memory. Other CPU-bound parsers run in the
+        parser worker pool, keeping the event loop free.
+        """
+        if not isinstance(file_content, bytes) and parser.supports_streaming:
+            texts = parser.ingest(
+                iter_file_chunks(file_content), **ingestion_config_override
+            )
+        elif self.parser_engine.can_run(parser):
+            texts = self.parser_engine.run(
+                parser,
+                self._read_all(file_content),
+                document_type.value,
+                ingestion_config_override,
+            )
+        else:
+            texts = parser.ingest(
+                self._read_all(file_content), **ingestion_config_override
+            )
+        async for text in texts:
+            if text is not None:
+                yield {"content": text}
+
+    @staticmethod
+    async def _iter_page_contents(
+        pages: AsyncGenerator[Any, None],
+    ) -> AsyncGenerator[dict, None]:
+        """Yields the non-empty pages of the vision model PDF parser, which
+        produces them in page order."""
+        async for page in pages:
+            if isinstance(page, dict):
+                if page.get("content") and isinstance(page["content"], str):
+                    yield page
+            elif page:  # Handle string output for backward compatibility
+                yield {"content": page}
+
     async def parse(
         self,
-        file_content: bytes,
+        file_content: bytes | IO[bytes],
         document: Document,
         ingestion_config_override: dict,
     ) -> AsyncGenerator[DocumentChunk, None]:
@@ -227,7 +302,11 @@ class R2RIngestionProvider(IngestionProvider):
             )
         else:
             t0 = time.time()
-            contents = []
+            text_splitter = self.text_splitter
+            if ingestion_config_override:
+                text_splitter = self._build_text_splitter(
+                    ingestion_config_override
+                )
             parser_overrides = ingestion_config_override.get(
                 "parser_overrides", {}
             )
@@ -244,92 +323,32 @@ class R2RIngestionProvider(IngestionProvider):
                         "Only Zerox PDF parser override is available."
                     )
 
-                # Collect content from VLMPDFParser
-                async for chunk in self.parsers[
-                    f"zerox_{DocumentType.PDF.value}"
-                ].ingest(file_content, **ingestion_config_override):
-                    if isinstance(chunk, dict) and chunk.get("content"):
-                        contents.append(chunk)
-                    elif (
-                        chunk
-                    ):  # Handle string output for backward compatibility
-                        contents.append({"content": chunk})
-
-                if (
-                    contents
-                    and document.document_type == DocumentType.PDF
-                    and parser_overrides.get(DocumentType.PDF.value) == "zerox"
-                ):
-                    text_splitter = self._build_text_splitter(
-                        ingestion_config_override
-                    )
-
-                    iteration = 0
-
-                    sorted_contents = [
-                        item
-                        for item in sorted(
-                            contents, key=lambda x: x.get("page_number", 0)
-                        )
-                        if isinstance(item.get("content"), str)
-                    ]
-
-                    for content_item in sorted_contents:
-                        page_num = content_item.get("page_number", 0)
-                        page_content = content_item["content"]
-
-                        page_chunks = text_splitter.create_documents(
-                            [page_content]
-                        )
-
-                        # Create document chunks for each split piece
-                        for chunk in page_chunks:
-                            metadata = {
-                                **document.metadata,
-                                "chunk_order": iteration,
-                                "page_number": page_num,
-                            }
-
-                            extraction = DocumentChunk(
-                                id=generate_extraction_id(
-                                    document.id, iteration
-                                ),
-                                document_id=document.id,
-                                owner_id=document.owner_id,
-                                collection_ids=document.collection_ids,
-                                data=chunk.page_content,
-                                metadata=metadata,
-                            )
-                            iteration += 1
-                            yield extraction
-
-                    logger.debug(
-                        f"Parsed document with id={document.id}, title={document.metadata.get('title', None)}, "
-                        f"user_id={document.metadata.get('user_id', None)}, metadata={document.metadata} "
-                        f"into {iteration} extractions in t={time.time() - t0:.2f} seconds using page-by-page splitting."
+                # Pages are chunked as the VLMPDFParser transcribes them
+                content_stream = self._iter_page_contents(
+                    self.parsers[f"zerox_{DocumentType.PDF.value}"].ingest(
+                        self._read_all(file_content),
+                        **ingestion_config_override,
                     )
-                    return
-
+                )
             else:
-                # Standard parsing for non-override cases
-                async for text in self.parsers[document.document_type].ingest(
-                    file_content, **ingestion_config_override
-                ):
-                    if text is not None:
-                        contents.append({"content": text})
-
-            if not contents:
-                logging.warning(
-                    "No valid text content was extracted during parsing"
+                # Standard parsing for non-override cases, chunked as the
+                # parser produces content
+                content_stream = self._iter_parser_contents(
+                    self.parsers[document.document_type],
+                    document.document_type,
+                    file_content,
+                    ingestion_config_override,
                 )
-                return
 
             iteration = 0
-            for content_item in contents:
-                chunk_text = content_item["content"]
-                chunks = self.chunk(chunk_text, ingestion_config_override)
+            has_content = False
+            async for content_item in content_stream:
+                has_content = True
+                chunks = self._split_with_token_counts(
+                    content_item["content"], text_splitter
+                )
 
-                for chunk in chunks:
+                for chunk, token_count in chunks:
                     metadata = {**document.metadata, "chunk_order": iteration}
                     if "page_number" in content_item:
                         metadata["page_number"] = content_item["page_number"]
@@ -341,10 +360,17 @@ class R2RIngestionProvider(IngestionProvider):
                         collection_ids=document.collection_ids,
                         data=chunk,
                         metadata=metadata,
+                        token_count=token_count,
                     )
                     iteration += 1
                     yield extraction
 
+            if not has_content:
+                logging.warning(
+                    "No valid text content was extracted during parsing"
+                )
+                return
+
             logger.debug(
                 f"Parsed document with id={document.id}, title={document.metadata.get('title', None)}, "
                 f"user_id={document.metadata.get('user_id', None)}, metadata={document.metadata} "
@@ -353,3 +379,6 @@ class R2RIngestionProvider(IngestionProvider):
 
     def get_parser_for_document_type(self, doc_type: DocumentType) -> Any:
         return self.parsers.get(doc_type)
+
+    async def close(self) -> None:
+        self.parser_engine.shutdown()
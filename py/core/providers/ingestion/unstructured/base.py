@@ -6,7 +6,7 @@ import os
 import time
 from copy import copy
 from io import BytesIO
-from typing import Any, AsyncGenerator
+from typing import IO, Any, AsyncGenerator
 
 import httpx
 from unstructured_client import UnstructuredClient
@@ -247,10 +247,12 @@ class UnstructuredIngestionProvider(IngestionProvider):
 
     async def parse(
         self,
-        file_content: bytes,
+        file_content: bytes | IO[bytes],
         document: Document,
         ingestion_config_override: dict,
     ) -> AsyncGenerator[DocumentChunk, None]:
+        if not isinstance(file_content, bytes):
+            file_content = file_content.read()
         ingestion_config = copy(
             {
                 **self.config.to_ingestion_request(),
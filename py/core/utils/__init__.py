@@ -15,6 +15,7 @@ from shared.utils.base_utils import (
     generate_extraction_id,
     generate_id,
     generate_user_id,
+    get_token_encoding,
     increment_version,
     num_tokens,
     num_tokens_from_messages,
@@ -25,6 +26,7 @@ from shared.utils.base_utils import (
 from shared.utils.splitter.text import (
     RecursiveCharacterTextSplitter,
     TextSplitter,
+    TokenBudgetTextSplitter,
 )
 
 
@@ -227,6 +229,7 @@ __all__ = [
     "convert_nonserializable_objects",
     "num_tokens",
     "num_tokens_from_messages",
+    "get_token_encoding",
     "SSEFormatter",
     "SearchResultsCollector",
     "update_settings_from_dict",
@@ -234,6 +237,7 @@ __all__ = [
     # Text splitter
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
+    "TokenBudgetTextSplitter",
     "extract_citations",
     "extract_citation_spans",
     "CitationTracker",
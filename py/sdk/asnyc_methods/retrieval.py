@@ -11,13 +11,17 @@ from shared.api.models import (
     UnknownEvent,
     WrappedAgentResponse,
     WrappedRAGResponse,
+    WrappedSearchManyResponse,
     WrappedSearchResponse,
 )
 
 from ..models import (
     Message,
 )
-from ..sync_methods.retrieval import parse_retrieval_event
+from ..sync_methods.retrieval import (
+    parse_retrieval_event,
+    search_many_arg_parser,
+)
 
 
 class RetrievalSDK:
@@ -76,6 +80,37 @@ class RetrievalSDK:
         )
         return WrappedSearchResponse(**response_dict)
 
+    async def search_many(self, **kwargs) -> WrappedSearchManyResponse:
+        """
+        Conduct several independent searches in a single request (async).
+
+        Args:
+            queries (list[str]): Search queries to run.
+            search_mode (Optional[str | SearchMode]): Pre-configured search mode applied to every query.
+            search_settings (Optional[list[Optional[dict | SearchSettings]]]): One entry per query, or None
+                to use the search mode defaults.
+
+        Returns:
+            WrappedSearchManyResponse: One search result per query, in order.
+        """
+        queries = kwargs.pop("queries", None)
+        if queries is None:
+            raise ValueError(
+                "'queries' is a required parameter for search_many"
+            )
+
+        response_dict = await self.client._make_request(
+            "POST",
+            "retrieval/search_many",
+            json=search_many_arg_parser(
+                queries=queries,
+                search_mode=kwargs.pop("search_mode", "custom"),
+                search_settings=kwargs.pop("search_settings", None),
+            ),
+            version="v3",
+        )
+        return WrappedSearchManyResponse(**response_dict)
+
     async def completion(self, **kwargs):
         """
         Get a completion from the model (async).
@@ -7,6 +7,7 @@ from shared.api.models import (
     WrappedEmbeddingResponse,
     WrappedLLMChatCompletion,
     WrappedRAGResponse,
+    WrappedSearchManyResponse,
     WrappedSearchResponse,
 )
 
@@ -168,6 +169,32 @@ def search_arg_parser(
     return data
 
 
+def search_many_arg_parser(
+    queries: list[str],
+    search_mode: Optional[str | SearchMode] = "custom",
+    search_settings: Optional[list[Optional[dict | SearchSettings]]] = None,
+) -> dict:
+    if search_mode and not isinstance(search_mode, str):
+        search_mode = search_mode.value
+
+    if search_settings is not None:
+        search_settings = [
+            settings.model_dump()
+            if settings and not isinstance(settings, dict)
+            else settings
+            for settings in search_settings
+        ]
+
+    data: dict[str, Any] = {
+        "queries": queries,
+        "search_settings": search_settings,
+    }
+    if search_mode:
+        data["search_mode"] = search_mode
+
+    return data
+
+
 def completion_arg_parser(
     messages: list[dict | Message],
     generation_config: Optional[dict | GenerationConfig] = None,
@@ -323,6 +350,38 @@ class RetrievalSDK:
 
         return WrappedSearchResponse(**response_dict)
 
+    def search_many(
+        self,
+        queries: list[str],
+        search_mode: Optional[str | SearchMode] = "custom",
+        search_settings: Optional[
+            list[Optional[dict | SearchSettings]]
+        ] = None,
+    ) -> WrappedSearchManyResponse:
+        """Conduct several independent searches in a single request.
+
+        Args:
+            queries (list[str]): The queries to search for.
+            search_mode (Optional[str | SearchMode]): Pre-configured search mode applied to every query.
+            search_settings (Optional[list[Optional[dict | SearchSettings]]]): One entry per query, or None to use the search mode defaults.
+
+        Returns:
+            WrappedSearchManyResponse: One search result per query, in order.
+        """
+
+        response_dict = self.client._make_request(
+            "POST",
+            "retrieval/search_many",
+            json=search_many_arg_parser(
+                queries=queries,
+                search_mode=search_mode,
+                search_settings=search_settings,
+            ),
+            version="v3",
+        )
+
+        return WrappedSearchManyResponse(**response_dict)
+
     def completion(
         self,
         messages: list[dict | Message],
@@ -2,7 +2,7 @@
 
 from copy import copy
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from uuid import NAMESPACE_DNS, UUID, uuid5
 
 from pydantic import Field
@@ -368,6 +368,10 @@ class HybridSearchSettings(R2RSerializable):
     rrf_k: int = Field(
         default=50, description="K-value for RRF (Rank Reciprocal Fusion)"
     )
+    fusion_mode: Literal["parallel", "sql"] = Field(
+        default="parallel",
+        description="How the hybrid search is executed. `parallel` runs the semantic and full text searches concurrently and fuses them in the application, `sql` performs the full fusion in a single database query.",
+    )
 
 
 class ChunkSearchSettings(R2RSerializable):
@@ -385,6 +389,11 @@ class ChunkSearchSettings(R2RSerializable):
         default=40,
         description="Size of the dynamic candidate list for HNSW index search. Higher increases accuracy but decreases speed.",
     )
+    oversampling_factor: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of binary quantized candidates to fetch per requested result before re-ranking with full precision vectors. Only used with INT1 quantization, defaults to the server configuration.",
+    )
     enabled: bool = Field(
         default=True,
         description="Whether to enable chunk search",
@@ -494,6 +503,11 @@ class SearchSettings(R2RSerializable):
         default=5,
         description="Number of sub-queries/hypothetical docs to generate when using hyde or rag_fusion search strategies.",
     )
+    sub_query_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of sub-query/hypothetical doc searches to run concurrently when using hyde or rag_fusion search strategies.",
+    )
 
     class Config:
         populate_by_name = True
@@ -512,6 +526,7 @@ class SearchSettings(R2RSerializable):
                     "semantic_weight": 5.0,
                     "full_text_limit": 200,
                     "rrf_k": 50,
+                    "fusion_mode": "parallel",
                 },
                 "chunk_settings": {
                     "enabled": True,
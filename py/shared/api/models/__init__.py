@@ -72,6 +72,7 @@ from shared.api.models.retrieval.responses import (
     MessageData,
     MessageDelta,
     MessageEvent,
+    QuantizedSearchEvaluation,
     RAGEvent,
     RAGResponse,
     SearchResultsData,
@@ -88,7 +89,9 @@ from shared.api.models.retrieval.responses import (
     WrappedDocumentSearchResponse,
     WrappedEmbeddingResponse,
     WrappedLLMChatCompletion,
+    WrappedQuantizedSearchEvaluationResponse,
     WrappedRAGResponse,
+    WrappedSearchManyResponse,
     WrappedSearchResponse,
     WrappedVectorSearchResponse,
 )
@@ -186,9 +189,12 @@ __all__ = [
     "AgentResponse",
     "AggregateSearchResult",
     "WrappedSearchResponse",
+    "WrappedSearchManyResponse",
     "WrappedDocumentSearchResponse",
     "WrappedVectorSearchResponse",
     "WrappedAgentResponse",
     "WrappedLLMChatCompletion",
     "WrappedEmbeddingResponse",
+    "QuantizedSearchEvaluation",
+    "WrappedQuantizedSearchEvaluationResponse",
 ]
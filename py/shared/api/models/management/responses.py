@@ -24,6 +24,9 @@ class ServerStats(BaseModel):
     uptime_seconds: float
     cpu_usage: float
     memory_usage: float
+    database_pools: dict[str, dict[str, float]] = {}
+    crypto_hashing: dict[str, float] = {}
+    embedding_cache: dict[str, dict[str, int]] = {}
 
 
 class SettingsResponse(BaseModel):
@@ -592,13 +592,34 @@ AgentEvent = (
     | UnknownEvent
 )
 
+
+class QuantizedSearchEvaluation(R2RSerializable):
+    """Recall and latency of INT1 search at one oversampling factor."""
+
+    oversampling_factor: int = Field(
+        ..., description="Candidates fetched per result before re-ranking"
+    )
+    recall: float = Field(
+        ..., description="Mean recall@limit against an exact scan"
+    )
+    mean_latency_ms: float
+    p95_latency_ms: float
+    exact_mean_latency_ms: float = Field(
+        ..., description="Mean latency of the exact scan"
+    )
+
+
 WrappedCompletionResponse = R2RResults[LLMChatCompletion]
 # Create wrapped versions of the responses
 WrappedVectorSearchResponse = R2RResults[list[ChunkSearchResult]]
 WrappedSearchResponse = R2RResults[AggregateSearchResult]
+WrappedSearchManyResponse = R2RResults[list[AggregateSearchResult]]
 # FIXME: This is returning DocumentResponse, but should be DocumentSearchResult
 WrappedDocumentSearchResponse = R2RResults[list[DocumentResponse]]
 WrappedRAGResponse = R2RResults[RAGResponse]
 WrappedAgentResponse = R2RResults[AgentResponse]
 WrappedLLMChatCompletion = R2RResults[LLMChatCompletion]
 WrappedEmbeddingResponse = R2RResults[list[float]]
+WrappedQuantizedSearchEvaluationResponse = R2RResults[
+    list[QuantizedSearchEvaluation]
+]
@@ -13,11 +13,16 @@ from .base_utils import (
     generate_extraction_id,
     generate_id,
     generate_user_id,
+    get_token_encoding,
     increment_version,
     validate_uuid,
     yield_sse_event,
 )
-from .splitter.text import RecursiveCharacterTextSplitter, TextSplitter
+from .splitter.text import (
+    RecursiveCharacterTextSplitter,
+    TextSplitter,
+    TokenBudgetTextSplitter,
+)
 
 __all__ = [
     "format_search_results_for_llm",
@@ -34,9 +39,11 @@ __all__ = [
     "decrement_version",
     "validate_uuid",
     "deep_update",
+    "get_token_encoding",
     # Text splitter
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
+    "TokenBudgetTextSplitter",
     # Vector utils
     "_decorate_vector_type",
     "_get_vector_column_str",
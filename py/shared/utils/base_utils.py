@@ -5,6 +5,7 @@ import uuid
 from abc import ABCMeta
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional, Tuple, TypeVar
 from uuid import NAMESPACE_DNS, UUID, uuid4, uuid5
 
@@ -255,13 +256,23 @@ def tokens_count_for_message(message, encoding):
     return num_tokens
 
 
-def num_tokens_from_messages(messages, model="gpt-4o"):
-    """Return the number of tokens used by a list of messages for both user and assistant."""
+@lru_cache(maxsize=None)
+def get_token_encoding(model: str = "gpt-4o") -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a model, loaded once per process.
+
+    Models tiktoken does not know, such as embedding models behind a
+    provider prefix, fall back to cl100k_base.
+    """
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
-        logger.warning("Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+        logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def num_tokens_from_messages(messages, model="gpt-4o"):
+    """Return the number of tokens used by a list of messages for both user and assistant."""
+    encoding = get_token_encoding(model)
 
     tokens = 0
     for message_ in messages:
@@ -616,13 +627,8 @@ def dump_collector(collector: SearchResultsCollector) -> list[dict[str, Any]]:
 
 
 def num_tokens(text, model="gpt-4o"):
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    """Return the number of tokens used by a list of messages for both user and assistant."""
-    return len(encoding.encode(text, disallowed_special=()))
+    """Return the number of tokens in a text."""
+    return len(get_token_encoding(model).encode(text, disallowed_special=()))
 
 
 class CombinedMeta(AsyncSyncMeta, ABCMeta):
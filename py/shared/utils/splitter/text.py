@@ -27,8 +27,10 @@ import logging
 import pathlib
 import re
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from io import BytesIO, StringIO
 from typing import (
     AbstractSet,
@@ -50,6 +52,8 @@ import requests
 from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import NotRequired
 
+from ..base_utils import get_token_encoding
+
 logger = logging.getLogger()
 
 TS = TypeVar("TS", bound="TextSplitter")
@@ -397,14 +401,29 @@ def _make_spacy_pipe_for_splitting(
     return sentencizer
 
 
+@lru_cache(maxsize=256)
+def _compile_separator(separator: str, keep_separator: bool) -> re.Pattern:
+    # The parentheses in the pattern keep the delimiters in the result.
+    return re.compile(f"({separator})" if keep_separator else separator)
+
+
+@lru_cache(maxsize=8)
+def _get_tiktoken_encoding(encoding_name: str, model: Optional[str]) -> Any:
+    import tiktoken
+
+    if model is not None:
+        return tiktoken.encoding_for_model(model)
+    return tiktoken.get_encoding(encoding_name)
+
+
 def _split_text_with_regex(
     text: str, separator: str, keep_separator: bool
 ) -> list[str]:
     # Now that we have the separator, split the text
     if separator:
+        pattern = _compile_separator(separator, keep_separator)
         if keep_separator:
-            # The parentheses in the pattern keep the delimiters in the result.
-            _splits = re.split(f"({separator})", text)
+            _splits = pattern.split(text)
             splits = [
                 _splits[i] + _splits[i + 1] for i in range(1, len(_splits), 2)
             ]
@@ -412,7 +431,7 @@ def _split_text_with_regex(
                 splits += _splits[-1:]
             splits = [_splits[0]] + splits
         else:
-            splits = re.split(separator, text)
+            splits = pattern.split(text)
     else:
         splits = list(text)
     return [s for s in splits if s != ""]
@@ -468,7 +487,9 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             index = 0
             previous_chunk_len = 0
             for chunk in self.split_text(text):
-                metadata = copy.deepcopy(_metadatas[i])
+                metadata = (
+                    copy.deepcopy(_metadatas[i]) if _metadatas[i] else {}
+                )
                 if self._add_start_index:
                     offset = index + previous_chunk_len - self._chunk_overlap
                     index = text.find(chunk, max(0, offset))
@@ -490,7 +511,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             metadatas.append(doc.metadata)
         return self.create_documents(texts, metadatas=metadatas)
 
-    def _join_docs(self, docs: list[str], separator: str) -> Optional[str]:
+    def _join_docs(self, docs: Iterable[str], separator: str) -> Optional[str]:
         text = separator.join(docs)
         if self._strip_whitespace:
             text = text.strip()
@@ -500,17 +521,25 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             return text
 
     def _merge_splits(
-        self, splits: Iterable[str], separator: str
+        self,
+        splits: Iterable[str],
+        separator: str,
+        lengths: Optional[Iterable[int]] = None,
     ) -> list[str]:
         # We now want to combine these smaller pieces into medium size
-        # chunks to send to the LLM.
+        # chunks to send to the LLM. `lengths` can pass in the already
+        # measured lengths of the splits.
         separator_len = self._length_function(separator)
+        splits = list(splits)
+        if lengths is None:
+            lengths = [self._length_function(d) for d in splits]
 
         docs = []
-        current_doc: list[str] = []
+        # The window of splits in the current chunk and their lengths
+        current_doc: deque[str] = deque()
+        current_lengths: deque[int] = deque()
         total = 0
-        for d in splits:
-            _len = self._length_function(d)
+        for d, _len in zip(splits, lengths, strict=True):
             if (
                 total + _len + (separator_len if len(current_doc) > 0 else 0)
                 > self._chunk_size
@@ -534,11 +563,12 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         > self._chunk_size
                         and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (
+                        total -= current_lengths.popleft() + (
                             separator_len if len(current_doc) > 1 else 0
                         )
-                        current_doc = current_doc[1:]
+                        current_doc.popleft()
             current_doc.append(d)
+            current_lengths.append(_len)
             total += _len + (separator_len if len(current_doc) > 1 else 0)
         doc = self._join_docs(current_doc, separator)
         if doc is not None:
@@ -579,17 +609,12 @@ class TextSplitter(BaseDocumentTransformer, ABC):
     ) -> TS:
         """Text splitter that uses tiktoken encoder to count length."""
         try:
-            import tiktoken
+            enc = _get_tiktoken_encoding(encoding_name, model)
         except ImportError:
             raise ImportError("""Could not import tiktoken python package.
                 This is needed in order to calculate max_tokens_for_prompt.
                 Please install it with `pip install tiktoken`.""") from None
 
-        if model is not None:
-            enc = tiktoken.encoding_for_model(model)
-        else:
-            enc = tiktoken.get_encoding(encoding_name)
-
         def _tiktoken_encoder(text: str) -> int:
             return len(
                 enc.encode(
@@ -1254,37 +1279,74 @@ class RecursiveCharacterTextSplitter(TextSplitter):
             if _s == "":
                 separator = _s
                 break
-            if re.search(_separator, text):
+            if _compile_separator(_separator, False).search(text):
                 separator = _s
                 new_separators = separators[i + 1 :]
                 break
 
+        if separator == "" and self._length_function is len:
+            return self._merge_characters(text)
+
         _separator = (
             separator if self._is_separator_regex else re.escape(separator)
         )
         splits = _split_text_with_regex(text, _separator, self._keep_separator)
 
         # Now go merging things, recursively splitting longer texts.
-        _good_splits = []
+        _good_splits: list[str] = []
+        _good_lengths: list[int] = []
         _separator = "" if self._keep_separator else separator
         for s in splits:
-            if self._length_function(s) < self._chunk_size:
+            _len = self._length_function(s)
+            if _len < self._chunk_size:
                 _good_splits.append(s)
+                _good_lengths.append(_len)
             else:
                 if _good_splits:
-                    merged_text = self._merge_splits(_good_splits, _separator)
+                    merged_text = self._merge_splits(
+                        _good_splits, _separator, _good_lengths
+                    )
                     final_chunks.extend(merged_text)
-                    _good_splits = []
+                    _good_splits, _good_lengths = [], []
                 if not new_separators:
                     final_chunks.append(s)
                 else:
                     other_info = self._split_text(s, new_separators)
                     final_chunks.extend(other_info)
         if _good_splits:
-            merged_text = self._merge_splits(_good_splits, _separator)
+            merged_text = self._merge_splits(
+                _good_splits, _separator, _good_lengths
+            )
             final_chunks.extend(merged_text)
         return final_chunks
 
+    def _merge_characters(self, text: str) -> list[str]:
+        """Same result as `_merge_splits(list(text), "")` when lengths are
+        measured in characters, computed from offsets into `text`.
+
+        Each chunk is a full window of `chunk_size` characters and the next
+        one starts `chunk_size - overlap` characters later, so text without
+        any separator is not split into one string per character.
+        """
+        if self._chunk_size <= 1:
+            # No character is shorter than the chunk size, so each one is
+            # kept as is, see `_split_text`
+            return list(text)
+        overlap = min(self._chunk_overlap, self._chunk_size - 1)
+        step = self._chunk_size - overlap
+        docs = []
+        start = 0
+        # A window is emitted once the character after it has been seen
+        while start + self._chunk_size < len(text):
+            doc = self._join_docs([text[start : start + self._chunk_size]], "")
+            if doc is not None:
+                docs.append(doc)
+            start += step
+        doc = self._join_docs([text[start:]], "")
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
     def split_text(self, text: str) -> list[str]:
         return self._split_text(text, self._separators)
 
@@ -1762,6 +1824,109 @@ class RecursiveCharacterTextSplitter(TextSplitter):
             )
 
 
+class TokenBudgetTextSplitter(RecursiveCharacterTextSplitter):
+    """Recursive splitter that measures chunks in tokens of a model's
+    tokenizer, so that no chunk is longer than `chunk_size` tokens.
+
+    Token counts of neighbouring splits do not always add up to the count
+    of the joined text, so each merged chunk is encoded once more and
+    chunks that went over the budget are cut into token windows on
+    character boundaries. Only a single character that alone takes more
+    than `chunk_size` tokens is kept whole over the budget. The exact
+    counts are returned with the chunks, sparing callers another
+    tokenization pass.
+    """
+
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        encoding: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create a new TextSplitter.
+
+        Args:
+            model: Model whose tokenizer measures the chunks
+            encoding: A tiktoken compatible encoding to use instead of the
+                one for `model`
+        """
+        self._encoding = encoding or get_token_encoding(model)
+        super().__init__(length_function=self._count_tokens, **kwargs)
+
+    def _encode(self, text: str) -> list[int]:
+        return self._encoding.encode(text, disallowed_special=())
+
+    def _count_tokens(self, text: str) -> int:
+        return len(self._encode(text))
+
+    def split_text_with_token_counts(self, text: str) -> list[Tuple[str, int]]:
+        """Split text into chunks paired with their token counts."""
+        chunks = []
+        for chunk in self._split_text(text, self._separators):
+            tokens = self._encode(chunk)
+            if len(tokens) <= self._chunk_size:
+                chunks.append((chunk, len(tokens)))
+            else:
+                chunks.extend(self._split_tokens(tokens))
+        return chunks
+
+    def _split_tokens(self, tokens: list[int]) -> list[Tuple[str, int]]:
+        """Cuts an oversized chunk into windows of at most `chunk_size`
+        tokens.
+
+        Windows only start and end between whole characters: a token may
+        hold part of a multi-byte character, which would otherwise decode
+        to U+FFFD. A window whose text re-encodes to more than
+        `chunk_size` tokens is shortened until it fits.
+        """
+        token_bytes = [
+            self._encoding.decode_single_token_bytes(token) for token in tokens
+        ]
+        # Cutting before token i is clean unless that token starts with a
+        # UTF-8 continuation byte
+        clean = [
+            not data or data[0] & 0xC0 != 0x80 for data in token_bytes
+        ] + [True]
+        overlap = min(self._chunk_overlap, self._chunk_size - 1)
+
+        chunks: list[Tuple[str, int]] = []
+        start = 0
+        while start < len(tokens):
+            # The shortest window holds one whole character, even one
+            # spread over more tokens than the budget
+            shortest = start + 1
+            while not clean[shortest]:
+                shortest += 1
+            end = max(min(start + self._chunk_size, len(tokens)), shortest)
+            while True:
+                while not clean[end]:
+                    end -= 1
+                doc = self._join_docs(
+                    [
+                        b"".join(token_bytes[start:end]).decode(
+                            "utf-8", "replace"
+                        )
+                    ],
+                    "",
+                )
+                count = self._count_tokens(doc) if doc is not None else 0
+                if count <= self._chunk_size or end == shortest:
+                    break
+                end -= 1
+            if doc is not None:
+                chunks.append((doc, count))
+            if end >= len(tokens):
+                break
+            next_start = max(end - overlap, start + 1)
+            while not clean[next_start]:
+                next_start += 1
+            start = next_start
+        return chunks
+
+    def split_text(self, text: str) -> list[str]:
+        return [chunk for chunk, _ in self.split_text_with_token_counts(text)]
+
+
 class NLTKTextSplitter(TextSplitter):
     """Splitting text using NLTK package."""
 
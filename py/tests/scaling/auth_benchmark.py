@@ -0,0 +1,109 @@
+"""Authenticated request throughput with and without the API key cache.
+
+Runs `R2RAuthProvider.authenticate_api_key` against an in-memory users
+handler (with a simulated database round trip) so that the cost measured
+is the key verification itself.
+
+Usage:
+    python tests/scaling/auth_benchmark.py --requests 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from types import SimpleNamespace
+
+from core.base import AppConfig, AuthConfig
+from core.providers.auth import R2RAuthProvider
+from core.providers.crypto import BcryptCryptoConfig, BCryptCryptoProvider
+
+
+class InMemoryUsersHandler:
+    def __init__(self, record: dict, db_latency: float):
+        self.record = record
+        self.db_latency = db_latency
+        self.user = SimpleNamespace(id=record["user_id"], is_active=True)
+
+    async def get_api_key_record(self, key_id: str) -> dict:
+        await asyncio.sleep(self.db_latency)
+        return self.record
+
+    async def get_user_by_id(self, id):
+        await asyncio.sleep(self.db_latency)
+        return self.user
+
+
+def make_provider(
+    cache_enabled: bool, rounds: int, db_latency: float
+) -> tuple[R2RAuthProvider, str]:
+    app = AppConfig(project_name="auth_benchmark")
+    crypto_provider = BCryptCryptoProvider(
+        BcryptCryptoConfig(app=app, bcrypt_rounds=rounds)
+    )
+    key_id, raw_key = crypto_provider.generate_api_key()
+    record = {
+        "id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "hashed_key": crypto_provider.hash_api_key(raw_key),
+    }
+    provider = R2RAuthProvider(
+        AuthConfig(
+            app=app,
+            provider="r2r",
+            api_key_cache_settings={"enabled": cache_enabled},
+        ),
+        crypto_provider,
+        SimpleNamespace(
+            users_handler=InMemoryUsersHandler(record, db_latency)
+        ),
+        None,
+    )
+    return provider, f"{key_id}.{raw_key}"
+
+
+async def run(
+    provider: R2RAuthProvider, api_key: str, requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await provider.authenticate_api_key(api_key)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--db-latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{'cache':>6} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for cache_enabled in (False, True):
+        provider, api_key = make_provider(
+            cache_enabled, args.bcrypt_rounds, args.db_latency_ms / 1000
+        )
+        elapsed, latencies = asyncio.run(
+            run(provider, api_key, args.requests, args.concurrency)
+        )
+        p50 = statistics.median(latencies)
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        print(
+            f"{'on' if cache_enabled else 'off':>6} "
+            f"{args.requests / elapsed:>10.0f} "
+            f"{p50 * 1000:>10.1f} {p95 * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
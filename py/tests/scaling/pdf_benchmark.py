@@ -0,0 +1,160 @@
+"""PDF text extraction throughput, in pages per second.
+
+Compares the old per-character cleanup with the regex based one, pypdf
+with pymupdf, and a single worker with page-parallel extraction.
+
+Usage:
+    python tests/scaling/pdf_benchmark.py
+    python tests/scaling/pdf_benchmark.py path/to/*.pdf --workers 8
+"""
+
+import argparse
+import asyncio
+import string
+import time
+import unicodedata
+from io import BytesIO
+from pathlib import Path
+
+from pypdf import PdfReader
+
+from core.base import (
+    AppConfig,
+    IngestionConfig,
+    ParserExecutionEngine,
+    ParserExecutionSettings,
+)
+from core.parsers.media.pdf_parser import BasicPDFParser
+
+SAMPLE_CORPUS = Path(__file__).parents[2] / "core" / "examples" / "data"
+
+
+def legacy_clean_text(text: str) -> str:
+    """The per-character filter BasicPDFParser used before."""
+    return "".join(
+        filter(
+            lambda x: (
+                unicodedata.category(x)
+                in ["Ll", "Lu", "Lt", "Lm", "Lo", "Nl", "No"]
+                or "\u4e00" <= x <= "\u9fff"
+                or "\u0600" <= x <= "\u06ff"
+                or "\u0400" <= x <= "\u04ff"
+                or "\u0370" <= x <= "\u03ff"
+                or "\u0e00" <= x <= "\u0e7f"
+                or "\u3040" <= x <= "\u309f"
+                or "\u30a0" <= x <= "\u30ff"
+                or x in string.printable
+            ),
+            text,
+        )
+    )
+
+
+def report(label: str, pages: int, elapsed: float) -> None:
+    print(f"{label:<36} {elapsed:>8.2f}s {pages / elapsed:>10.1f} pages/s")
+
+
+def bench_cleanup(documents: list[bytes]) -> None:
+    texts = [
+        page.extract_text() or ""
+        for data in documents
+        for page in PdfReader(BytesIO(data)).pages
+    ]
+    # Build the pattern outside of the timed section
+    BasicPDFParser.clean_text("")
+
+    start = time.perf_counter()
+    legacy = [legacy_clean_text(text) for text in texts]
+    report("cleanup, per character", len(texts), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    cleaned = [BasicPDFParser.clean_text(text) for text in texts]
+    report("cleanup, regex", len(texts), time.perf_counter() - start)
+    assert cleaned == legacy
+
+
+def bench_serial(documents: list[bytes], extractor: str) -> None:
+    start = time.perf_counter()
+    pages = sum(
+        1
+        for data in documents
+        for _ in BasicPDFParser.extract(data, extractor=extractor)
+    )
+    report(f"{extractor}, in process", pages, time.perf_counter() - start)
+
+
+async def count_segments(segments) -> int:
+    return sum([1 async for _ in segments])
+
+
+async def bench_engine(
+    documents: list[bytes],
+    extractor: str,
+    settings: ParserExecutionSettings,
+    label: str,
+) -> None:
+    config = IngestionConfig(app=AppConfig(), pdf_text_extractor=extractor)
+    parser = BasicPDFParser(config, None, None)
+    engine = ParserExecutionEngine(settings)
+    try:
+        # Start the workers outside of the timed section
+        smallest = min(documents, key=len)
+        await asyncio.gather(
+            *[
+                count_segments(engine.run(parser, smallest, "pdf"))
+                for _ in range(engine.max_workers)
+            ]
+        )
+        start = time.perf_counter()
+        pages = 0
+        for data in documents:
+            pages += await count_segments(engine.run(parser, data, "pdf"))
+        report(f"{extractor}, {label}", pages, time.perf_counter() - start)
+    finally:
+        engine.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=sorted(SAMPLE_CORPUS.glob("*.pdf")),
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--pages-per-task", type=int, default=8)
+    args = parser.parse_args()
+
+    documents = [path.read_bytes() for path in args.paths]
+    print(f"{len(documents)} documents")
+
+    bench_cleanup(documents)
+    for extractor in ("pypdf", "pymupdf"):
+        bench_serial(documents, extractor)
+        asyncio.run(
+            bench_engine(
+                documents,
+                extractor,
+                ParserExecutionSettings(
+                    max_workers=args.workers, parallel_min_pages=None
+                ),
+                "one worker per document",
+            )
+        )
+        asyncio.run(
+            bench_engine(
+                documents,
+                extractor,
+                ParserExecutionSettings(
+                    max_workers=args.workers,
+                    parallel_min_pages=1,
+                    pages_per_task=args.pages_per_task,
+                ),
+                f"page ranges of {args.pages_per_task}",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
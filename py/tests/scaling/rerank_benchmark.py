@@ -0,0 +1,91 @@
+"""Rerank latency per batch size.
+
+Usage:
+    # HuggingFace text-embeddings-inference server
+    python tests/scaling/rerank_benchmark.py --url http://localhost:8080/rerank \
+        --model BAAI/bge-reranker-base
+
+    # In-process cross-encoder (requires sentence-transformers)
+    python tests/scaling/rerank_benchmark.py --local cross-encoder/ms-marco-MiniLM-L-6-v2
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import uuid4
+
+from core.base import ChunkSearchResult, RerankSettings
+from core.providers.embeddings import (
+    CrossEncoderRerankBackend,
+    Reranker,
+    TEIRerankBackend,
+)
+
+BATCH_SIZES = [1, 8, 16, 32, 64, 128]
+QUERY = "Who was Aristotle's teacher?"
+TEXT = (
+    "Aristotle was an Ancient Greek philosopher and polymath. He studied at "
+    "Plato's Academy in Athens for twenty years before founding the Lyceum."
+)
+
+
+def make_results(count: int) -> list[ChunkSearchResult]:
+    return [
+        ChunkSearchResult(
+            id=uuid4(),
+            document_id=uuid4(),
+            owner_id=None,
+            collection_ids=[],
+            score=0.0,
+            text=f"{i}: {TEXT}",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+async def run(reranker: Reranker, iterations: int) -> None:
+    print(f"{'batch':>6} {'p50 ms':>10} {'p95 ms':>10} {'docs/s':>10}")
+    for batch_size in BATCH_SIZES:
+        timings = []
+        for _ in range(iterations):
+            # Fresh chunk ids every iteration so the score cache never hits
+            results = make_results(batch_size)
+            start = time.perf_counter()
+            await reranker.arerank(QUERY, results, limit=batch_size)
+            timings.append(time.perf_counter() - start)
+
+        timings.sort()
+        p50 = statistics.median(timings)
+        p95 = timings[int(0.95 * (len(timings) - 1))]
+        print(
+            f"{batch_size:>6} {p50 * 1000:>10.1f} {p95 * 1000:>10.1f} "
+            f"{batch_size / p50:>10.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="TEI /rerank endpoint")
+    parser.add_argument("--model", default="", help="TEI model id")
+    parser.add_argument("--local", help="Local cross-encoder model name")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    settings = RerankSettings(
+        max_batch_size=args.max_batch_size, cache_enabled=False
+    )
+    if args.local:
+        backend = CrossEncoderRerankBackend(args.local, settings)
+    elif args.url:
+        backend = TEIRerankBackend(args.url, args.model, settings)
+    else:
+        parser.error("one of --url or --local is required")
+
+    asyncio.run(run(Reranker(backend, settings), args.iterations))
+
+
+if __name__ == "__main__":
+    main()
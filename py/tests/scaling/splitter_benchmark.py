@@ -0,0 +1,92 @@
+"""Text splitter throughput over synthetic corpora of increasing size.
+
+Each corpus is split with the default ingestion settings (recursive
+splitter, 1024 character chunks with 512 characters of overlap), in three
+shapes: paragraphs, a single line of words and text with no separators.
+
+Usage:
+    python tests/scaling/splitter_benchmark.py
+    python tests/scaling/splitter_benchmark.py --sizes 1 10 50 --tokens
+"""
+
+import argparse
+import random
+import time
+
+from shared.utils.splitter.text import RecursiveCharacterTextSplitter
+
+WORDS = (
+    "the quick brown fox jumps over a lazy dog while retrieval augmented "
+    "generation splits long documents into overlapping chunks"
+).split()
+
+
+def paragraphs(size: int, rng: random.Random) -> str:
+    parts, total = [], 0
+    while total < size:
+        words = rng.choices(WORDS, k=rng.randint(20, 200))
+        part = " ".join(words) + rng.choice(["\n\n", "\n"])
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)[:size]
+
+
+def single_line(size: int, rng: random.Random) -> str:
+    return paragraphs(size, rng).replace("\n", " ")
+
+
+def no_separators(size: int, rng: random.Random) -> str:
+    return "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=size))
+
+
+CORPORA = {
+    "paragraphs": paragraphs,
+    "single line": single_line,
+    "no separators": no_separators,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16],
+        help="Corpus sizes in MB",
+    )
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--chunk-overlap", type=int, default=512)
+    parser.add_argument(
+        "--tokens",
+        action="store_true",
+        help="Measure chunk sizes in tiktoken tokens instead of characters",
+    )
+    args = parser.parse_args()
+
+    kwargs = {
+        "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
+    }
+    if args.tokens:
+        splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            encoding_name="cl100k_base", **kwargs
+        )
+    else:
+        splitter = RecursiveCharacterTextSplitter(**kwargs)
+
+    print(f"{'corpus':<14} {'MB':>4} {'chunks':>9} {'s':>8} {'MB/s':>8}")
+    for name, generate in CORPORA.items():
+        for size in args.sizes:
+            text = generate(size * 1024 * 1024, random.Random(size))
+            start = time.perf_counter()
+            chunks = splitter.split_text(text)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:<14} {size:>4} {len(chunks):>9} {elapsed:>8.2f} "
+                f"{size / elapsed:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import AppConfig, AuthConfig, R2RException
+from core.base.providers.auth import VerifiedApiKeyCache
+from core.providers.auth import R2RAuthProvider
+from core.providers.crypto import BcryptCryptoConfig, BCryptCryptoProvider
+
+
+@pytest.fixture
+def auth_provider():
+    app = AppConfig(project_name="test_api_key_cache")
+    crypto_provider = BCryptCryptoProvider(
+        BcryptCryptoConfig(app=app, bcrypt_rounds=4)
+    )
+    key_id, raw_key = crypto_provider.generate_api_key()
+    record = {
+        "id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "hashed_key": crypto_provider.hash_api_key(raw_key),
+    }
+
+    users_handler = MagicMock()
+    users_handler.get_api_key_record = AsyncMock(return_value=record)
+    users_handler.get_user_by_id = AsyncMock(
+        return_value=SimpleNamespace(id=record["user_id"], is_active=True)
+    )
+    users_handler.delete_api_key = AsyncMock(return_value=True)
+
+    provider = R2RAuthProvider(
+        AuthConfig(app=app, provider="r2r"),
+        crypto_provider,
+        MagicMock(users_handler=users_handler),
+        MagicMock(),
+    )
+    provider.crypto_provider.verify_api_key = MagicMock(
+        wraps=crypto_provider.verify_api_key
+    )
+    return provider, f"{key_id}.{raw_key}", record
+
+
+@pytest.mark.asyncio
+async def test_verified_key_skips_hash_check(auth_provider):
+    provider, api_key, record = auth_provider
+
+    for _ in range(3):
+        user = await provider.authenticate_api_key(api_key)
+        assert user.id == record["user_id"]
+
+    assert provider.crypto_provider.verify_api_key.call_count == 1
+    assert provider.api_key_cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_wrong_key_is_not_cached(auth_provider):
+    provider, api_key, _ = auth_provider
+    key_id = api_key.split(".", 1)[0]
+
+    for _ in range(2):
+        with pytest.raises(R2RException):
+            await provider.authenticate_api_key(f"{key_id}.wrong")
+
+    assert provider.crypto_provider.verify_api_key.call_count == 2
+    assert len(provider.api_key_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_deleting_key_evicts_it(auth_provider):
+    provider, api_key, record = auth_provider
+    await provider.authenticate_api_key(api_key)
+
+    await provider.delete_user_api_key(record["user_id"], record["id"])
+    await provider.authenticate_api_key(api_key)
+
+    assert provider.crypto_provider.verify_api_key.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_key_deleted_by_another_worker_is_rejected(auth_provider):
+    provider, api_key, _ = auth_provider
+    await provider.authenticate_api_key(api_key)
+
+    # Deleted through another worker, whose cache is the only one cleared
+    users_handler = provider.database_provider.users_handler
+    users_handler.get_api_key_record.return_value = None
+    with pytest.raises(R2RException):
+        await provider.authenticate_api_key(api_key)
+
+
+def test_cache_is_bounded_and_expires(monkeypatch):
+    cache = VerifiedApiKeyCache(max_entries=2, ttl_seconds=10)
+    key_ids = {api_key: uuid.uuid4() for api_key in ("a.1", "b.2", "c.3")}
+    for api_key, key_id in key_ids.items():
+        cache.put(api_key, key_id)
+
+    assert len(cache) == 2
+    assert cache.get("a.1") is None
+    assert cache.get("c.3") == key_ids["c.3"]
+
+    now = cache._entries[next(iter(cache._entries))][0]
+    monkeypatch.setattr(
+        "core.base.providers.auth.time.monotonic", lambda: now + 1
+    )
+    assert cache.get("c.3") is None
+
+
+@pytest.mark.asyncio
+async def test_hashing_runs_on_bounded_executor(auth_provider):
+    crypto_provider = auth_provider[0].crypto_provider
+
+    hashes = await asyncio.gather(
+        *(crypto_provider.async_get_password_hash("pw") for _ in range(6))
+    )
+    assert all(
+        crypto_provider.verify_password("pw", hashed) for hashed in hashes
+    )
+
+    metrics = crypto_provider.hashing_metrics()
+    assert metrics["max_workers"] == 4
+    assert metrics["completed"] == 6
+    assert metrics["queue_depth"] == metrics["running"] == 0
+    assert metrics["max_queue_depth"] >= 1
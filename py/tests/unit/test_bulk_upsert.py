@@ -0,0 +1,218 @@
+import json
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import asyncpg
+import pytest
+
+from core.base import Vector, VectorEntry, VectorQuantizationType, VectorType
+from core.providers.database.chunks import PostgresChunksHandler
+
+INDEX_NAME = "test_bulk_load_hnsw"
+
+
+def make_entries(count: int, dimension: int = 4) -> list[VectorEntry]:
+    owner_id, document_id = uuid.uuid4(), uuid.uuid4()
+    return [
+        VectorEntry(
+            id=uuid.uuid4(),
+            document_id=document_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            vector=Vector(
+                data=[float(i + 1)] * dimension, type=VectorType.FIXED
+            ),
+            text=f"bulk chunk {i}",
+            metadata={"position": i},
+        )
+        for i in range(count)
+    ]
+
+
+class FakeConnection:
+    """Records the statements issued on the bulk load connection."""
+
+    def __init__(self, fail_copy: bool = False, fail_create: bool = False):
+        self.fail_copy = fail_copy
+        self.fail_create = fail_create
+        self.statements: list[str] = []
+
+    async def execute(self, query, *args):
+        self.statements.append(" ".join(query.split()))
+        if self.fail_create and "CREATE INDEX IF NOT EXISTS" in query:
+            raise RuntimeError("out of memory")
+
+    async def fetch(self, query, *args):
+        if "pg_indexes" in query:
+            return [
+                {
+                    "indexname": INDEX_NAME,
+                    "indexdef": f"CREATE INDEX {INDEX_NAME} ON t USING hnsw (vec)",
+                }
+            ]
+        return []
+
+    async def copy_records_to_table(self, table, records, columns):
+        list(records)
+        if self.fail_copy:
+            raise RuntimeError("copy failed")
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+def make_handler(conn: FakeConnection) -> PostgresChunksHandler:
+    @asynccontextmanager
+    async def connection():
+        yield conn
+
+    connection_manager = MagicMock()
+    connection_manager.connection = connection
+    return PostgresChunksHandler(
+        project_name="test_project",
+        connection_manager=connection_manager,
+        dimension=4,
+        quantization_type=VectorQuantizationType.FP32,
+    )
+
+
+def _steps(conn: FakeConnection) -> list[str]:
+    steps = []
+    for statement in conn.statements:
+        for step in ("advisory_lock", "DROP INDEX"):
+            if step in statement:
+                steps.append(step)
+        if "ON CONFLICT (id)" in statement:
+            steps.append("merge")
+        if "CREATE INDEX IF NOT EXISTS" in statement:
+            steps.append("CREATE INDEX")
+        if "advisory_unlock" in statement:
+            steps.append("advisory_unlock")
+    return steps
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fail_copy", [False, True])
+async def test_indexes_are_rebuilt_under_the_lock(fail_copy):
+    conn = FakeConnection(fail_copy=fail_copy)
+    handler = make_handler(conn)
+
+    if fail_copy:
+        with pytest.raises(RuntimeError, match="copy failed"):
+            await handler.bulk_upsert_entries(
+                make_entries(3), defer_vector_index=True
+            )
+    else:
+        await handler.bulk_upsert_entries(
+            make_entries(3), defer_vector_index=True
+        )
+
+    expected = ["advisory_lock", "DROP INDEX"]
+    if not fail_copy:
+        expected.append("merge")
+    expected += ["CREATE INDEX", "advisory_unlock"]
+    assert _steps(conn) == expected
+
+
+@pytest.mark.asyncio
+async def test_loads_without_deferral_skip_the_lock():
+    conn = FakeConnection()
+    await make_handler(conn).bulk_upsert_entries(
+        make_entries(3), defer_vector_index=False
+    )
+
+    assert _steps(conn) == ["merge"]
+
+
+@pytest.mark.asyncio
+async def test_failed_rebuild_is_raised_and_retried():
+    conn = FakeConnection(fail_create=True)
+    handler = make_handler(conn)
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        await handler.bulk_upsert_entries(
+            make_entries(3), defer_vector_index=True
+        )
+    assert _steps(conn)[-1] == "advisory_unlock"
+
+    # The next load, even one that does not defer, rebuilds the index
+    conn.fail_create = False
+    conn.statements.clear()
+    await handler.bulk_upsert_entries(
+        make_entries(3), defer_vector_index=False
+    )
+    assert _steps(conn) == [
+        "advisory_lock",
+        "CREATE INDEX",
+        "merge",
+        "advisory_unlock",
+    ]
+
+    conn.statements.clear()
+    await handler.bulk_upsert_entries(
+        make_entries(3), defer_vector_index=False
+    )
+    assert _steps(conn) == ["merge"]
+
+
+# The tests below run against the database configured by conftest.py
+
+
+async def _create_vector_index(chunks_handler) -> None:
+    table = chunks_handler._get_table_name(PostgresChunksHandler.TABLE_NAME)
+    await chunks_handler.connection_manager.execute_query(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON {table} "
+        "USING hnsw (vec vector_cosine_ops)"
+    )
+
+
+async def _vector_index_exists(chunks_handler) -> bool:
+    rows = await chunks_handler.connection_manager.fetch_query(
+        "SELECT 1 FROM pg_indexes WHERE schemaname = $1 AND indexname = $2",
+        [chunks_handler.project_name, INDEX_NAME],
+    )
+    return len(rows) == 1
+
+
+async def _stored_rows(chunks_handler, entries) -> dict:
+    table = chunks_handler._get_table_name(PostgresChunksHandler.TABLE_NAME)
+    rows = await chunks_handler.connection_manager.fetch_query(
+        f"SELECT id, owner_id, text, metadata FROM {table} "
+        "WHERE id = ANY($1::uuid[])",
+        [[entry.id for entry in entries]],
+    )
+    return {row["id"]: row for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_stores_rows_and_keeps_index(chunks_handler):
+    await _create_vector_index(chunks_handler)
+    entries = make_entries(50)
+
+    await chunks_handler.bulk_upsert_entries(entries, defer_vector_index=True)
+
+    rows = await _stored_rows(chunks_handler, entries)
+    assert len(rows) == len(entries)
+    for entry in entries:
+        row = rows[entry.id]
+        assert row["owner_id"] == entry.owner_id
+        assert row["text"] == entry.text
+        assert json.loads(row["metadata"]) == entry.metadata
+    assert await _vector_index_exists(chunks_handler)
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_upsert_restores_index(chunks_handler):
+    await _create_vector_index(chunks_handler)
+    # The chunks table stores 4 dimensional vectors
+    entries = make_entries(50, dimension=3)
+
+    with pytest.raises(asyncpg.PostgresError):
+        await chunks_handler.bulk_upsert_entries(
+            entries, defer_vector_index=True
+        )
+
+    assert await _stored_rows(chunks_handler, entries) == {}
+    assert await _vector_index_exists(chunks_handler)
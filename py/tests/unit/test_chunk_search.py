@@ -0,0 +1,317 @@
+import re
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+
+from core.base import (
+    AppConfig,
+    DatabaseConfig,
+    SearchSettings,
+    VectorQuantizationType,
+)
+from core.providers.database.chunks import PostgresChunksHandler
+
+
+def _placeholders(query: str) -> set[int]:
+    return {int(p) for p in re.findall(r"\$(\d+)", query)}
+
+
+@pytest.fixture
+def chunks_handler():
+    connection_manager = AsyncMock()
+    connection_manager.fetch_query = AsyncMock(return_value=[])
+    return PostgresChunksHandler(
+        project_name="test_project",
+        connection_manager=connection_manager,
+        dimension=4,
+        quantization_type=VectorQuantizationType.FP32,
+    )
+
+
+def _row(chunk_id, rank=None, distance=None):
+    row = {
+        "id": chunk_id,
+        "document_id": uuid.uuid4(),
+        "owner_id": uuid.uuid4(),
+        "collection_ids": [],
+        "text": "text",
+        "metadata": "{}",
+    }
+    if rank is not None:
+        row["rank"] = rank
+    if distance is not None:
+        row["distance"] = distance
+    return row
+
+
+@pytest.mark.asyncio
+async def test_parallel_hybrid_search_fuses_both_legs(chunks_handler):
+    shared_id, semantic_id, full_text_id = (uuid.uuid4() for _ in range(3))
+
+    async def fetch_query(query, params, read_only=False):
+        if "ts_rank" in query:
+            return [_row(shared_id, rank=0.9), _row(full_text_id, rank=0.5)]
+        return [_row(shared_id, distance=0.1), _row(semantic_id, distance=0.2)]
+
+    chunks_handler.connection_manager.fetch_query.side_effect = fetch_query
+
+    settings = SearchSettings(use_hybrid_search=True, limit=5)
+    results = await chunks_handler.hybrid_search(
+        "query", [0.1, 0.2, 0.3, 0.4], settings
+    )
+
+    assert chunks_handler.connection_manager.fetch_query.await_count == 2
+    assert [r.id for r in results][0] == shared_id
+    assert {r.id for r in results} == {shared_id, semantic_id, full_text_id}
+    assert results[0].metadata["semantic_rank"] == 1
+    assert results[0].metadata["full_text_rank"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sql_hybrid_search_issues_single_query(chunks_handler):
+    settings = SearchSettings(
+        use_hybrid_search=True,
+        limit=5,
+        offset=2,
+        filters={"document_id": {"$eq": str(uuid.uuid4())}},
+        hybrid_settings={"fusion_mode": "sql"},
+    )
+    await chunks_handler.hybrid_search("query", [0.1, 0.2, 0.3, 0.4], settings)
+
+    fetch_query = chunks_handler.connection_manager.fetch_query
+    assert fetch_query.await_count == 1
+    query, params = fetch_query.await_args.args
+    assert _placeholders(query) == set(range(1, len(params) + 1))
+
+
+def test_invalid_fusion_mode_is_rejected():
+    with pytest.raises(ValidationError, match="fusion_mode"):
+        SearchSettings(
+            use_hybrid_search=True, hybrid_settings={"fusion_mode": "serial"}
+        )
+
+
+@pytest.fixture
+def binary_chunks_handler():
+    connection_manager = AsyncMock()
+    connection_manager.fetch_query = AsyncMock(return_value=[])
+    collection_id = uuid.UUID("9fbe403b-c11c-5aae-8ade-ef22980c3ad1")
+    config = DatabaseConfig(
+        app=AppConfig(project_name="test_project"),
+        quantized_search_settings={
+            "oversampling_factor": 10,
+            "collection_oversampling_factors": {collection_id: 40},
+        },
+    )
+    return PostgresChunksHandler(
+        project_name="test_project",
+        connection_manager=connection_manager,
+        dimension=4,
+        quantization_type=VectorQuantizationType.INT1,
+        config=config,
+    )
+
+
+def test_binary_search_paginates_after_rerank(binary_chunks_handler):
+    settings = SearchSettings(limit=10, offset=20)
+    query, params = binary_chunks_handler._build_semantic_query(
+        [0.1, -0.2, 0.3, -0.4], settings
+    )
+
+    candidate_cte = query.split("-- Final stage")[0]
+    assert "OFFSET" not in candidate_cte
+    # candidates cover the full window of offset + limit results
+    assert (20 + 10) * 10 in params
+    assert params[-2:] == [10, 20]
+    assert _placeholders(query) == set(range(1, len(params) + 1))
+
+
+def test_oversampling_factor_precedence(binary_chunks_handler):
+    collection_filter = {
+        "collection_ids": {
+            "$overlap": ["9fbe403b-c11c-5aae-8ade-ef22980c3ad1"]
+        }
+    }
+
+    assert (
+        binary_chunks_handler._get_oversampling_factor(SearchSettings()) == 10
+    )
+    assert (
+        binary_chunks_handler._get_oversampling_factor(
+            SearchSettings(filters={"$and": [collection_filter]})
+        )
+        == 40
+    )
+    assert (
+        binary_chunks_handler._get_oversampling_factor(
+            SearchSettings(
+                filters=collection_filter,
+                chunk_settings={"oversampling_factor": 5},
+            )
+        )
+        == 5
+    )
+
+
+@pytest.mark.parametrize("operator", ["$ne", "$nin"])
+def test_excluded_collections_keep_the_default_factor(
+    binary_chunks_handler, operator
+):
+    collection_id = "9fbe403b-c11c-5aae-8ade-ef22980c3ad1"
+    operand = collection_id if operator == "$ne" else [collection_id]
+    settings = SearchSettings(filters={"collection_id": {operator: operand}})
+
+    assert binary_chunks_handler._get_oversampling_factor(settings) == 10
+
+
+@pytest.mark.asyncio
+async def test_quantized_search_evaluation(binary_chunks_handler):
+    query_vector = [0.1, -0.2, 0.3, -0.4]
+    exact = [uuid.uuid4() for _ in range(4)]
+    queries = []
+
+    async def fetch_query(query, params, read_only=False):
+        queries.append((query, params, read_only))
+        if "binary_distance" not in query:
+            return [{"id": chunk_id} for chunk_id in exact]
+        # The candidate limit precedes the query vector; larger factors
+        # find more of the exact neighbours
+        candidate_limit = params[params.index(query_vector) - 1]
+        return [{"id": chunk_id} for chunk_id in exact[: candidate_limit // 2]]
+
+    binary_chunks_handler.connection_manager.fetch_query.side_effect = (
+        fetch_query
+    )
+
+    report = await binary_chunks_handler.evaluate_quantized_search(
+        [query_vector], SearchSettings(limit=4), [1, 2]
+    )
+
+    assert [entry["oversampling_factor"] for entry in report] == [1, 2]
+    assert [entry["recall"] for entry in report] == [0.5, 1.0]
+    exact_query, params, read_only = queries[0]
+    assert "MATERIALIZED" in exact_query
+    assert _placeholders(exact_query) == set(range(1, len(params) + 1))
+    assert all(read_only for _, _, read_only in queries)
+
+
+@pytest.mark.asyncio
+async def test_stream_full_text_search_uses_cursor(chunks_handler):
+    chunk_ids = [uuid.uuid4() for _ in range(3)]
+    calls = []
+
+    async def stream_query(query, params, prefetch, read_only=False):
+        calls.append((query, params, prefetch))
+        for chunk_id in chunk_ids:
+            yield _row(chunk_id, rank=0.5)
+
+    chunks_handler.connection_manager.stream_query = stream_query
+
+    # Streaming routes may raise the limit past SearchSettings' own cap
+    settings = SearchSettings(use_fulltext_search=True).model_copy(
+        update={"limit": 5000}
+    )
+    results = [
+        r
+        async for r in chunks_handler.stream_full_text_search(
+            "query", settings, prefetch=100
+        )
+    ]
+
+    assert [r.id for r in results] == chunk_ids
+    query, params, prefetch = calls[0]
+    assert prefetch == 100
+    assert params[-1] == 5000
+    assert _placeholders(query) == set(range(1, len(params) + 1))
+    chunks_handler.connection_manager.fetch_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_hybrid_search_matches_hybrid_search(chunks_handler):
+    chunk_ids = [uuid.uuid4() for _ in range(5)]
+    semantic_rows = [_row(i, distance=0.1) for i in chunk_ids[:3]]
+    full_text_rows = [_row(i, rank=0.5) for i in chunk_ids[2:]]
+    rows_by_id = {row["id"]: row for row in semantic_rows + full_text_rows}
+
+    async def stream_query(query, params, prefetch, read_only=False):
+        for row in full_text_rows if "ts_rank" in query else semantic_rows:
+            yield row
+
+    fetched = []
+
+    async def fetch_query(query, params, read_only=False):
+        if "ANY($1::uuid[])" in query:
+            fetched.append(params[0])
+            return [rows_by_id[i] for i in reversed(params[0])]
+        return full_text_rows if "ts_rank" in query else semantic_rows
+
+    chunks_handler.connection_manager.stream_query = stream_query
+    chunks_handler.connection_manager.fetch_query.side_effect = fetch_query
+
+    settings = SearchSettings(use_hybrid_search=True, limit=4, offset=1)
+    expected = await chunks_handler.hybrid_search(
+        "query", [0.1, 0.2, 0.3, 0.4], settings
+    )
+    streamed = [
+        r
+        async for r in chunks_handler.stream_hybrid_search(
+            "query", [0.1, 0.2, 0.3, 0.4], settings, page_size=3
+        )
+    ]
+
+    assert [(r.id, r.score) for r in streamed] == [
+        (r.id, r.score) for r in expected
+    ]
+    assert (
+        streamed[0].metadata["semantic_rank"]
+        == (expected[0].metadata["semantic_rank"])
+    )
+    assert [len(ids) for ids in fetched] == [3, 1]
+
+
+def test_stream_hybrid_search_validates_before_streaming(chunks_handler):
+    settings = SearchSettings(use_hybrid_search=True).model_copy(
+        update={"limit": 5000}
+    )
+
+    with pytest.raises(ValueError, match="full_text_limit"):
+        chunks_handler.stream_hybrid_search(
+            "query", [0.1, 0.2, 0.3, 0.4], settings
+        )
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_skips_total_count(chunks_handler):
+    calls = []
+
+    async def stream_query(query, params, prefetch, read_only=False):
+        calls.append((query, params))
+        yield {**_row(uuid.uuid4()), "vec": None}
+
+    chunks_handler.connection_manager.stream_query = stream_query
+
+    chunks = [
+        chunk
+        async for chunk in chunks_handler.stream_chunks(
+            offset=10,
+            limit=2000,
+            filters={"owner_id": {"$eq": str(uuid.uuid4())}},
+        )
+    ]
+
+    query, params = calls[0]
+    assert len(chunks) == 1
+    assert "COUNT(*)" not in query
+    assert params[-2:] == [2000, 10]
+    assert _placeholders(query) == set(range(1, len(params) + 1))
+
+
+@pytest.mark.asyncio
+async def test_chunk_counts_are_read_from_the_primary(chunks_handler):
+    owner_id = uuid.uuid4()
+
+    assert await chunks_handler.get_chunk_counts([owner_id]) == {owner_id: 0}
+    fetch_query = chunks_handler.connection_manager.fetch_query
+    assert not fetch_query.await_args.kwargs.get("read_only", False)
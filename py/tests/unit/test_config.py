@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 import toml
 
+from core.base import AppConfig, IngestionConfig, ParserExecutionSettings
 from core.base.utils import deep_update
 from core.main.config import R2RConfig
 
@@ -235,3 +236,16 @@ def test_all_config_overrides(all_configs):
     for config_name, config_data in all_configs.items():
         config = R2RConfig(config_data)
         assert config is not None
+
+
+def test_settings_loaded_from_a_config_file_are_validated(monkeypatch):
+    monkeypatch.setitem(
+        IngestionConfig._defaults,
+        "parser_execution_settings",
+        {"max_workers": 2},
+    )
+
+    settings = IngestionConfig(app=AppConfig()).parser_execution_settings
+
+    assert isinstance(settings, ParserExecutionSettings)
+    assert settings.max_workers == 2
@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from core.providers.database.base import (
+    PostgresConnectionManager,
+    SemaphoreConnectionPool,
+)
+
+
+class FakeConnection:
+    def __init__(self, name: str):
+        self.name = name
+
+    async def fetch(self, query, *params):
+        return [{"pool": self.name, "query": query}]
+
+    def transaction(self, **kwargs):
+        raise AssertionError("reads must not open a transaction")
+
+
+class FakeAsyncpgPool:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def make_pool(name: str) -> SemaphoreConnectionPool:
+    pool = SemaphoreConnectionPool(f"postgresql://{name}", None)
+    pool.semaphore = asyncio.Semaphore(4)
+    pool.pool = FakeAsyncpgPool(FakeConnection(name))
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_reads_are_routed_to_replica_without_transaction():
+    primary, replica = make_pool("primary"), make_pool("replica")
+    manager = PostgresConnectionManager()
+    await manager.initialize(primary, read_pool=replica)
+
+    read = await manager.fetch_query("SELECT 1", read_only=True)
+    write = await manager.fetch_query("SELECT 2")
+
+    assert read[0]["pool"] == "replica"
+    assert write[0]["pool"] == "primary"
+
+    metrics = manager.pool_metrics()
+    assert metrics["replica"]["acquisitions"] == 1
+    assert metrics["replica"]["statements"] == 1
+    assert metrics["primary"]["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_read_only_falls_back_to_primary_without_replica():
+    primary = make_pool("primary")
+    manager = PostgresConnectionManager()
+    await manager.initialize(primary)
+
+    rows = await manager.fetch_query("SELECT 1", read_only=True)
+
+    assert rows[0]["pool"] == "primary"
+    assert set(manager.pool_metrics()) == {"primary"}
@@ -0,0 +1,217 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from core import R2RConfig
+from core.base import (
+    AppConfig,
+    EmbeddingCacheBackend,
+    EmbeddingConfig,
+    EmbeddingProvider,
+    EmbeddingPurpose,
+    SearchSettings,
+)
+from core.base.providers.embedding import EmbeddingCache
+from core.main.services import RetrievalService
+
+
+class CountingEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, config: EmbeddingConfig):
+        super().__init__(config)
+        self.requested: list[list[str]] = []
+
+    def _embed(self, texts: list[str]) -> list[list[float]]:
+        self.requested.append(list(texts))
+        return [[float(len(text)), 0.1] for text in texts]
+
+    async def _execute_task(self, task):
+        return self._embed(task["texts"])
+
+    def _execute_task_sync(self, task):
+        return self._embed(task["texts"])
+
+    async def async_get_embedding(
+        self,
+        text,
+        stage=EmbeddingProvider.Step.BASE,
+        purpose=EmbeddingPurpose.INDEX,
+        **kwargs,
+    ):
+        task = {
+            "texts": [text],
+            "stage": stage,
+            "purpose": purpose,
+            "kwargs": kwargs,
+        }
+        return (await self._execute_with_backoff_async(task))[0]
+
+    async def async_get_embeddings(
+        self,
+        texts,
+        stage=EmbeddingProvider.Step.BASE,
+        purpose=EmbeddingPurpose.INDEX,
+        **kwargs,
+    ):
+        task = {
+            "texts": texts,
+            "stage": stage,
+            "purpose": purpose,
+            "kwargs": kwargs,
+        }
+        return await self._execute_with_backoff_async(task)
+
+    def rerank(self, query, results, stage=None, limit=10):
+        return results[:limit]
+
+    async def arerank(self, query, results, stage=None, limit=10):
+        return results[:limit]
+
+
+class DictBackend(EmbeddingCacheBackend):
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    async def get_many(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set_many(self, items, ttl):
+        self.store.update(items)
+
+
+def make_provider(**cache_settings) -> CountingEmbeddingProvider:
+    return CountingEmbeddingProvider(
+        EmbeddingConfig(
+            app=AppConfig(project_name="test_embedding_cache"),
+            provider="litellm",
+            base_model="openai/text-embedding-3-small",
+            base_dimension=2,
+            cache_settings=cache_settings,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_hit_cache():
+    provider = make_provider()
+
+    first = await provider.async_get_embedding(
+        "hello", purpose=EmbeddingPurpose.QUERY
+    )
+    second = await provider.async_get_embedding(
+        "hello", purpose=EmbeddingPurpose.QUERY
+    )
+
+    assert first == second == [5.0, float(np.float32(0.1))]
+    assert provider.requested == [["hello"]]
+    assert provider.cache_stats()["hits"] == 1
+    assert provider.cache_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_only_requests_missing_texts():
+    provider = make_provider()
+    await provider.async_get_embedding("a", purpose=EmbeddingPurpose.QUERY)
+
+    embeddings = await provider.async_get_embeddings(
+        ["a", "bb", "ccc"], purpose=EmbeddingPurpose.QUERY
+    )
+
+    assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0]
+    assert provider.requested[-1] == ["bb", "ccc"]
+
+
+@pytest.mark.asyncio
+async def test_purpose_and_kwargs_are_respected():
+    provider = make_provider(purposes=["index", "query"])
+    await provider.async_get_embedding("q", purpose=EmbeddingPurpose.INDEX)
+    await provider.async_get_embedding("q", purpose=EmbeddingPurpose.QUERY)
+    await provider.async_get_embedding(
+        "q", purpose=EmbeddingPurpose.QUERY, dimensions=2
+    )
+
+    assert len(provider.requested) == 3
+
+
+@pytest.mark.asyncio
+async def test_only_configured_purposes_are_cached():
+    provider = make_provider()
+    for _ in range(2):
+        await provider.async_get_embedding(
+            "doc", purpose=EmbeddingPurpose.INDEX
+        )
+
+    assert provider.requested == [["doc"], ["doc"]]
+    assert provider.cache_stats() == {
+        "entries": 0,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_wrong_number_of_embeddings_is_an_error():
+    provider = make_provider()
+    provider._embed = lambda texts: [[1.0, 0.1]]
+
+    with pytest.raises(ValueError):
+        await provider.async_get_embeddings(
+            ["a", "b"], purpose=EmbeddingPurpose.QUERY
+        )
+    assert provider.cache_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_fills_local_cache():
+    backend = DictBackend()
+    writer = make_provider()
+    writer.set_cache_backend(backend)
+    await writer.async_get_embedding("shared", purpose=EmbeddingPurpose.QUERY)
+
+    reader = make_provider()
+    reader.set_cache_backend(backend)
+    assert await reader.async_get_embedding(
+        "shared", purpose=EmbeddingPurpose.QUERY
+    ) == [
+        6.0,
+        float(np.float32(0.1)),
+    ]
+    assert reader.requested == []
+
+
+@pytest.mark.asyncio
+async def test_repeated_searches_embed_the_query_once():
+    provider = make_provider()
+    providers = MagicMock()
+    providers.completion_embedding = provider
+    providers.database.chunks_handler.semantic_search = AsyncMock(
+        return_value=[]
+    )
+    service = RetrievalService(config=R2RConfig({}), providers=providers)
+    settings = SearchSettings(
+        use_semantic_search=True, graph_settings={"enabled": False}
+    )
+
+    for _ in range(2):
+        await service.search("what is r2r", settings)
+
+    assert provider.requested == [["what is r2r"]]
+    assert provider.cache_stats()["hits"] == 1
+
+
+def test_cache_is_bounded_and_expires(monkeypatch):
+    cache = EmbeddingCache(max_entries=2, ttl_seconds=10)
+    for key in ("a", "b", "c"):
+        cache.put(key, [1.0])
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.evictions == 1
+
+    now = time.monotonic()
+    monkeypatch.setattr(
+        "core.base.providers.embedding.time.monotonic", lambda: now + 11
+    )
+    assert cache.get("c") is None
@@ -0,0 +1,69 @@
+import io
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from core.base import R2RException
+from core.main.api.v3.documents_router import (
+    UPLOAD_CHUNK_SIZE,
+    DocumentsRouter,
+)
+from core.providers.database.files import PostgresFilesHandler
+
+
+def make_files_handler():
+    conn = MagicMock()
+    conn.fetchval = AsyncMock(side_effect=[1234, 0])  # lo_create, lo_open
+    conn.execute = AsyncMock()
+    connection_manager = MagicMock()
+    connection_manager.pool.get_connection.return_value.__aenter__.return_value = conn
+    handler = PostgresFilesHandler(
+        project_name="test_file_upload",
+        connection_manager=connection_manager,
+    )
+    return handler, conn
+
+
+async def consume(chunks) -> int:
+    return sum([len(chunk) async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+async def test_upload_is_written_in_chunks():
+    handler, conn = make_files_handler()
+    upload = UploadFile(io.BytesIO(b"x" * (2 * UPLOAD_CHUNK_SIZE + 10)))
+
+    size = await handler.store_file_stream(
+        uuid.uuid4(),
+        "big.pdf",
+        DocumentsRouter._read_upload(upload, 10 * UPLOAD_CHUNK_SIZE, "pdf"),
+        "application/pdf",
+    )
+
+    assert size == 2 * UPLOAD_CHUNK_SIZE + 10
+    writes = [
+        call.args
+        for call in conn.execute.await_args_list
+        if "lowrite" in call.args[0]
+    ]
+    assert [len(args[2]) for args in writes] == [
+        UPLOAD_CHUNK_SIZE,
+        UPLOAD_CHUNK_SIZE,
+        10,
+    ]
+    # The file row is written last, with the streamed size
+    assert conn.execute.await_args.args[4] == size
+
+
+@pytest.mark.asyncio
+async def test_size_limit_is_enforced_while_streaming():
+    upload = UploadFile(io.BytesIO(b"x" * (3 * UPLOAD_CHUNK_SIZE)))
+    chunks = DocumentsRouter._read_upload(upload, UPLOAD_CHUNK_SIZE, "txt")
+
+    with pytest.raises(R2RException) as exc_info:
+        await consume(chunks)
+    assert exc_info.value.status_code == 413
+    # Nothing past the first chunk over the limit was read
+    assert upload.file.tell() == 2 * UPLOAD_CHUNK_SIZE
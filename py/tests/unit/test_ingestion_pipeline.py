@@ -0,0 +1,154 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import DocumentChunk, IngestionPipelineSettings
+from core.main.services.ingestion_service import IngestionService
+
+
+@pytest.fixture(autouse=True)
+def word_token_counter(monkeypatch):
+    # tiktoken downloads its encodings on first use
+    monkeypatch.setattr(
+        "core.main.services.ingestion_service.count_tokens",
+        lambda text, model=None: len(text.split()),
+    )
+
+
+def make_service(embed_workers=2) -> IngestionService:
+    providers = MagicMock()
+    providers.embedding.config.concurrent_request_limit = 256
+    providers.embedding.async_get_embeddings = AsyncMock(
+        side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+    )
+    config = MagicMock()
+    config.ingestion.chunks_for_document_summary = 3
+    config.ingestion.pipeline_settings = IngestionPipelineSettings(
+        embed_workers=embed_workers, queue_depth=2
+    )
+    service = IngestionService(config=config, providers=providers)
+    service.update_document_status = AsyncMock()
+    service.augment_document_info = AsyncMock()
+    return service
+
+
+async def chunk_stream(count, produced, document_id, owner_id):
+    for i in range(count):
+        produced.append(i)
+        yield DocumentChunk(
+            id=uuid.uuid4(),
+            document_id=document_id,
+            collection_ids=[],
+            owner_id=owner_id,
+            data=f"chunk number {i}",
+            metadata={},
+        )
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_stored_while_parsing_continues():
+    service = make_service()
+    document_info = MagicMock(id=uuid.uuid4())
+    produced: list[int] = []
+    stored: list[int] = []
+    max_backlog = 0
+
+    async def store_embeddings(entries, chunk_quota=None):
+        nonlocal max_backlog
+        max_backlog = max(max_backlog, len(produced) - sum(stored))
+        stored.append(len(entries))
+        await asyncio.sleep(0)
+        yield "stored"
+
+    service.store_embeddings = store_embeddings
+
+    await service.ingest_chunk_stream(
+        document_info,
+        chunk_stream(200, produced, document_info.id, uuid.uuid4()),
+        embedding_batch_size=4,
+        storage_batch_size=8,
+    )
+
+    assert sum(stored) == 200
+    assert len(stored) == 25
+    # Parsing is held back by the bounded queues instead of running ahead
+    assert max_backlog < 40
+    assert document_info.total_tokens == 600
+    service.augment_document_info.assert_awaited_once()
+    assert len(service.augment_document_info.await_args.args[1]) == 3
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_cancels_pipeline():
+    service = make_service()
+    service.providers.embedding.async_get_embeddings.side_effect = (
+        RuntimeError("embedding provider down")
+    )
+    document_info = MagicMock(id=uuid.uuid4())
+
+    with pytest.raises(RuntimeError, match="embedding provider down"):
+        await service.ingest_chunk_stream(
+            document_info,
+            chunk_stream(100, [], document_info.id, uuid.uuid4()),
+            summarize=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_token_counts_from_the_chunker_are_used():
+    service = make_service()
+    document_info = MagicMock(id=uuid.uuid4())
+
+    async def store_embeddings(entries, chunk_quota=None):
+        yield "stored"
+
+    async def counted_chunks():
+        async for chunk in chunk_stream(
+            10, [], document_info.id, uuid.uuid4()
+        ):
+            chunk.token_count = 7
+            yield chunk
+
+    service.store_embeddings = store_embeddings
+
+    await service.ingest_chunk_stream(
+        document_info, counted_chunks(), summarize=False
+    )
+
+    assert document_info.total_tokens == 70
+
+
+@pytest.mark.asyncio
+async def test_embedding_concurrency_follows_pipeline_settings():
+    service = make_service(embed_workers=3)
+    document_info = MagicMock(id=uuid.uuid4())
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_embeddings(texts):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return [[0.1, 0.2] for _ in texts]
+
+    async def store_embeddings(entries, chunk_quota=None):
+        yield "stored"
+
+    service.providers.embedding.async_get_embeddings.side_effect = (
+        get_embeddings
+    )
+    service.store_embeddings = store_embeddings
+
+    await service.ingest_chunk_stream(
+        document_info,
+        chunk_stream(100, [], document_info.id, uuid.uuid4()),
+        embedding_batch_size=2,
+        summarize=False,
+    )
+
+    # Not the provider's concurrent_request_limit of 256
+    assert max_in_flight == 3
@@ -0,0 +1,242 @@
+import asyncio
+import contextlib
+import io
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+
+import psutil
+import pytest
+
+from core.base import (
+    AppConfig,
+    AsyncParser,
+    DocumentType,
+    ParserExecutionEngine,
+    ParserExecutionSettings,
+)
+from core.parsers.text.html_parser import HTMLParser
+from core.providers import R2RIngestionConfig, R2RIngestionProvider
+
+
+class PagedParser(AsyncParser[bytes]):
+    @staticmethod
+    def count_pages(data: bytes) -> int:
+        return int(data)
+
+    @staticmethod
+    def extract(data: bytes, start: int = 0, end=None):
+        for page in range(start, int(data) if end is None else end):
+            yield f"page {page} from {os.getpid()}"
+
+    async def ingest(self, data, **kwargs):
+        raise NotImplementedError
+
+
+class OptionParser(PagedParser):
+    count_pages = None
+
+    def extract_options(self, **overrides):
+        return {"prefix": overrides.get("prefix", "default")}
+
+    @staticmethod
+    def extract(data: bytes, prefix: str = ""):
+        yield f"{prefix}: {data.decode()}"
+
+
+class SlowParser(PagedParser):
+    count_pages = None
+
+    @staticmethod
+    def extract(data: bytes):
+        yield "first"
+        time.sleep(3)
+        yield "second"
+
+
+class SlowPagedParser(PagedParser):
+    @staticmethod
+    def extract(data: bytes, start: int = 0, end=None):
+        time.sleep(3)
+        yield from PagedParser.extract(data, start, end)
+
+
+class HangingParser(PagedParser):
+    count_pages = None
+
+    @staticmethod
+    def extract(data: bytes):
+        yield str(os.getpid())
+        time.sleep(60)
+        yield "never"
+
+
+class CrashingParser(PagedParser):
+    count_pages = None
+
+    @staticmethod
+    def extract(data: bytes):
+        yield "first"
+        os._exit(1)
+
+
+class BrokenParser(PagedParser):
+    count_pages = None
+
+    @staticmethod
+    def extract(data: bytes):
+        yield "first"
+        raise ValueError("corrupt document")
+
+
+# The engine is shared by the tests, and so are the semaphores it binds to
+# the event loop
+pytestmark = pytest.mark.asyncio(scope="module")
+
+
+async def collect(generator) -> list[str]:
+    return [item async for item in generator]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = ParserExecutionEngine(
+        ParserExecutionSettings(
+            max_workers=2,
+            timeouts={"slow": 1},
+            parallel_min_pages=50,
+            pages_per_task=8,
+        )
+    )
+    yield engine
+    engine.shutdown()
+
+
+async def test_segments_are_extracted_in_a_worker(engine):
+    segments = await collect(engine.run(PagedParser(), b"20", "pdf"))
+
+    assert [segment.split(" from ")[0] for segment in segments] == [
+        f"page {page}" for page in range(20)
+    ]
+    assert all(not segment.endswith(str(os.getpid())) for segment in segments)
+
+    html = HTMLParser(MagicMock(), MagicMock(), MagicMock())
+    markup = b"<p>Hello <b>world</b></p><script>skip()</script>"
+    assert await collect(engine.run(html, markup, "html")) == ["Hello world"]
+
+
+async def test_large_documents_are_split_into_page_ranges(engine):
+    segments = await collect(engine.run(PagedParser(), b"100", "pdf"))
+
+    assert [segment.split(" from ")[0] for segment in segments] == [
+        f"page {page}" for page in range(100)
+    ]
+
+
+async def test_page_ranges_time_out_and_remove_their_file(
+    engine, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    with pytest.raises(TimeoutError):
+        await collect(engine.run(SlowPagedParser(), b"100", "slow"))
+
+    assert list(tmp_path.iterdir()) == []
+    # Ranges that were still running had their workers killed
+    assert not engine._busy
+
+
+async def test_ingestion_config_overrides_reach_the_worker(engine):
+    parser = OptionParser()
+
+    assert await collect(engine.run(parser, b"doc", "txt")) == ["default: doc"]
+    assert await collect(
+        engine.run(parser, b"doc", "txt", {"prefix": "override"})
+    ) == ["override: doc"]
+
+
+async def test_provider_streams_files_and_closes_the_pool():
+    provider = R2RIngestionProvider(
+        R2RIngestionConfig(app=AppConfig()), MagicMock(), MagicMock()
+    )
+    markup = b"<p>Hello <b>world</b></p>" * 100
+
+    contents = await collect(
+        provider._iter_parser_contents(
+            provider.parsers[DocumentType.HTML],
+            DocumentType.HTML,
+            io.BytesIO(markup),
+            {},
+        )
+    )
+
+    assert "".join(item["content"] for item in contents) == (
+        "Hello world" * 100
+    )
+    # Streaming parsers read file objects in process
+    assert provider.parser_engine._manager is None
+
+    provider.parser_engine._start()
+    await provider.close()
+    assert provider.parser_engine._manager is None
+
+
+async def test_parse_times_out(engine):
+    segments = []
+    with pytest.raises(TimeoutError):
+        async for segment in engine.run(SlowParser(), b"", "slow"):
+            segments.append(segment)
+    assert segments == ["first"]
+
+
+async def test_hanging_workers_are_killed(engine):
+    segments = []
+    with pytest.raises(TimeoutError):
+        async for segment in engine.run(HangingParser(), b"", "slow"):
+            segments.append(segment)
+
+    # Raises TimeoutExpired while the worker is still alive
+    with contextlib.suppress(psutil.NoSuchProcess):
+        psutil.Process(int(segments[0])).wait(timeout=5)
+    assert not engine._busy
+
+
+async def test_stalled_consumers_time_out(engine):
+    segments = []
+    with pytest.raises(TimeoutError, match="not consumed"):
+        async for segment in engine.stream(
+            PagedParser.extract, b"5", "slow", max_buffered=1
+        ):
+            segments.append(segment)
+            if len(segments) == 1:
+                await asyncio.sleep(2.5)
+    assert len(segments) < 5
+
+
+async def test_slow_consumers_do_not_time_out(engine):
+    segments = []
+    # The "slow" type times out after one second of extraction
+    async for segment in engine.stream(
+        PagedParser.extract, b"5", "slow", max_buffered=1
+    ):
+        segments.append(segment)
+        await asyncio.sleep(0.5)
+    assert len(segments) == 5
+
+
+async def test_parser_errors_are_raised(engine):
+    segments = []
+    with pytest.raises(ValueError, match="corrupt document"):
+        async for segment in engine.run(BrokenParser(), b"", "pdf"):
+            segments.append(segment)
+    assert segments == ["first"]
+
+
+async def test_crashed_workers_are_replaced(engine):
+    with pytest.raises(BrokenProcessPool):
+        await collect(engine.run(CrashingParser(), b"", "pdf"))
+
+    assert await collect(engine.run(OptionParser(), b"doc", "txt")) == [
+        "default: doc"
+    ]
@@ -0,0 +1,195 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+
+from core.base import (
+    AppConfig,
+    DatabaseConfig,
+    LimitSettings,
+    RateLimiterSettings,
+)
+from core.providers.database.limits import PostgresLimitsHandler
+from core.providers.database.rate_limiter import (
+    InMemoryRateLimitBackend,
+    PostgresRateLimitBackend,
+    SlidingWindowRateLimiter,
+)
+from shared.abstractions import User
+
+
+@pytest.fixture
+def limits_handler():
+    connection_manager = AsyncMock()
+    connection_manager.fetchrow_query = AsyncMock(return_value={"count": 0})
+    config = DatabaseConfig(
+        app=AppConfig(project_name="test_rate_limiter"),
+        limits=LimitSettings(global_per_min=10, route_per_min=3),
+        rate_limiter_settings={"flush_batch_size": 100},
+    )
+    return PostgresLimitsHandler(
+        project_name="test_rate_limiter",
+        connection_manager=connection_manager,
+        config=config,
+    )
+
+
+def make_user(**limits_overrides) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email="limits@example.com",
+        limits_overrides=limits_overrides or None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_weights_previous_window():
+    limiter = SlidingWindowRateLimiter(InMemoryRateLimitBackend())
+    for _ in range(10):
+        await limiter.hit(["k"], now=60.0 * 100 + 30)
+
+    assert await limiter.counts(["k"], now=60.0 * 100 + 59) == [10]
+    # A quarter of the way into the next window, 75% of it still overlaps
+    assert await limiter.counts(["k"], now=60.0 * 101 + 15) == [7.5]
+    assert await limiter.counts(["k"], now=60.0 * 102 + 1) == [0]
+
+
+class CounterTable:
+    """Applies the counter backend's statements to a dict, standing in for
+    the table that several workers would share."""
+
+    def __init__(self):
+        self.rows: dict[str, int] = {}
+        self.statements: list[str] = []
+
+    async def execute_query(self, query, params=None):
+        self.statements.append(query)
+        if "INSERT INTO" in query:
+            keys, increments, _ = params
+            for key, n in zip(keys, increments, strict=True):
+                self.rows[key] = self.rows.get(key, 0) + n
+
+    async def fetch_query(self, query, params=None):
+        return [
+            {"key": key, "count": self.rows[key]}
+            for key in params[0]
+            if key in self.rows
+        ]
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_shares_counters_between_workers():
+    table = CounterTable()
+    workers = [
+        SlidingWindowRateLimiter(
+            PostgresRateLimitBackend(table, "test.rate_limit_counters")
+        )
+        for _ in range(2)
+    ]
+
+    await workers[0].hit(["a", "b", "a"], now=60.0 * 100)
+    await workers[1].hit(["a"], now=60.0 * 100 + 1)
+
+    assert await workers[1].counts(["a", "b", "c"], now=60.0 * 100 + 2) == [
+        3,
+        1,
+        0,
+    ]
+    assert all(
+        "test.rate_limit_counters" in query for query in table.statements
+    )
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_is_selected_by_config():
+    connection_manager = AsyncMock()
+    handler = PostgresLimitsHandler(
+        project_name="test_rate_limiter",
+        connection_manager=connection_manager,
+        config=DatabaseConfig(
+            app=AppConfig(project_name="test_rate_limiter"),
+            rate_limiter_settings={"counter_backend": "postgres"},
+        ),
+    )
+
+    await handler.create_tables()
+
+    assert isinstance(handler.limiter.backend, PostgresRateLimitBackend)
+    queries = [
+        call.args[0]
+        for call in connection_manager.execute_query.await_args_list
+    ]
+    assert any("CREATE UNLOGGED TABLE" in query for query in queries)
+
+
+def test_request_log_retention_covers_a_month():
+    # Pruning rows of the current month would hand out extra monthly quota
+    with pytest.raises(ValidationError):
+        RateLimiterSettings(request_log_retention_days=7)
+    assert (
+        RateLimiterSettings(
+            request_log_retention_days=31
+        ).request_log_retention_days
+        == 31
+    )
+
+
+@pytest.mark.asyncio
+async def test_per_minute_limits_do_not_query_request_log(limits_handler):
+    user, route = make_user(), "/v3/retrieval/search"
+
+    for _ in range(4):
+        await limits_handler.check_limits(user, route)
+        await limits_handler.log_request(user.id, route)
+
+    with pytest.raises(ValueError, match="Per-route per-minute"):
+        await limits_handler.check_limits(user, route)
+    # Other routes still count towards the global limit only
+    await limits_handler.check_limits(user, "/v3/documents")
+    limits_handler.connection_manager.fetchrow_query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_user_overrides_are_respected(limits_handler):
+    route = "/v3/retrieval/search"
+    user = make_user(
+        global_per_min=1, route_overrides={route: {"route_per_min": 100}}
+    )
+
+    await limits_handler.log_request(user.id, route)
+    await limits_handler.log_request(user.id, route)
+
+    with pytest.raises(ValueError, match="Global per-minute"):
+        await limits_handler.check_limits(user, route)
+
+
+@pytest.mark.asyncio
+async def test_request_log_is_written_in_batches(limits_handler):
+    user_id = uuid.uuid4()
+    for _ in range(5):
+        await limits_handler.log_request(user_id, "/v3/documents")
+
+    limits_handler.connection_manager.execute_many.assert_not_awaited()
+    await limits_handler.close()
+
+    limits_handler.connection_manager.execute_many.assert_awaited_once()
+    _, rows = limits_handler.connection_manager.execute_many.await_args.args
+    assert len(rows) == 5
+
+
+@pytest.mark.asyncio
+async def test_monthly_usage_is_cached_between_refreshes(limits_handler):
+    limits_handler.config.limits = LimitSettings(monthly_limit=2)
+    limits_handler.connection_manager.fetchrow_query.return_value = {
+        "count": 1
+    }
+    user, route = make_user(), "/v3/documents"
+
+    await limits_handler.check_limits(user, route)
+    await limits_handler.log_request(user.id, route)
+    await limits_handler.log_request(user.id, route)
+
+    with pytest.raises(ValueError, match="Monthly"):
+        await limits_handler.check_limits(user, route)
+    assert limits_handler.connection_manager.fetchrow_query.await_count == 1
@@ -0,0 +1,102 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from core.base import (
+    AppConfig,
+    ChunkSearchResult,
+    EmbeddingConfig,
+    RerankSettings,
+)
+from core.providers.embeddings import (
+    LiteLLMEmbeddingProvider,
+    RerankBackend,
+    Reranker,
+)
+
+
+class FakeBackend(RerankBackend):
+    def __init__(self, fail: bool = False):
+        self.calls: list[tuple[str, list[str]]] = []
+        self.fail = fail
+
+    async def score(self, query, texts):
+        return self.score_sync(query, texts)
+
+    def score_sync(self, query, texts):
+        self.calls.append((query, list(texts)))
+        if self.fail:
+            raise RuntimeError("backend unavailable")
+        return [float(len(text)) for text in texts]
+
+
+def make_results(*texts: str) -> list[ChunkSearchResult]:
+    return [
+        ChunkSearchResult(
+            id=uuid4(),
+            document_id=uuid4(),
+            owner_id=None,
+            collection_ids=[],
+            score=0.0,
+            text=text,
+            metadata={},
+        )
+        for text in texts
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_for_same_query_share_one_call():
+    backend = FakeBackend()
+    reranker = Reranker(backend, RerankSettings(batch_window_ms=1))
+    first, second = make_results("a", "ccc"), make_results("bb", "ccc")
+
+    ranked_first, ranked_second = await asyncio.gather(
+        reranker.arerank("q", first, limit=10),
+        reranker.arerank("q", second, limit=10),
+    )
+
+    assert backend.calls == [("q", ["a", "ccc", "bb"])]
+    assert [r.text for r in ranked_first] == ["ccc", "a"]
+    assert [r.text for r in ranked_second] == ["ccc", "bb"]
+
+
+@pytest.mark.asyncio
+async def test_scores_are_cached_per_query_and_chunk():
+    backend = FakeBackend()
+    reranker = Reranker(backend, RerankSettings())
+    results = make_results("a", "bb")
+
+    await reranker.arerank("q", results, limit=10)
+    ranked = await reranker.arerank("q", results, limit=1)
+    await reranker.arerank("other", results, limit=10)
+
+    assert [r.text for r in ranked] == ["bb"]
+    assert [query for query, _ in backend.calls] == ["q", "other"]
+
+
+def test_backend_failure_falls_back_to_original_order():
+    reranker = Reranker(FakeBackend(fail=True), RerankSettings())
+    results = make_results("a", "bb", "ccc")
+
+    assert reranker.rerank("q", results, limit=2) == results[:2]
+
+
+@pytest.mark.asyncio
+async def test_provider_close_releases_the_http_session():
+    provider = LiteLLMEmbeddingProvider(
+        EmbeddingConfig(
+            app=AppConfig(project_name="test_rerank"),
+            provider="litellm",
+            base_model="openai/text-embedding-3-small",
+            base_dimension=512,
+            rerank_model="huggingface/BAAI/bge-reranker-base",
+            rerank_url="http://localhost:8080/rerank",
+        )
+    )
+    session = provider.reranker.backend._get_session()  # type: ignore
+
+    await provider.close()
+
+    assert session.closed
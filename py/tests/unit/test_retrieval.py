@@ -99,8 +99,6 @@ def retrieval_service(mock_providers):
 #     ), "Expected exactly 1 graph search call in basic mode"
 
 
-
-
 # @pytest.mark.asyncio
 # async def test_hyde_search_fans_out_correctly(retrieval_service):
 #     """
@@ -179,3 +177,98 @@ def retrieval_service(mock_providers):
 #     assert (
 #         graph_handler.graph_search.call_count == 3
 #     ), "Placeholder RAG-Fusion => 1 graph search"
+
+
+@pytest.mark.asyncio
+async def test_rag_fusion_batches_sub_query_embeddings(retrieval_service):
+    providers = retrieval_service.providers
+    providers.completion_embedding.async_get_embeddings = AsyncMock(
+        return_value=[[0.1] * 768, [0.2] * 768, [0.3] * 768]
+    )
+    s = SearchSettings(
+        search_strategy="rag_fusion",
+        use_semantic_search=True,
+        num_sub_queries=3,
+        sub_query_concurrency=2,
+        graph_settings={"enabled": False},
+    )
+
+    with patch.object(
+        retrieval_service,
+        "_generate_similar_queries",
+        AsyncMock(return_value=["b", "c"]),
+    ):
+        await retrieval_service.search("a", s)
+
+    providers.completion_embedding.async_get_embeddings.assert_awaited_once_with(
+        ["a", "b", "c"], purpose=EmbeddingPurpose.QUERY
+    )
+    providers.completion_embedding.async_get_embedding.assert_not_called()
+    semantic_search = providers.database.chunks_handler.semantic_search
+    assert [
+        call.kwargs["query_vector"][0]
+        for call in semantic_search.call_args_list
+    ] == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_graph_search_runs_all_legs(retrieval_service):
+    rows = {
+        "entities": [{"id": uuid4(), "name": "Aristotle"}],
+        "relationships": [{"id": uuid4(), "subject": "Aristotle"}],
+        "communities": [{"id": uuid4(), "name": "Philosophers"}],
+    }
+
+    def graph_search(query, search_type, **kwargs):
+        async def cursor():
+            for row in rows[search_type]:
+                yield {**row, "similarity_score": 0.5}
+
+        return cursor()
+
+    retrieval_service.providers.database.graphs_handler.graph_search = (
+        graph_search
+    )
+    results = await retrieval_service._graph_search_logic(
+        query_text="Aristotle",
+        search_settings=SearchSettings(graph_settings={"enabled": True}),
+        precomputed_vector=[0.1] * 768,
+    )
+
+    assert [r.result_type.value for r in results] == [
+        "entity",
+        "relationship",
+        "community",
+    ]
+    assert [r.id for r in results] == [
+        rows[t][0]["id"] for t in ("entities", "relationships", "communities")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_many_embeds_once_and_keeps_order(retrieval_service):
+    providers = retrieval_service.providers
+    providers.completion_embedding.async_get_embeddings = AsyncMock(
+        return_value=[[0.1] * 768, [0.3] * 768]
+    )
+    semantic = SearchSettings(
+        use_semantic_search=True, graph_settings={"enabled": False}
+    )
+    fulltext = SearchSettings(
+        use_semantic_search=False,
+        use_fulltext_search=True,
+        graph_settings={"enabled": False},
+    )
+
+    results = await retrieval_service.search_many(
+        ["a", "b", "c"], [semantic, fulltext, semantic]
+    )
+
+    assert len(results) == 3
+    providers.completion_embedding.async_get_embeddings.assert_awaited_once_with(
+        ["a", "c"], purpose=EmbeddingPurpose.QUERY
+    )
+    providers.completion_embedding.async_get_embedding.assert_not_called()
+    chunks_handler = providers.database.chunks_handler
+    assert chunks_handler.semantic_search.call_count == 2
+    assert chunks_handler.full_text_search.call_count == 1
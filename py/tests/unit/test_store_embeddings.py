@@ -0,0 +1,145 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import BulkLoadSettings, Vector, VectorEntry, VectorType
+from core.main.services.ingestion_service import (
+    IngestionService,
+    _ChunkQuota,
+)
+from shared.abstractions import User
+
+
+def make_entry(owner_id, document_id) -> VectorEntry:
+    return VectorEntry(
+        id=uuid.uuid4(),
+        document_id=document_id,
+        owner_id=owner_id,
+        collection_ids=[],
+        vector=Vector(data=[0.1, 0.2], type=VectorType.FIXED),
+        text="chunk",
+        metadata={},
+    )
+
+
+def make_service(usage, max_chunks=10, overrides=None) -> IngestionService:
+    providers = MagicMock()
+    database = providers.database
+    database.config.app.default_max_chunks_per_user = max_chunks
+    database.config.bulk_load_settings = BulkLoadSettings(min_batch_size=20)
+    database.chunks_handler.get_chunk_counts = AsyncMock(return_value=usage)
+    database.chunks_handler.upsert_entries = AsyncMock()
+    database.chunks_handler.bulk_upsert_entries = AsyncMock()
+    database.users_handler.get_user_by_id = AsyncMock(
+        side_effect=lambda user_id: User(
+            id=user_id,
+            email="quota@example.com",
+            limits_overrides=(overrides or {}).get(user_id),
+        )
+    )
+    return IngestionService(config=MagicMock(), providers=providers)
+
+
+async def collect(generator) -> list[str]:
+    return [message async for message in generator]
+
+
+@pytest.mark.asyncio
+async def test_quota_is_resolved_once_per_owner():
+    owner, other = uuid.uuid4(), uuid.uuid4()
+    document_id = uuid.uuid4()
+    service = make_service(
+        {owner: 8, other: 0}, overrides={other: {"max_chunks": 100}}
+    )
+    entries = [make_entry(owner, document_id) for _ in range(5)] + [
+        make_entry(other, document_id) for _ in range(5)
+    ]
+
+    messages = await collect(
+        service.store_embeddings(entries, storage_batch_size=2)
+    )
+
+    database = service.providers.database
+    database.chunks_handler.get_chunk_counts.assert_awaited_once()
+    assert database.users_handler.get_user_by_id.await_count == 2
+    # Two slots left for the first owner, everything for the second
+    stored = [
+        entry
+        for call in database.chunks_handler.upsert_entries.await_args_list
+        for entry in call.args[0]
+    ]
+    assert sum(entry.owner_id == owner for entry in stored) == 2
+    assert sum(entry.owner_id == other for entry in stored) == 5
+    assert messages == [
+        f"User {owner} has exceeded the maximum number of allowed chunks: 10",
+        f"Successful ingestion for document_id: {document_id}, with vector count: 7",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_owner_already_over_quota_is_reported_once():
+    owner, document_id = uuid.uuid4(), uuid.uuid4()
+    # The quota was lowered after the owner stored 12 chunks
+    service = make_service({owner: 12})
+    quota = _ChunkQuota()
+    messages = []
+    for _ in range(3):
+        messages += await collect(
+            service.store_embeddings(
+                [make_entry(owner, document_id) for _ in range(4)],
+                chunk_quota=quota,
+            )
+        )
+
+    database = service.providers.database
+    database.chunks_handler.upsert_entries.assert_not_awaited()
+    database.chunks_handler.get_chunk_counts.assert_awaited_once()
+    assert messages == [
+        f"User {owner} has exceeded the maximum number of allowed chunks: 10"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_stored_concurrently():
+    owner, document_id = uuid.uuid4(), uuid.uuid4()
+    service = make_service({owner: 0}, max_chunks=None)
+    in_flight = peak = 0
+
+    async def upsert_entries(batch):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if len(batch) == 1:
+            raise RuntimeError("boom")
+
+    service.providers.database.chunks_handler.upsert_entries = upsert_entries
+    entries = [make_entry(owner, document_id) for _ in range(13)]
+
+    messages = await collect(
+        service.store_embeddings(
+            entries, storage_batch_size=4, max_concurrent_batches=2
+        )
+    )
+
+    assert peak == 2
+    assert messages == [
+        "Error: boom",
+        f"Successful ingestion for document_id: {document_id}, with vector count: 12",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_large_loads_use_bulk_upsert():
+    owner, document_id = uuid.uuid4(), uuid.uuid4()
+    service = make_service({owner: 0}, max_chunks=100)
+    entries = [make_entry(owner, document_id) for _ in range(25)]
+
+    await collect(service.store_embeddings(entries, storage_batch_size=4))
+
+    chunks_handler = service.providers.database.chunks_handler
+    chunks_handler.upsert_entries.assert_not_awaited()
+    chunks_handler.bulk_upsert_entries.assert_awaited_once_with(entries)
@@ -0,0 +1,59 @@
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.base import iter_file_chunks
+from core.parsers.structured.csv_parser import CSVParser
+from core.parsers.structured.json_parser import JSONParser
+from core.parsers.text.html_parser import HTMLParser
+
+
+async def collect(generator) -> list[str]:
+    return [item async for item in generator]
+
+
+def stream(data: bytes, chunk_size: int = 7):
+    return iter_file_chunks(io.BytesIO(data), chunk_size)
+
+
+@pytest.mark.asyncio
+async def test_csv_stream_matches_whole_file():
+    parser = CSVParser(MagicMock(), MagicMock(), MagicMock())
+    data = 'name,notes\nada,"first line\nsecond, line"\nbob,"é ""quoted"""\n'
+
+    expected = await collect(parser.ingest(data))
+    for chunk_size in (1, 3, 7, 64):
+        streamed = await collect(
+            parser.ingest(stream(data.encode(), chunk_size))
+        )
+        assert streamed == expected
+
+
+@pytest.mark.asyncio
+async def test_json_lines_are_parsed_per_record():
+    parser = JSONParser(MagicMock(), MagicMock(), MagicMock())
+    records = [{"id": i, "text": f"record {i}"} for i in range(3)]
+    data = "\n".join(json.dumps(record) for record in records).encode()
+
+    streamed = "".join(await collect(parser.ingest(stream(data))))
+
+    for record in records:
+        assert record["text"] in streamed
+
+
+@pytest.mark.asyncio
+async def test_html_stream_matches_whole_file():
+    parser = HTMLParser(MagicMock(), MagicMock(), MagicMock())
+    data = (
+        "<html><head><style>p { color: red; }</style></head>"
+        "<body><p>Caf&eacute; &amp; bar</p><script>var x = 1;</script>"
+        "<div>résumé</div></body></html>"
+    )
+
+    expected = "".join(await collect(parser.ingest(data)))
+    streamed = "".join(await collect(parser.ingest(stream(data.encode()))))
+
+    assert streamed == expected
+    assert "color" not in streamed
@@ -0,0 +1,145 @@
+import random
+import re
+
+import pytest
+
+from shared.utils.splitter.text import (
+    RecursiveCharacterTextSplitter,
+    TokenBudgetTextSplitter,
+)
+
+
+class WordEncoding:
+    """Stands in for a tiktoken encoding, with one token per word and
+    its leading whitespace."""
+
+    def __init__(self):
+        self.words: list[str] = []
+
+    def encode(self, text, disallowed_special=()):
+        tokens = []
+        for word in re.findall(r"\s*\S+|\s+", text):
+            if word not in self.words:
+                self.words.append(word)
+            tokens.append(self.words.index(word))
+        return tokens
+
+    def decode(self, tokens):
+        return "".join(self.words[token] for token in tokens)
+
+    def decode_single_token_bytes(self, token):
+        return self.words[token].encode()
+
+
+class ByteEncoding:
+    """Stands in for a tiktoken encoding, with one token per UTF-8 byte,
+    so multi-byte characters span several tokens."""
+
+    def encode(self, text, disallowed_special=()):
+        return list(text.encode())
+
+    def decode(self, tokens):
+        return bytes(tokens).decode(errors="replace")
+
+    def decode_single_token_bytes(self, token):
+        return bytes([token])
+
+
+@pytest.mark.parametrize(
+    "chunk_size,chunk_overlap", [(1, 0), (2, 2), (10, 0), (10, 3), (64, 64)]
+)
+@pytest.mark.parametrize("strip_whitespace", [True, False])
+def test_character_merge_matches_split_merge(
+    chunk_size, chunk_overlap, strip_whitespace
+):
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        strip_whitespace=strip_whitespace,
+    )
+    rng = random.Random(chunk_size)
+    for length in (0, 1, chunk_size, chunk_size + 1, 500):
+        text = "".join(rng.choices("ab \t", k=length))
+        expected = (
+            list(text)
+            if chunk_size == 1
+            else splitter._merge_splits(list(text), "")
+        )
+        assert splitter._merge_characters(text) == expected
+
+
+def test_long_text_without_separators():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=40)
+    text = "".join(random.Random(0).choices("xyz", k=100_000))
+
+    chunks = splitter.split_text(text)
+
+    assert all(len(chunk) == 100 for chunk in chunks[:-1])
+    assert [chunk[:40] for chunk in chunks[1:]] == [
+        chunk[-40:] for chunk in chunks[:-1]
+    ]
+    assert "".join(chunk[40:] for chunk in chunks[1:]) == text[100:]
+
+
+def test_window_is_trimmed_to_the_overlap():
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=10, chunk_overlap=4, separators=[" "]
+    )
+    text = " ".join(["aa"] * 10)
+
+    assert splitter.split_text(text) == ["aa aa aa", "aa aa aa"] * 2 + [
+        "aa aa"
+    ]
+
+
+def test_token_chunks_fit_the_budget():
+    encoding = WordEncoding()
+    # A single separator leaves the long line as one oversized chunk
+    splitter = TokenBudgetTextSplitter(
+        encoding=encoding, chunk_size=4, chunk_overlap=1, separators=["\n"]
+    )
+    text = "a b\n" + " ".join(str(i) for i in range(10)) + "\nc"
+
+    chunks = splitter.split_text_with_token_counts(text)
+
+    assert chunks == [
+        ("a b", 2),
+        ("0 1 2 3", 4),
+        ("3 4 5 6", 4),
+        ("6 7 8 9", 4),
+        ("c", 1),
+    ]
+    assert all(len(encoding.encode(chunk)) == n for chunk, n in chunks)
+    assert splitter.split_text(text) == [chunk for chunk, _ in chunks]
+
+
+@pytest.mark.parametrize("chunk_size,chunk_overlap", [(4, 0), (7, 2), (9, 5)])
+def test_token_chunks_keep_multibyte_characters_whole(
+    chunk_size, chunk_overlap
+):
+    encoding = ByteEncoding()
+    splitter = TokenBudgetTextSplitter(
+        encoding=encoding,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=["\n"],
+    )
+    text = "日本語のテキスト😀👍🏽 and émoji ✓" * 3
+
+    chunks = splitter.split_text_with_token_counts(text)
+
+    assert chunks
+    assert all("\ufffd" not in chunk for chunk, _ in chunks)
+    assert all(0 < n <= chunk_size for _, n in chunks)
+    assert all(len(encoding.encode(chunk)) == n for chunk, n in chunks)
+
+
+def test_token_chunks_never_split_a_character():
+    # Each emoji takes four tokens, more than the budget
+    splitter = TokenBudgetTextSplitter(
+        encoding=ByteEncoding(), chunk_size=3, chunk_overlap=1
+    )
+
+    chunks = splitter.split_text_with_token_counts("😀😀")
+
+    assert chunks == [("😀", 4), ("😀", 4)]
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import TokenBlacklistCacheSettings
+from core.providers.database.tokens import BloomFilter, PostgresTokensHandler
+
+
+def make_handler(rows, **settings) -> PostgresTokensHandler:
+    connection_manager = MagicMock()
+    connection_manager.fetch_query = AsyncMock(return_value=rows)
+    connection_manager.fetchrow_query = AsyncMock(return_value=None)
+    connection_manager.execute_query = AsyncMock()
+    return PostgresTokensHandler(
+        project_name="test_token_blacklist",
+        connection_manager=connection_manager,
+        cache_settings=TokenBlacklistCacheSettings(**settings),
+    )
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    tokens = [f"token-{i}" for i in range(1000)]
+    for token in tokens:
+        bloom.add(token)
+
+    assert all(token in bloom for token in tokens)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_unknown_tokens_skip_the_database():
+    now = datetime.now(timezone.utc)
+    handler = make_handler([{"token": "revoked", "blacklisted_at": now}])
+
+    for _ in range(3):
+        assert not await handler.is_token_blacklisted("valid")
+
+    handler.connection_manager.fetch_query.assert_awaited_once()
+    handler.connection_manager.fetchrow_query.assert_not_awaited()
+
+    handler.connection_manager.fetchrow_query.return_value = {"?column?": 1}
+    assert await handler.is_token_blacklisted("revoked")
+    handler.connection_manager.fetchrow_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_new_entries_are_picked_up():
+    handler = make_handler([], refresh_interval_seconds=1e-9)
+    assert not await handler.is_token_blacklisted("logged-out")
+
+    # Blacklisted by this process
+    await handler.blacklist_token("logged-out")
+    assert await handler.is_token_blacklisted("logged-out")
+
+    # Blacklisted by another worker, seen on the next refresh
+    handler.connection_manager.fetch_query.return_value = [
+        {"token": "elsewhere", "blacklisted_at": datetime.now(timezone.utc)}
+    ]
+    assert await handler.is_token_blacklisted("elsewhere")
+    handler.connection_manager.fetchrow_query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_forces_rebuild():
+    handler = make_handler([])
+    await handler.is_token_blacklisted("token")
+    await handler.clean_expired_blacklisted_tokens()
+    await handler.is_token_blacklisted("token")
+
+    calls = handler.connection_manager.fetch_query.await_args_list
+    assert len(calls) == 2
+    assert "WHERE" not in calls[1].args[0]
+
+
+@pytest.mark.asyncio
+async def test_tokens_blacklisted_during_a_rebuild_are_kept():
+    handler = make_handler([])
+
+    async def fetch_query(query, params=None):
+        # Committed after the rebuild's snapshot of the table was taken
+        await handler.blacklist_token("logged-out")
+        return []
+
+    handler.connection_manager.fetch_query.side_effect = fetch_query
+    assert not await handler.is_token_blacklisted("valid")
+
+    handler.connection_manager.fetch_query.side_effect = None
+    assert await handler.is_token_blacklisted("logged-out")
+    handler.connection_manager.fetchrow_query.assert_not_awaited()
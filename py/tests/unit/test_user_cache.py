@@ -0,0 +1,100 @@
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import UserCacheSettings
+from core.providers.database.user_cache import UserCache, request_user_scope
+from core.providers.database.users import PostgresUserHandler
+from shared.abstractions import User
+
+
+def user_row(user_id, email="cache@example.com", is_superuser=False):
+    return {
+        "id": user_id,
+        "email": email,
+        "is_superuser": is_superuser,
+        "is_active": True,
+        "is_verified": True,
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+        "name": None,
+        "profile_picture": None,
+        "bio": None,
+        "collection_ids": [],
+        "limits_overrides": None,
+        "metadata": None,
+        "account_type": "password",
+        "hashed_password": None,
+        "google_id": None,
+        "github_id": None,
+    }
+
+
+def make_handler(**cache_settings) -> PostgresUserHandler:
+    connection_manager = MagicMock()
+    connection_manager.fetchrow_query = AsyncMock()
+    connection_manager.execute_query = AsyncMock()
+    return PostgresUserHandler(
+        project_name="test_user_cache",
+        connection_manager=connection_manager,
+        crypto_provider=MagicMock(),
+        user_cache=UserCache(UserCacheSettings(**cache_settings)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_user_is_loaded_once_per_request():
+    handler = make_handler()
+    user_id = uuid.uuid4()
+    handler.connection_manager.fetchrow_query.return_value = user_row(user_id)
+
+    with request_user_scope():
+        first = await handler.get_user_by_email("cache@example.com")
+        second = await handler.get_user_by_id(user_id)
+        first.name = "mutated"
+        third = await handler.get_user_by_id(user_id)
+
+    await handler.get_user_by_id(user_id)
+
+    assert second.id == third.id == user_id
+    assert third.name is None
+    # One lookup inside the request, one after it ended
+    assert handler.connection_manager.fetchrow_query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_user():
+    handler = make_handler(process_ttl_seconds=30)
+    user_id = uuid.uuid4()
+    handler.connection_manager.fetchrow_query.return_value = user_row(user_id)
+
+    with request_user_scope():
+        assert not (await handler.get_user_by_id(user_id)).is_superuser
+        await handler.mark_user_as_superuser(user_id)
+        handler.connection_manager.fetchrow_query.return_value = user_row(
+            user_id, is_superuser=True
+        )
+        assert (await handler.get_user_by_id(user_id)).is_superuser
+
+    # Served from the process tier across requests
+    with request_user_scope():
+        assert (await handler.get_user_by_id(user_id)).is_superuser
+    assert handler.connection_manager.fetchrow_query.await_count == 2
+
+
+def test_process_tier_expires_and_is_bounded(monkeypatch):
+    cache = UserCache(UserCacheSettings(process_ttl_seconds=5, max_entries=1))
+    users = [User(id=uuid.uuid4(), email=f"{i}@example.com") for i in range(2)]
+    for user in users:
+        cache.put(user)
+
+    assert cache.get(users[0].id) is None
+    assert cache.get_by_email("1@example.com").id == users[1].id
+
+    now = cache._entries[users[1].id][0]
+    monkeypatch.setattr(
+        "core.providers.database.user_cache.time.monotonic", lambda: now
+    )
+    assert cache.get(users[1].id) is None
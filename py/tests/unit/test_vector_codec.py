@@ -0,0 +1,138 @@
+import struct
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from core.base import StoreType, VectorQuantizationType
+from core.providers.database.graphs import PostgresEntitiesHandler
+from core.providers.database.vector_codec import (
+    decode_halfvec,
+    decode_vector,
+    encode_halfvec,
+    encode_vector,
+    register_vector_codec,
+    vector_to_list,
+)
+
+
+class FakeConnection:
+    """Records the codecs registered on a connection."""
+
+    def __init__(self, types):
+        self.types = types
+        self.codecs = {}
+
+    async def fetch(self, query, names):
+        return [
+            {"typname": name, "nspname": "public"}
+            for name in names
+            if name in self.types
+        ]
+
+    async def set_type_codec(self, typename, schema, encoder, decoder, format):
+        assert format == "binary"
+        self.codecs[typename] = (encoder, decoder)
+
+
+def test_encode_matches_pgvector_binary_layout():
+    encoded = encode_vector([1.0, -2.5, 0.25])
+    assert encoded[:4] == struct.pack(">HH", 3, 0)
+    assert struct.unpack(">3f", encoded[4:]) == (1.0, -2.5, 0.25)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [0.1, 0.2, 0.3, 0.4],
+        (0.1, 0.2, 0.3, 0.4),
+        np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float64),
+        "[0.1, 0.2, 0.3, 0.4]",
+    ],
+)
+def test_round_trip(value):
+    decoded = decode_vector(encode_vector(value))
+    assert decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded, [0.1, 0.2, 0.3, 0.4], rtol=1e-6)
+
+
+def test_encode_rejects_nested_input():
+    with pytest.raises(ValueError):
+        encode_vector([[0.1, 0.2], [0.3, 0.4]])
+
+
+def test_vector_to_list():
+    assert vector_to_list(np.array([1.0, 2.0], dtype=np.float32)) == [1.0, 2.0]
+    assert vector_to_list(None) is None
+
+
+def test_halfvec_matches_pgvector_binary_layout():
+    encoded = encode_halfvec([1.0, -2.5, 0.25])
+    assert encoded[:4] == struct.pack(">HH", 3, 0)
+    assert struct.unpack(">3e", encoded[4:]) == (1.0, -2.5, 0.25)
+
+    decoded = decode_halfvec(encode_halfvec("[0.1, 0.2]"))
+    assert decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded, [0.1, 0.2], rtol=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_codecs_are_registered_for_available_types():
+    conn = FakeConnection({"vector", "halfvec"})
+    await register_vector_codec(conn)
+    assert set(conn.codecs) == {"vector", "halfvec"}
+
+    # pgvector before 0.7 has no halfvec type
+    conn = FakeConnection({"vector"})
+    await register_vector_codec(conn)
+    assert set(conn.codecs) == {"vector"}
+
+    conn = FakeConnection(set())
+    await register_vector_codec(conn)
+    assert conn.codecs == {}
+
+
+@pytest.mark.asyncio
+async def test_graph_writes_with_fp16_quantization():
+    conn = FakeConnection({"vector", "halfvec"})
+    await register_vector_codec(conn)
+    encoder, decoder = conn.codecs["halfvec"]
+
+    connection_manager = MagicMock()
+    connection_manager.execute_query = AsyncMock()
+    connection_manager.fetchrow_query = AsyncMock(
+        return_value={
+            "id": uuid.uuid4(),
+            "name": "entity",
+            "category": None,
+            "description": "updated",
+            "parent_id": uuid.uuid4(),
+            "chunk_ids": [],
+            "metadata": {},
+        }
+    )
+    handler = PostgresEntitiesHandler(
+        project_name="test_vector_codec",
+        connection_manager=connection_manager,
+        dimension=4,
+        quantization_type=VectorQuantizationType.FP16,
+    )
+
+    await handler.create_tables()
+    assert (
+        "description_embedding halfvec(4)"
+        in (connection_manager.execute_query.await_args.args[0])
+    )
+
+    embedding = [0.5, -0.25, 0.125, 1.0]
+    await handler.update(
+        uuid.uuid4(),
+        StoreType.GRAPHS,
+        description="updated",
+        description_embedding=embedding,
+    )
+    params = connection_manager.fetchrow_query.await_args.kwargs["params"]
+    # The list goes to the driver as is and the halfvec codec encodes it
+    assert params[1] == embedding
+    np.testing.assert_array_equal(decoder(encoder(params[1])), embedding)
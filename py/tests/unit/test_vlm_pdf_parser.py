@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pymupdf
+import pytest
+
+from core.base import AppConfig, IngestionConfig, VLMParsingSettings
+from core.parsers.media.pdf_parser import VLMPDFParser
+
+PARAGRAPH = "\n".join(["The quick brown fox jumps over the lazy dog."] * 8)
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    doc = pymupdf.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def make_parser(**settings) -> VLMPDFParser:
+    database_provider = MagicMock()
+    database_provider.prompts_handler.get_cached_prompt = AsyncMock(
+        return_value="Transcribe this page"
+    )
+    config = IngestionConfig(
+        app=AppConfig(vlm="openai/gpt-4o"),
+        vlm_parsing_settings=VLMParsingSettings(**settings),
+    )
+    return VLMPDFParser(config, database_provider, MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_pages_are_yielded_in_order_with_bounded_requests():
+    parser = make_parser(max_concurrent_requests=3, max_buffered_pages=2)
+    started = asyncio.Condition()
+    waiting: set[int] = set()
+    released = {number: asyncio.Event() for number in range(1, 13)}
+    max_in_flight = 0
+
+    async def process_page(image_data, page_num):
+        nonlocal max_in_flight
+        async with started:
+            waiting.add(page_num)
+            max_in_flight = max(max_in_flight, len(waiting))
+            started.notify_all()
+        await released[page_num].wait()
+        waiting.discard(page_num)
+        return {"page": str(page_num), "content": f"page {page_num}"}
+
+    async def wait_for(*numbers):
+        async with started:
+            await started.wait_for(lambda: waiting == set(numbers))
+
+    parser.process_page = process_page
+    yielded = []
+
+    async def consume():
+        async for page in parser.ingest(make_pdf(["x"] * 12)):
+            yielded.append(page)
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.wait_for(wait_for(1, 2, 3), timeout=30)
+    # Later pages finish first and free their slot for the next page
+    released[3].set()
+    await asyncio.wait_for(wait_for(1, 2, 4), timeout=30)
+    released[2].set()
+    await asyncio.wait_for(wait_for(1, 4, 5), timeout=30)
+    assert yielded == []
+
+    for event in released.values():
+        event.set()
+    await asyncio.wait_for(consumer, timeout=30)
+
+    assert yielded == [
+        {"content": f"page {number}", "page_number": number}
+        for number in range(1, 13)
+    ]
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_pages_with_a_good_text_layer_skip_the_model():
+    parser = make_parser(skip_pages_with_text=True)
+    sent = []
+
+    async def process_page(image_data, page_num):
+        sent.append(page_num)
+        return {"page": str(page_num), "content": "from the model"}
+
+    parser.process_page = process_page
+
+    pages = [
+        page
+        async for page in parser.ingest(
+            make_pdf([PARAGRAPH, "too short", PARAGRAPH])
+        )
+    ]
+
+    assert sent == [2]
+    assert [page["page_number"] for page in pages] == [1, 2, 3]
+    assert pages[0]["content"].startswith("The quick brown fox")
+    assert pages[1]["content"] == "from the model"
+
+
+def test_settings_loaded_from_a_config_file_are_validated(monkeypatch):
+    monkeypatch.setitem(
+        IngestionConfig._defaults,
+        "vlm_parsing_settings",
+        {"max_concurrent_requests": 2},
+    )
+
+    settings = IngestionConfig(app=AppConfig()).vlm_parsing_settings
+
+    assert isinstance(settings, VLMParsingSettings)
+    assert settings.max_concurrent_requests == 2